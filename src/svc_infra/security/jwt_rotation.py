@@ -34,6 +34,15 @@ class RotatingJWTStrategy(JWTStrategy):
         super().__init__(secret=secret, lifetime_seconds=lifetime_seconds, token_audience=aud_list)
         self._verify_secrets: list[str] = [secret, *list(old_secrets or [])]
         self._lifetime_seconds = lifetime_seconds
+        # Verifiers for the rotated secrets, built once rather than on every read
+        self._fallback_strategies: list[JWTStrategy[Any, Any]] = [
+            JWTStrategy(
+                secret=old_secret,
+                lifetime_seconds=lifetime_seconds,
+                token_audience=self.token_audience,
+            )
+            for old_secret in self._verify_secrets[1:]
+        ]
 
     async def read_token(
         self,
@@ -65,12 +74,7 @@ class RotatingJWTStrategy(JWTStrategy):
             except jwt.PyJWTError:
                 pass
 
-            for secret in self._verify_secrets[1:]:
-                candidate: JWTStrategy[Any, Any] = JWTStrategy(
-                    secret=secret,
-                    lifetime_seconds=self._lifetime_seconds,
-                    token_audience=self.token_audience,
-                )
+            for candidate in self._fallback_strategies:
                 try:
                     return decode_jwt(
                         token,
@@ -86,12 +90,7 @@ class RotatingJWTStrategy(JWTStrategy):
         if user is not None:
             return user
 
-        for secret in self._verify_secrets[1:]:
-            candidate = JWTStrategy(
-                secret=secret,
-                lifetime_seconds=self._lifetime_seconds,
-                token_audience=self.token_audience,
-            )
+        for candidate in self._fallback_strategies:
             user = await candidate.read_token(token, user_manager)
             if user is not None:
                 return user
@@ -41,8 +41,10 @@ def compute_lockout(
     now = now or datetime.now(UTC)
     if fail_count < cfg.threshold:
         return LockoutStatus(False, None, fail_count)
-    # cooldown factor exponent = fail_count - threshold
-    exponent = fail_count - cfg.threshold
+    # cooldown factor exponent = fail_count - threshold. Beyond the bit length of the cap,
+    # base * 2**exponent already exceeds it, so clamp the exponent rather than let a
+    # burst of failures grow an ever larger integer on every attempt.
+    exponent = min(fail_count - cfg.threshold, cfg.max_cooldown_seconds.bit_length())
     cooldown = cfg.base_cooldown_seconds * (2**exponent)
     if cooldown > cfg.max_cooldown_seconds:
         cooldown = cfg.max_cooldown_seconds
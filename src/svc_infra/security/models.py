@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import uuid
 from datetime import UTC, datetime, timedelta
 
@@ -218,7 +219,7 @@ class OrganizationInvitation(ModelBase):
 
 def generate_refresh_token() -> str:
     """Generate a random refresh token (opaque)."""
-    return uuid.uuid4().hex + uuid.uuid4().hex  # 64 hex chars
+    return os.urandom(32).hex()  # 64 hex chars, 256 random bits
 
 
 def hash_refresh_token(raw: str) -> str:
@@ -246,7 +247,10 @@ def compute_audit_hash(
         "metadata": metadata,
     }
     canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256((prev + canonical).encode()).hexdigest()
+    # Feed both parts to one hasher rather than building the concatenated string
+    h = hashlib.sha256(prev.encode())
+    h.update(canonical.encode())
+    return h.hexdigest()
 
 
 def rotate_refresh_token(
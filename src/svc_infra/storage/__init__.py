@@ -58,8 +58,10 @@ See Also:
     - docs/storage.md: Comprehensive storage guide
 """
 
+from typing import TYPE_CHECKING
+
 from .add import add_storage, get_storage, health_check_storage
-from .backends import LocalBackend, MemoryBackend, S3Backend
+from .backends import LocalBackend, MemoryBackend
 from .base import (
     FileNotFoundError,
     InvalidKeyError,
@@ -71,6 +73,9 @@ from .base import (
 from .easy import easy_storage
 from .settings import StorageSettings
 
+if TYPE_CHECKING:
+    from .backends import S3Backend
+
 __all__ = [
     # Main API
     "add_storage",
@@ -91,3 +96,12 @@ __all__ = [
     "QuotaExceededError",
     "InvalidKeyError",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import so aioboto3/botocore only load when S3Backend is used."""
+    if name == "S3Backend":
+        from .backends.s3 import S3Backend
+
+        return S3Backend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
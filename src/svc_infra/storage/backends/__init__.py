@@ -1,11 +1,24 @@
 """Storage backend implementations."""
 
+from typing import TYPE_CHECKING
+
 from .local import LocalBackend
 from .memory import MemoryBackend
-from .s3 import S3Backend
+
+if TYPE_CHECKING:
+    from .s3 import S3Backend
 
 __all__ = [
     "LocalBackend",
     "MemoryBackend",
     "S3Backend",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import so aioboto3/botocore only load when S3Backend is used."""
+    if name == "S3Backend":
+        from .s3 import S3Backend
+
+        return S3Backend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,6 +19,9 @@ import aiofiles.os
 from ..base import FileNotFoundError as StorageFileNotFoundError
 from ..base import InvalidKeyError, PermissionDeniedError, StorageError
 
+# Payloads below this size skip the temp-file rename when atomic writes are disabled
+_DIRECT_WRITE_MAX_BYTES = 64 * 1024
+
 
 class LocalBackend:
     """
@@ -31,6 +34,9 @@ class LocalBackend:
         base_path: Base directory for file storage
         base_url: Base URL for file serving (e.g., "http://localhost:8000/files")
         signing_secret: Secret key for URL signing (auto-generated if not provided)
+        atomic: Write every file via temp file + rename. When False, payloads under
+            64 KiB are written in place, saving a rename per put at the cost of
+            readers possibly seeing a partially written file.
 
     Example:
         >>> # Railway persistent volume
@@ -51,10 +57,14 @@ class LocalBackend:
         base_path: str = "/data/uploads",
         base_url: str = "http://localhost:8000/files",
         signing_secret: str | None = None,
+        atomic: bool = True,
     ):
         self.base_path = Path(base_path)
+        self.atomic = atomic
         self.base_url = base_url.rstrip("/")
         self.signing_secret = signing_secret or secrets.token_urlsafe(32)
+        # Keyed once; _sign_url copies it so each signature only hashes the message
+        self._signer = hmac.new(self.signing_secret.encode(), digestmod=hashlib.sha256)
 
     def _validate_key(self, key: str) -> None:
         """Validate storage key format."""
@@ -88,12 +98,9 @@ class LocalBackend:
     def _sign_url(self, key: str, expires_at: int, download: bool) -> str:
         """Generate HMAC signature for URL."""
         message = f"{key}:{expires_at}:{download}"
-        signature = hmac.new(
-            self.signing_secret.encode(),
-            message.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature
+        signer = self._signer.copy()
+        signer.update(message.encode())
+        return signer.hexdigest()
 
     def _verify_signature(self, key: str, expires_at: int, download: bool, signature: str) -> bool:
         """Verify HMAC signature."""
@@ -117,13 +124,17 @@ class LocalBackend:
             # Create parent directories
             await aiofiles.os.makedirs(file_path.parent, exist_ok=True)
 
-            # Write file atomically using temp file
-            temp_path = file_path.with_suffix(f"{file_path.suffix}.tmp")
-            async with aiofiles.open(temp_path, "wb") as f:
-                await f.write(data)
+            if not self.atomic and len(data) < _DIRECT_WRITE_MAX_BYTES:
+                async with aiofiles.open(file_path, "wb") as f:
+                    await f.write(data)
+            else:
+                # Write file atomically using temp file
+                temp_path = file_path.with_suffix(f"{file_path.suffix}.tmp")
+                async with aiofiles.open(temp_path, "wb") as f:
+                    await f.write(data)
 
-            # Rename to final path (atomic on POSIX)
-            await aiofiles.os.rename(temp_path, file_path)
+                # Rename to final path (atomic on POSIX)
+                await aiofiles.os.rename(temp_path, file_path)
 
             # Write metadata
             meta_data = {
@@ -213,6 +224,34 @@ class LocalBackend:
             >>> url = await backend.get_url("avatars/user_123/profile.jpg")
             >>> # https://api.example.com/files/avatars/user_123/profile.jpg?expires=...&signature=...
         """
+        url, _ = await self.get_url_parts(key, expires_in=expires_in, download=download)
+        return url
+
+    async def get_url_parts(
+        self,
+        key: str,
+        expires_in: int = 3600,
+        download: bool = False,
+    ) -> tuple[str, dict[str, str]]:
+        """
+        Generate a signed URL together with its query parameters.
+
+        Same as get_url, but also returns the ``expires``/``signature`` (and
+        ``download``) values so callers don't have to parse them back out of the URL.
+
+        Args:
+            key: Storage key
+            expires_in: URL expiration in seconds (default: 1 hour)
+            download: If True, force download instead of inline display
+
+        Returns:
+            Tuple of (signed URL, query parameters)
+
+        Example:
+            >>> url, params = await backend.get_url_parts("avatars/user_123/profile.jpg")
+            >>> params["expires"], params["signature"]
+            >>> # ('1735693200', '3f9a...')
+        """
         self._validate_key(key)
 
         # Check if file exists
@@ -234,7 +273,7 @@ class LocalBackend:
             params["download"] = "true"
 
         url = f"{self.base_url}/{key}?{urlencode(params)}"
-        return url
+        return url, params
 
     def verify_url(self, key: str, expires: str, signature: str, download: bool = False) -> bool:
         """
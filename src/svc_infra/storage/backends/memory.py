@@ -105,6 +105,53 @@ class MemoryBackend:
         # Return memory:// URL
         return f"memory://{key}"
 
+    async def put_many(self, items: list[tuple[str, bytes, str]]) -> list[str]:
+        """
+        Store several files under one lock and one quota check (testing utility).
+
+        All keys are validated first and the quota is checked for the batch as a
+        whole, so either every file is stored or none is. A key repeated in the
+        batch keeps its last value.
+
+        Args:
+            items: (key, data, content_type) tuples
+
+        Returns:
+            memory:// URLs in the same order as items
+
+        Example:
+            >>> await backend.put_many([
+            ...     ("a.txt", b"a", "text/plain"),
+            ...     ("b.txt", b"b", "text/plain"),
+            ... ])
+        """
+        for key, _, _ in items:
+            self._validate_key(key)
+
+        batch = {key: (data, content_type) for key, data, content_type in items}
+
+        async with self._lock:
+            # Check quota once for the whole batch
+            current_size = self._get_total_size() - sum(
+                len(self._storage[key]) for key in batch if key in self._storage
+            )
+            new_size = sum(len(data) for data, _ in batch.values())
+
+            if current_size + new_size > self.max_size:
+                raise QuotaExceededError(
+                    f"Storage quota exceeded. "
+                    f"Current: {current_size}, New: {new_size}, Max: {self.max_size}"
+                )
+
+            created_at = datetime.now(UTC).isoformat()
+            self._storage.update((key, data) for key, (data, _) in batch.items())
+            self._metadata.update(
+                (key, {"size": len(data), "content_type": content_type, "created_at": created_at})
+                for key, (data, content_type) in batch.items()
+            )
+
+        return [f"memory://{key}" for key, _, _ in items]
+
     async def get(self, key: str) -> bytes:
         """Retrieve file from memory."""
         self._validate_key(key)
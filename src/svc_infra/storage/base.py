@@ -4,37 +4,38 @@ Base storage abstractions and exceptions.
 Defines the StorageBackend protocol that all storage implementations must follow.
 """
 
-from typing import Protocol
+from typing import ClassVar, Protocol
 
 
 class StorageError(Exception):
     """Base exception for all storage operations."""
 
-    pass
+    # Stable machine-readable identifier, independent of the message text
+    code: ClassVar[str] = "storage_error"
 
 
 class FileNotFoundError(StorageError):
     """Raised when a requested file does not exist."""
 
-    pass
+    code: ClassVar[str] = "not_found"
 
 
 class PermissionDeniedError(StorageError):
     """Raised when lacking permissions for an operation."""
 
-    pass
+    code: ClassVar[str] = "permission_denied"
 
 
 class QuotaExceededError(StorageError):
     """Raised when storage quota is exceeded."""
 
-    pass
+    code: ClassVar[str] = "quota_exceeded"
 
 
 class InvalidKeyError(StorageError):
     """Raised when a key format is invalid."""
 
-    pass
+    code: ClassVar[str] = "invalid_key"
 
 
 class StorageBackend(Protocol):
@@ -6,14 +6,30 @@ Simplifies storage backend initialization with sensible defaults.
 
 import logging
 import os
+from functools import lru_cache
 
-from .backends import LocalBackend, MemoryBackend, S3Backend
+from .backends import LocalBackend, MemoryBackend
 from .base import StorageBackend
 from .settings import StorageSettings
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _settings_for_env(env_fingerprint: tuple[tuple[str, str], ...]) -> StorageSettings:
+    """Build StorageSettings once per distinct set of STORAGE_* environment variables."""
+    return StorageSettings()
+
+
+def _load_settings() -> StorageSettings:
+    # Only STORAGE_* variables feed StorageSettings fields; the AWS_*/RAILWAY_* fallbacks
+    # are read from os.environ at call time, so they stay out of the cache key.
+    fingerprint = tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("STORAGE_"))
+    )
+    return _settings_for_env(fingerprint)
+
+
 def easy_storage(
     backend: str | None = None,
     **kwargs,
@@ -77,8 +93,8 @@ def easy_storage(
         For production deployments, it's recommended to set STORAGE_BACKEND
         explicitly to avoid unexpected auto-detection behavior.
     """
-    # Load settings
-    settings = StorageSettings()
+    # Load settings (reused while the STORAGE_* environment is unchanged)
+    settings = _load_settings()
 
     # Determine backend type
     backend_type = backend or settings.detect_backend()
@@ -151,6 +167,9 @@ def easy_storage(
         else:
             logger.info("Using AWS S3")
 
+        # Deferred so aioboto3/botocore only load when S3 is actually selected
+        from .backends.s3 import S3Backend
+
         return S3Backend(
             bucket=bucket,
             region=region,
@@ -15,6 +15,8 @@ Fixtures are organized by category:
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock
 
@@ -73,6 +75,30 @@ def pytest_configure(config):
         config.addinivalue_line("markers", f"{name}: {desc}")
 
 
+# =============================================================================
+# EVENT LOOP
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is available.
+
+    Route tests await a full ASGI round-trip per request, so the cheaper loop
+    dispatch adds up across the suite. uvloop has no Windows build and is a dev
+    dependency, so fall back to the default policy without it.
+    """
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+
+    return uvloop.EventLoopPolicy()
+
+
 # =============================================================================
 # MOCK DATABASE SESSION
 # =============================================================================
@@ -327,7 +327,6 @@ class TestAsyncJobQueue:
         queue = AsyncInMemoryQueue()
         return queue
 
-    @pytest.mark.asyncio
     async def test_async_enqueue(self, async_queue):
         """Test async job enqueue."""
         job_id = await async_queue.enqueue(
@@ -337,7 +336,6 @@ class TestAsyncJobQueue:
 
         assert job_id is not None
 
-    @pytest.mark.asyncio
     async def test_async_dequeue(self, async_queue):
         """Test async job dequeue."""
         await async_queue.enqueue(task="task", args={})
@@ -347,7 +345,6 @@ class TestAsyncJobQueue:
         assert job is not None
         assert job.task == "task"
 
-    @pytest.mark.asyncio
     async def test_async_worker(self, async_queue):
         """Test async worker processing jobs."""
         results = []
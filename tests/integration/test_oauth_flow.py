@@ -89,7 +89,6 @@ class TestOAuthTokenExchange:
             "scope": "openid email profile",
         }
 
-    @pytest.mark.asyncio
     async def test_token_exchange(self, mock_token_response):
         """Test exchanging authorization code for tokens."""
         from svc_infra.auth.oauth import OAuthConfig
@@ -117,7 +116,6 @@ class TestOAuthTokenExchange:
             assert tokens["refresh_token"] == "mock_refresh_token_67890"
             assert tokens["token_type"] == "Bearer"
 
-    @pytest.mark.asyncio
     async def test_token_exchange_error(self):
         """Test handling token exchange errors."""
         from svc_infra.auth.oauth import OAuthConfig, OAuthError
@@ -152,7 +150,6 @@ class TestOAuthTokenExchange:
 class TestOAuthTokenRefresh:
     """Integration tests for OAuth token refresh."""
 
-    @pytest.mark.asyncio
     async def test_refresh_token(self):
         """Test refreshing access token."""
         from svc_infra.auth.oauth import OAuthConfig
@@ -183,7 +180,6 @@ class TestOAuthTokenRefresh:
             assert tokens["access_token"] == "new_access_token"
             assert tokens["refresh_token"] == "new_refresh_token"
 
-    @pytest.mark.asyncio
     async def test_refresh_token_expired(self):
         """Test handling expired refresh token."""
         from svc_infra.auth.oauth import OAuthConfig, OAuthError
@@ -226,7 +222,6 @@ class TestOAuthUserCreation:
             "picture": "https://example.com/avatar.jpg",
         }
 
-    @pytest.mark.asyncio
     async def test_fetch_userinfo(self, mock_userinfo):
         """Test fetching user info from OAuth provider."""
         from svc_infra.auth.oauth import OAuthConfig
@@ -254,7 +249,6 @@ class TestOAuthUserCreation:
             assert userinfo["sub"] == "oauth_user_id_123"
             assert userinfo["email_verified"] is True
 
-    @pytest.mark.asyncio
     async def test_create_or_update_user_from_oauth(self, mock_userinfo):
         """Test creating/updating user from OAuth data."""
         from svc_infra.auth.oauth import OAuthUserManager
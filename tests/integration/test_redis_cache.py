@@ -237,7 +237,6 @@ class TestAsyncCache:
         cache = AsyncInMemoryCache()
         return cache
 
-    @pytest.mark.asyncio
     async def test_async_set_and_get(self, async_cache):
         """Test async setting and getting a value."""
         await async_cache.set("key1", "value1")
@@ -245,7 +244,6 @@ class TestAsyncCache:
 
         assert result == "value1"
 
-    @pytest.mark.asyncio
     async def test_async_concurrent_access(self, async_cache):
         """Test concurrent async access."""
 
@@ -12,18 +12,14 @@ Run with: pytest tests/integration/test_storage_s3.py -v
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import uuid
 
 import pytest
 
-# Check if aioboto3 is available
-try:
-    import aioboto3  # noqa: F401
-
-    HAS_AIOBOTO3 = True
-except ImportError:
-    HAS_AIOBOTO3 = False
+# Check if aioboto3 is available without importing it at collection time
+HAS_AIOBOTO3 = importlib.util.find_spec("aioboto3") is not None
 
 # Skip markers
 SKIP_NO_S3_CREDS = pytest.mark.skipif(
@@ -59,7 +55,6 @@ class TestLocalStorageBackend:
             base_url="http://localhost:8000/files",
         )
 
-    @pytest.mark.asyncio
     async def test_put_and_get_file(self, local_storage):
         """Test uploading and retrieving a file."""
         content = b"Hello, World!"
@@ -80,7 +75,6 @@ class TestLocalStorageBackend:
         retrieved = await local_storage.get(key)
         assert retrieved == content
 
-    @pytest.mark.asyncio
     async def test_delete_file(self, local_storage):
         """Test deleting a file."""
         content = b"Delete me"
@@ -98,7 +92,6 @@ class TestLocalStorageBackend:
         with pytest.raises(FileNotFoundError):
             await local_storage.get(key)
 
-    @pytest.mark.asyncio
     async def test_exists(self, local_storage):
         """Test checking if file exists."""
         key = "test/exists.txt"
@@ -112,7 +105,6 @@ class TestLocalStorageBackend:
         # Should exist now
         assert await local_storage.exists(key)
 
-    @pytest.mark.asyncio
     async def test_list_files(self, local_storage):
         """Test listing files with prefix."""
         # Upload multiple files
@@ -129,7 +121,6 @@ class TestLocalStorageBackend:
         assert len(files) == 3
         assert all("list_test/file_" in f for f in files)
 
-    @pytest.mark.asyncio
     async def test_invalid_key_rejected(self, local_storage):
         """Test that path traversal attempts are rejected."""
         from svc_infra.storage.base import InvalidKeyError
@@ -158,7 +149,6 @@ class TestMemoryStorageBackend:
 
         return MemoryBackend(base_url="http://localhost:8000/files")
 
-    @pytest.mark.asyncio
     async def test_put_and_get_file(self, memory_storage):
         """Test uploading and retrieving a file."""
         content = b"Memory test content"
@@ -175,7 +165,6 @@ class TestMemoryStorageBackend:
         retrieved = await memory_storage.get(key)
         assert retrieved == content
 
-    @pytest.mark.asyncio
     async def test_metadata_preserved(self, memory_storage):
         """Test that metadata is preserved."""
         content = b"With metadata"
@@ -227,7 +216,6 @@ class TestS3StorageBackend:
         """Generate unique prefix for test files to avoid conflicts."""
         return f"integration-tests/{uuid.uuid4().hex[:8]}"
 
-    @pytest.mark.asyncio
     async def test_put_and_get_file(self, s3_storage, test_key_prefix):
         """Test uploading and retrieving a file from S3."""
         content = b"S3 test content"
@@ -255,7 +243,6 @@ class TestS3StorageBackend:
             except Exception:
                 pass
 
-    @pytest.mark.asyncio
     async def test_large_file_upload(self, s3_storage, test_key_prefix):
         """Test uploading a larger file (1MB)."""
         content = b"x" * (1024 * 1024)  # 1MB
@@ -280,7 +267,6 @@ class TestS3StorageBackend:
             except Exception:
                 pass
 
-    @pytest.mark.asyncio
     async def test_presigned_url(self, s3_storage, test_key_prefix):
         """Test generating presigned URLs for download."""
         content = b"Presigned content"
@@ -390,7 +376,6 @@ class TestAddStorageHelper:
         assert hasattr(app.state, "storage")
         assert app.state.storage is storage
 
-    @pytest.mark.asyncio
     async def test_storage_dependency_injection(self, tmp_path):
         """Test storage dependency injection in routes."""
         from fastapi import Depends, FastAPI
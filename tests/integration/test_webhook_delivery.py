@@ -189,7 +189,6 @@ class TestWebhookDelivery:
         session = Session(engine)
         return WebhookService(session=session, tenant_id="tenant_123")
 
-    @pytest.mark.asyncio
     async def test_deliver_webhook(self, webhook_service):
         """Test delivering a webhook."""
         # Create endpoint
@@ -209,7 +208,6 @@ class TestWebhookDelivery:
             assert result.success is True
             mock_post.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delivery_includes_signature(self, webhook_service):
         """Test that delivery includes signature headers."""
         webhook_service.create_endpoint(
@@ -251,7 +249,6 @@ class TestWebhookRetry:
         session = Session(engine)
         return WebhookService(session=session, tenant_id="tenant_123")
 
-    @pytest.mark.asyncio
     async def test_retry_on_failure(self, webhook_service):
         """Test that failed deliveries are retried."""
         webhook_service.create_endpoint(
@@ -279,7 +276,6 @@ class TestWebhookRetry:
             assert result.success is True
             assert call_count == 3
 
-    @pytest.mark.asyncio
     async def test_max_retries_exceeded(self, webhook_service):
         """Test behavior when max retries are exceeded."""
         webhook_service.create_endpoint(
@@ -322,7 +318,6 @@ class TestWebhookDeadLetter:
         session = Session(engine)
         return WebhookService(session=session, tenant_id="tenant_123")
 
-    @pytest.mark.asyncio
     async def test_failed_delivery_stored(self, webhook_service):
         """Test that failed deliveries are stored for later inspection."""
         webhook_service.create_endpoint(
@@ -346,7 +341,6 @@ class TestWebhookDeadLetter:
         assert len(dead_letters) >= 1
         assert dead_letters[0].event == "order.created"
 
-    @pytest.mark.asyncio
     async def test_replay_dead_letter(self, webhook_service):
         """Test replaying a dead letter."""
         endpoint = webhook_service.create_endpoint(
@@ -5,7 +5,6 @@ from __future__ import annotations
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
-import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
@@ -90,7 +89,6 @@ def _build_refresh_app(policy: SimpleNamespace, mocker):
     return app, session, user
 
 
-@pytest.mark.asyncio
 async def test_refresh_triggers_policy_hook(mocker):
     policy = SimpleNamespace(on_token_refresh=AsyncMock())
     app, session, user = _build_refresh_app(policy, mocker)
@@ -107,7 +105,6 @@ async def test_refresh_triggers_policy_hook(mocker):
     session.execute.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_refresh_policy_hook_errors_are_suppressed(mocker):
     policy = SimpleNamespace(on_token_refresh=AsyncMock(side_effect=RuntimeError("boom")))
     app, _session, user = _build_refresh_app(policy, mocker)
@@ -11,7 +11,6 @@ from svc_infra.api.fastapi.db.sql.session import (
 pytest.importorskip("aiosqlite")
 
 
-@pytest.mark.asyncio
 async def test_db_statement_timeout_env_smoke_on_sqlite(monkeypatch):
     # Set a small statement timeout; on SQLite this should be ignored without error.
     monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "5")
@@ -19,7 +19,6 @@ from svc_infra.api.fastapi.middleware.optimistic_lock import (
 class TestCatchAllExceptionMiddleware:
     """Test CatchAllExceptionMiddleware functionality."""
 
-    @pytest.mark.asyncio
     async def test_middleware_handles_exception(self):
         """Test middleware handles exceptions properly."""
         app = FastAPI()
@@ -38,7 +37,6 @@ class TestCatchAllExceptionMiddleware:
             assert response.status_code == 500
             assert "Internal Server Error" in response.text
 
-    @pytest.mark.asyncio
     async def test_middleware_passes_through_normal_requests(self):
         """Test middleware passes through normal requests."""
         app = FastAPI()
@@ -57,7 +55,6 @@ class TestCatchAllExceptionMiddleware:
             assert response.status_code == 200
             assert response.json() == {"message": "success"}
 
-    @pytest.mark.asyncio
     async def test_middleware_handles_different_exception_types(self):
         """Test middleware handles different exception types."""
         app = FastAPI()
@@ -81,7 +78,6 @@ class TestCatchAllExceptionMiddleware:
 class TestIdempotencyMiddleware:
     """Test IdempotencyMiddleware functionality."""
 
-    @pytest.mark.asyncio
     async def test_middleware_handles_idempotency_key(self):
         """Test middleware handles idempotency key."""
         app = FastAPI()
@@ -104,7 +100,6 @@ class TestIdempotencyMiddleware:
             assert response.status_code == 200
             assert response.json() == {"message": "success"}
 
-    @pytest.mark.asyncio
     async def test_middleware_ignores_get_requests(self):
         """Test middleware ignores GET requests."""
         app = FastAPI()
@@ -123,7 +118,6 @@ class TestIdempotencyMiddleware:
             assert response.status_code == 200
             assert response.json() == {"message": "success"}
 
-    @pytest.mark.asyncio
     async def test_middleware_handles_duplicate_requests(self):
         """Test middleware handles duplicate requests."""
         app = FastAPI()
@@ -155,7 +149,6 @@ class TestIdempotencyMiddleware:
             assert response2.status_code == 200
             assert response1.json() == response2.json()
 
-    @pytest.mark.asyncio
     async def test_middleware_conflict_on_mismatched_payload(self):
         """Re-using same Idempotency-Key with different body should 409."""
         app = FastAPI()
@@ -186,7 +179,6 @@ class TestIdempotencyMiddleware:
 
 @pytest.mark.concurrency
 class TestOptimisticLocking:
-    @pytest.mark.asyncio
     async def test_missing_if_match(self):
         app = FastAPI()
 
@@ -199,7 +191,6 @@ class TestOptimisticLocking:
             res = await client.patch("/resource", json={})
             assert res.status_code == 428
 
-    @pytest.mark.asyncio
     async def test_bad_if_match_format(self):
         # current version is int=3
         def _cur():
@@ -209,7 +200,6 @@ class TestOptimisticLocking:
             check_version_or_409(_cur, "abc")
         assert ctx.value.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_version_mismatch_conflict(self):
         def _cur():
             return 5
@@ -218,7 +208,6 @@ class TestOptimisticLocking:
             check_version_or_409(_cur, "4")
         assert ctx.value.status_code == 409
 
-    @pytest.mark.asyncio
     async def test_version_match_success(self):
         def _cur():
             return 7
@@ -226,7 +215,6 @@ class TestOptimisticLocking:
         # should not raise
         check_version_or_409(_cur, "7")
 
-    @pytest.mark.asyncio
     async def test_middleware_without_idempotency_key(self):
         """Test middleware without idempotency key."""
         app = FastAPI()
@@ -249,7 +237,6 @@ class TestOptimisticLocking:
 class TestCORSMiddleware:
     """Test CORS middleware functionality."""
 
-    @pytest.mark.asyncio
     async def test_cors_preflight_request(self):
         """Test CORS preflight request handling."""
         from fastapi.middleware.cors import CORSMiddleware
@@ -282,7 +269,6 @@ class TestCORSMiddleware:
             assert response.status_code == 200
             assert "access-control-allow-origin" in response.headers
 
-    @pytest.mark.asyncio
     async def test_cors_actual_request(self):
         """Test CORS actual request handling."""
         from fastapi.middleware.cors import CORSMiddleware
@@ -309,7 +295,6 @@ class TestCORSMiddleware:
             assert "access-control-allow-origin" in response.headers
             assert response.json() == {"message": "success"}
 
-    @pytest.mark.asyncio
     async def test_cors_unauthorized_origin(self):
         """Test CORS with unauthorized origin."""
         from fastapi.middleware.cors import CORSMiddleware
@@ -339,7 +324,6 @@ class TestCORSMiddleware:
 class TestSecurityMiddleware:
     """Test security middleware functionality."""
 
-    @pytest.mark.asyncio
     async def test_trusted_host_middleware_allowed_host(self):
         """Test trusted host middleware with allowed host."""
         from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -360,7 +344,6 @@ class TestSecurityMiddleware:
             assert response.status_code == 200
             assert response.json() == {"message": "success"}
 
-    @pytest.mark.asyncio
     async def test_trusted_host_middleware_disallowed_host(self):
         """Test trusted host middleware with disallowed host."""
         from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -384,7 +367,6 @@ class TestSecurityMiddleware:
 class TestCustomMiddleware:
     """Test custom middleware functionality."""
 
-    @pytest.mark.asyncio
     async def test_custom_middleware_applies_header(self):
         """Test custom middleware applies header."""
         from starlette.middleware.base import BaseHTTPMiddleware
@@ -412,7 +394,6 @@ class TestCustomMiddleware:
             assert response.headers["x-custom-header"] == "test-value"
             assert response.json() == {"message": "success"}
 
-    @pytest.mark.asyncio
     async def test_multiple_custom_middlewares(self):
         """Test multiple custom middlewares."""
         from starlette.middleware.base import BaseHTTPMiddleware
@@ -452,7 +433,6 @@ class TestCustomMiddleware:
 class TestMiddlewareOrder:
     """Test middleware execution order."""
 
-    @pytest.mark.asyncio
     async def test_middleware_execution_order(self):
         """Test middleware execution order."""
         from starlette.middleware.base import BaseHTTPMiddleware
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
@@ -13,7 +12,6 @@ from svc_infra.api.fastapi.auth.routers.oauth_router import oauth_router_with_ba
 from tests.unit.utils.test_helpers import setup_database_mocks
 
 
-@pytest.mark.asyncio
 async def test_oauth_callback_success_returns_redirect_with_cookies(monkeypatch):
     """The OAuth callback should return a redirect response with cookies set."""
 
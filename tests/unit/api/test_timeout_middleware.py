@@ -49,7 +49,6 @@ def test_handler_timeout_returns_504_problem():
         assert body.get("type") == "about:blank"
 
 
-@pytest.mark.asyncio
 async def test_body_read_timeout_returns_408_problem():
     # Build a minimal app with a very small body read timeout
     app = FastAPI()
@@ -6,7 +6,6 @@ from __future__ import annotations
 
 from unittest.mock import Mock
 
-import pytest
 from fastapi import FastAPI, HTTPException
 from httpx import ASGITransport, AsyncClient
 
@@ -26,7 +25,6 @@ from svc_infra.api.fastapi.auth.security import (
 class TestRequireIdentity:
     """Test RequireIdentity guard."""
 
-    @pytest.mark.asyncio
     async def test_require_identity_success(self, auth_client, mock_principal):
         """Test RequireIdentity with valid principal."""
         app = FastAPI()
@@ -47,7 +45,6 @@ class TestRequireIdentity:
             assert data["user_id"] == mock_principal.user.id
             assert data["via"] == mock_principal.via
 
-    @pytest.mark.asyncio
     async def test_require_identity_failure(self, auth_client):
         """Test RequireIdentity without principal."""
         app = FastAPI()
@@ -73,7 +70,6 @@ class TestRequireIdentity:
 class TestAllowIdentity:
     """Test AllowIdentity guard."""
 
-    @pytest.mark.asyncio
     async def test_allow_identity_with_principal(self, auth_client, mock_principal):
         """Test AllowIdentity with valid principal."""
         app = FastAPI()
@@ -97,7 +93,6 @@ class TestAllowIdentity:
             assert data["authenticated"] is True
             assert data["user_id"] == mock_principal.user.id
 
-    @pytest.mark.asyncio
     async def test_allow_identity_without_principal(self, auth_client):
         """Test AllowIdentity without principal."""
         app = FastAPI()
@@ -124,7 +119,6 @@ class TestAllowIdentity:
 class TestRequireUser:
     """Test RequireUser guard."""
 
-    @pytest.mark.asyncio
     async def test_require_user_success(self, auth_client, mock_principal):
         """Test RequireUser with valid user principal."""
         app = FastAPI()
@@ -148,7 +142,6 @@ class TestRequireUser:
             assert data["user_id"] == mock_principal.user.id
             assert data["email"] == mock_principal.user.email
 
-    @pytest.mark.asyncio
     async def test_require_user_failure(self, auth_client):
         """Test RequireUser with service principal."""
         app = FastAPI()
@@ -180,7 +173,6 @@ class TestRequireUser:
 class TestRequireService:
     """Test RequireService guard."""
 
-    @pytest.mark.asyncio
     async def test_require_service_success(self, auth_client):
         """Test RequireService with valid service principal."""
         app = FastAPI()
@@ -211,7 +203,6 @@ class TestRequireService:
             assert data["api_key_id"] == "service_key_123"
             assert data["via"] == "api_key"
 
-    @pytest.mark.asyncio
     async def test_require_service_failure(self, auth_client):
         """Test RequireService with user principal."""
         app = FastAPI()
@@ -243,7 +234,6 @@ class TestRequireService:
 class TestRequireScopes:
     """Test RequireScopes guard."""
 
-    @pytest.mark.asyncio
     async def test_require_scopes_success(self, auth_client):
         """Test RequireScopes with valid scopes."""
         app = FastAPI()
@@ -271,7 +261,6 @@ class TestRequireScopes:
             assert "read" in data["scopes"]
             assert "write" in data["scopes"]
 
-    @pytest.mark.asyncio
     async def test_require_scopes_failure(self, auth_client):
         """Test RequireScopes with insufficient scopes."""
         app = FastAPI()
@@ -301,7 +290,6 @@ class TestRequireScopes:
 class TestRequireAnyScope:
     """Test RequireAnyScope guard."""
 
-    @pytest.mark.asyncio
     async def test_require_any_scope_success(self, auth_client):
         """Test RequireAnyScope with one valid scope."""
         app = FastAPI()
@@ -328,7 +316,6 @@ class TestRequireAnyScope:
             data = response.json()
             assert "read" in data["scopes"]
 
-    @pytest.mark.asyncio
     async def test_require_any_scope_failure(self, auth_client):
         """Test RequireAnyScope with no valid scopes."""
         app = FastAPI()
@@ -358,7 +345,6 @@ class TestRequireAnyScope:
 class TestRequireRoles:
     """Test RequireRoles guard."""
 
-    @pytest.mark.asyncio
     async def test_require_roles_success(self, auth_client):
         """Test RequireRoles with valid roles."""
         app = FastAPI()
@@ -388,7 +374,6 @@ class TestRequireRoles:
             data = response.json()
             assert "admin" in data["roles"]
 
-    @pytest.mark.asyncio
     async def test_require_roles_failure(self, auth_client):
         """Test RequireRoles with insufficient roles."""
         app = FastAPI()
@@ -417,7 +402,6 @@ class TestRequireRoles:
             # Should fail due to insufficient roles
             assert response.status_code in [401, 403, 422]
 
-    @pytest.mark.asyncio
     async def test_require_roles_with_custom_resolver(self, auth_client):
         """Test RequireRoles with custom role resolver."""
         app = FastAPI()
@@ -455,7 +439,6 @@ class TestRequireRoles:
 class TestGuardCombinations:
     """Test combining multiple guards."""
 
-    @pytest.mark.asyncio
     async def test_user_with_scopes(self, auth_client):
         """Test endpoint requiring both user and specific scopes."""
         app = FastAPI()
@@ -495,7 +478,6 @@ class TestGuardCombinations:
             assert data["user_id"] == "user_123"
             assert "read" in data["scopes"]
 
-    @pytest.mark.asyncio
     async def test_service_with_any_scope(self, auth_client):
         """Test endpoint requiring service with any of multiple scopes."""
         app = FastAPI()
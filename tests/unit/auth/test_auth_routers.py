@@ -8,7 +8,6 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
-import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
@@ -100,7 +99,6 @@ def _setup_apikey_app(session, principal, mocker) -> FastAPI:
     return app
 
 
-@pytest.mark.asyncio
 async def test_disable_account_marks_user_inactive():
     session = Mock()
     session.commit = AsyncMock()
@@ -117,7 +115,6 @@ async def test_disable_account_marks_user_inactive():
     session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_delete_account_soft_sets_disabled_reason():
     session = Mock()
     session.commit = AsyncMock()
@@ -135,7 +132,6 @@ async def test_delete_account_soft_sets_disabled_reason():
     session.delete.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_delete_account_hard_invokes_delete():
     session = Mock()
     session.commit = AsyncMock()
@@ -151,7 +147,6 @@ async def test_delete_account_hard_invokes_delete():
     session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_create_api_key_returns_plaintext_and_persists(mocker):
     session = Mock()
     session.add = Mock()
@@ -176,7 +171,6 @@ async def test_create_api_key_returns_plaintext_and_persists(mocker):
     session.flush.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_list_api_keys_returns_sanitized_rows(mocker):
     owner_id = uuid4()
     keys = [
@@ -201,7 +195,6 @@ async def test_list_api_keys_returns_sanitized_rows(mocker):
     assert data[0]["key"] is None  # plaintext should never be returned
 
 
-@pytest.mark.asyncio
 async def test_revoke_api_key_marks_key_inactive(mocker):
     session = Mock()
     session.commit = AsyncMock()
@@ -218,7 +211,6 @@ async def test_revoke_api_key_marks_key_inactive(mocker):
     session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_delete_api_key_requires_force_for_active_keys(mocker):
     session = Mock()
     api_key = FakeApiKey(user_id=uuid4(), active=True)
@@ -235,7 +227,6 @@ async def test_delete_api_key_requires_force_for_active_keys(mocker):
     session.delete.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_delete_api_key_force_deletes(mocker):
     session = Mock()
     api_key = FakeApiKey(user_id=uuid4(), active=True)
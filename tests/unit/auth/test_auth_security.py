@@ -6,7 +6,6 @@ from __future__ import annotations
 
 from unittest.mock import Mock
 
-import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
@@ -53,7 +52,6 @@ class TestPrincipal:
 class TestResolveApiKey:
     """Test API key resolution functionality."""
 
-    @pytest.mark.asyncio
     async def test_resolve_api_key_no_header(self):
         request = Mock()
         request.headers = {}
@@ -68,7 +66,6 @@ class TestResolveApiKey:
 class TestResolveBearerOrCookiePrincipal:
     """Test bearer token and cookie principal resolution."""
 
-    @pytest.mark.asyncio
     async def test_resolve_no_token(self):
         request = Mock()
         request.headers = {}
@@ -84,7 +81,6 @@ class TestResolveBearerOrCookiePrincipal:
 class TestAuthGuards:
     """Integration tests for guard dependencies."""
 
-    @pytest.mark.asyncio
     async def test_require_roles_success(self):
         app = FastAPI()
 
@@ -104,7 +100,6 @@ class TestAuthGuards:
         payload = response.json()
         assert payload["roles"] == ["admin", "user"]
 
-    @pytest.mark.asyncio
     async def test_require_roles_failure(self):
         app = FastAPI()
 
@@ -122,7 +117,6 @@ class TestAuthGuards:
 
         assert response.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_require_scopes_success(self):
         app = FastAPI()
 
@@ -140,7 +134,6 @@ class TestAuthGuards:
         assert response.status_code == 200
         assert set(response.json()["scopes"]) == {"read", "write", "admin"}
 
-    @pytest.mark.asyncio
     async def test_require_scopes_failure(self):
         app = FastAPI()
 
@@ -157,7 +150,6 @@ class TestAuthGuards:
 
         assert response.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_require_user_success(self):
         app = FastAPI()
 
@@ -176,7 +168,6 @@ class TestAuthGuards:
         assert response.status_code == 200
         assert response.json()["user_id"] == "user-1"
 
-    @pytest.mark.asyncio
     async def test_require_user_failure(self):
         app = FastAPI()
 
@@ -192,7 +183,6 @@ class TestAuthGuards:
 
         assert response.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_require_service_success(self):
         app = FastAPI()
 
@@ -213,7 +203,6 @@ class TestAuthGuards:
         assert response.status_code == 200
         assert response.json()["api_key_id"] == "svc-key"
 
-    @pytest.mark.asyncio
     async def test_require_service_failure(self):
         app = FastAPI()
 
@@ -28,7 +28,6 @@ class FakeDB:
         pass
 
 
-@pytest.mark.asyncio
 async def test_issue_resend_accept_invitation():
     db = FakeDB()
     org = Organization(id=uuid.uuid4(), name="Acme")
@@ -61,7 +60,6 @@ async def test_issue_resend_accept_invitation():
     assert inv2.used_at is not None
 
 
-@pytest.mark.asyncio
 async def test_invitation_expiry_and_revocation():
     db = FakeDB()
     org = Organization(id=uuid.uuid4(), name="Beta")
@@ -43,7 +43,6 @@ def _dummy_session_factory():
     return _DummySessionCtx()
 
 
-@pytest.mark.asyncio
 async def test_billing_aggregate_job_emits_webhook(monkeypatch):
     # Monkeypatch the service used by the handler
     monkeypatch.setattr(jobs_module, "AsyncBillingService", _FakeAsyncBillingService)
@@ -96,7 +95,6 @@ async def test_billing_aggregate_job_emits_webhook(monkeypatch):
     assert int(event["payload"]["total"]) == 5
 
 
-@pytest.mark.asyncio
 async def test_billing_invoice_job_emits_webhook(monkeypatch):
     # Monkeypatch the service used by the handler
     monkeypatch.setattr(jobs_module, "AsyncBillingService", _FakeAsyncBillingService)
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
-import pytest
-
 IDEMP = {"Idempotency-Key": "idem-usage-1"}
 
 
-@pytest.mark.asyncio
 async def test_post_usage_accepts_and_returns_id(client):
     body = {
         "metric": "tokens",
@@ -20,7 +17,6 @@ async def test_post_usage_accepts_and_returns_id(client):
     assert data["accepted"] is True
 
 
-@pytest.mark.asyncio
 async def test_get_usage_lists_empty(client):
     res = await client.get("/_billing/usage", params={"metric": "tokens"})
     assert res.status_code == 200
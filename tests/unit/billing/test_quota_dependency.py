@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-import pytest
 from fastapi import Depends, FastAPI
 from httpx import ASGITransport, AsyncClient
 
 from svc_infra.billing.quotas import require_quota
 
 
-@pytest.mark.asyncio
 async def test_quota_dependency_allows_without_subscription(mocker):
     app = FastAPI()
 
@@ -7,12 +7,9 @@ from __future__ import annotations
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
-import pytest
-
 from svc_infra.cache.decorators import cache_read, cache_write, init_cache
 
 
-@pytest.mark.asyncio
 async def test_cache_read_uses_namespace_prefix(mocker):
     mocker.patch("svc_infra.cache.decorators._alias", return_value="svc")
     calls = []
@@ -40,7 +37,6 @@ async def test_cache_read_uses_namespace_prefix(mocker):
     assert hasattr(fetch_user, "__svc_key_variants__")
 
 
-@pytest.mark.asyncio
 async def test_cache_read_falls_back_when_prefix_not_supported(mocker):
     mocker.patch("svc_infra.cache.decorators._alias", return_value="svc")
     call_order = []
@@ -71,7 +67,6 @@ async def test_cache_read_falls_back_when_prefix_not_supported(mocker):
     assert call_order[1]["key"].startswith("svc:user:")
 
 
-@pytest.mark.asyncio
 async def test_cache_write_invalidates_tags_and_executes_recache(mocker):
     mocker.patch("svc_infra.cache.decorators.resolve_tags", return_value=["user:123"])
     invalidate = mocker.patch(
@@ -99,7 +94,6 @@ async def test_cache_write_invalidates_tags_and_executes_recache(mocker):
     )
 
 
-@pytest.mark.asyncio
 async def test_cache_write_runs_recache_even_if_invalidation_fails(mocker):
     mocker.patch("svc_infra.cache.decorators.resolve_tags", return_value=["user:123"])
     mocker.patch(
@@ -133,7 +127,6 @@ class TestCacheInitialization:
         )
 
 
-@pytest.mark.asyncio
 async def test_cached_alias_behaves_like_cache_read(mocker):
     from svc_infra.cache.decorators import cached
 
@@ -157,7 +150,6 @@ async def test_cached_alias_behaves_like_cache_read(mocker):
     assert await fetch(user_id=1) == {"id": 1}
 
 
-@pytest.mark.asyncio
 async def test_mutates_alias_behaves_like_cache_write(mocker):
     from svc_infra.cache.decorators import mutates
 
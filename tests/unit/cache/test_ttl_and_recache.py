@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import pytest
-
 from svc_infra.cache.ttl import TTL_DEFAULT, TTL_LONG, TTL_SHORT, get_ttl, validate_ttl
 
 
@@ -35,7 +33,6 @@ def test_generate_key_variants_with_and_without_namespace(mocker):
     assert variants == ["ns:v1:user:7:profile", "user:7:profile"]
 
 
-@pytest.mark.asyncio
 async def test_execute_recache_deletes_key_variants_and_calls_getter(mocker):
     # Patch namespace and cache.delete
     mocker.patch("svc_infra.cache.recache._alias", return_value="ns:v1")
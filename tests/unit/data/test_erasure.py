@@ -14,7 +14,6 @@ class FakeSession:
         return None
 
 
-@pytest.mark.asyncio
 async def test_run_erasure_with_sync_and_async_steps():
     sess = FakeSession()
     calls: list[str] = []
@@ -10,7 +10,6 @@ from svc_infra.data.fixtures import make_on_load_fixtures, run_fixtures
 pytestmark = pytest.mark.data_lifecycle
 
 
-@pytest.mark.asyncio
 async def test_run_fixtures_sync_and_async(tmp_path: Path):
     calls: list[str] = []
 
@@ -25,7 +24,6 @@ async def test_run_fixtures_sync_and_async(tmp_path: Path):
     assert calls == ["f1", "f2"]
 
 
-@pytest.mark.asyncio
 async def test_make_on_load_fixtures_run_once(tmp_path: Path):
     calls: list[str] = []
     sentinel = tmp_path / "fixtures" / ".done"
@@ -61,7 +61,6 @@ class FakeSession:
         return R()
 
 
-@pytest.mark.asyncio
 async def test_run_retention_soft_delete():
     sess = FakeSession()
     pol = RetentionPolicy(
@@ -76,7 +75,6 @@ async def test_run_retention_soft_delete():
     assert any(c[0] == "created_at" and c[1] == "<=" for c in conds)
 
 
-@pytest.mark.asyncio
 async def test_run_retention_hard_delete():
     sess = FakeSession()
     pol = RetentionPolicy(
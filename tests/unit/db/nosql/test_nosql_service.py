@@ -28,7 +28,6 @@ class TestNoSqlService:
         db.test_collection = Mock()
         return db
 
-    @pytest.mark.asyncio
     async def test_create_success(self, nosql_service, mock_db, sample_user_document_data):
         """Test successful document creation."""
         # Mock the repository create method
@@ -40,7 +39,6 @@ class TestNoSqlService:
         assert result == expected_result
         nosql_service.repo.create.assert_called_once_with(mock_db, sample_user_document_data)
 
-    @pytest.mark.asyncio
     async def test_create_with_exception(self, nosql_service, mock_db, sample_user_document_data):
         """Test document creation with exception."""
         # Mock the repository create method to raise an exception
@@ -51,7 +49,6 @@ class TestNoSqlService:
 
         nosql_service.repo.create.assert_called_once_with(mock_db, sample_user_document_data)
 
-    @pytest.mark.asyncio
     async def test_get_success(self, nosql_service, mock_db, sample_user_document_data):
         """Test successful document retrieval by ID."""
         # Mock the repository get method
@@ -62,7 +59,6 @@ class TestNoSqlService:
         assert result == sample_user_document_data
         nosql_service.repo.get.assert_called_once_with(mock_db, "user_123")
 
-    @pytest.mark.asyncio
     async def test_get_not_found(self, nosql_service, mock_db):
         """Test document retrieval when document doesn't exist."""
         # Mock the repository get method to return None
@@ -73,7 +69,6 @@ class TestNoSqlService:
         assert result is None
         nosql_service.repo.get.assert_called_once_with(mock_db, "nonexistent_id")
 
-    @pytest.mark.asyncio
     async def test_list_success(self, nosql_service, mock_db, sample_user_documents):
         """Test successful document listing."""
         # Convert documents to dictionaries
@@ -91,7 +86,6 @@ class TestNoSqlService:
 
         nosql_service.repo.list.assert_called_once_with(mock_db, limit=10, offset=0, sort=None)
 
-    @pytest.mark.asyncio
     async def test_list_with_sort(self, nosql_service, mock_db, sample_user_documents):
         """Test document listing with sorting."""
         # Convert documents to dictionaries
@@ -106,7 +100,6 @@ class TestNoSqlService:
         assert len(result) == 3
         nosql_service.repo.list.assert_called_once_with(mock_db, limit=10, offset=0, sort=sort)
 
-    @pytest.mark.asyncio
     async def test_update_success(self, nosql_service, mock_db, sample_user_document_data):
         """Test successful document update."""
         # Mock the repository update method
@@ -119,7 +112,6 @@ class TestNoSqlService:
         assert result == updated_data
         nosql_service.repo.update.assert_called_once_with(mock_db, "user_123", update_data)
 
-    @pytest.mark.asyncio
     async def test_update_not_found(self, nosql_service, mock_db):
         """Test document update when document doesn't exist."""
         # Mock the repository update method to return None
@@ -131,7 +123,6 @@ class TestNoSqlService:
         assert result is None
         nosql_service.repo.update.assert_called_once_with(mock_db, "nonexistent_id", update_data)
 
-    @pytest.mark.asyncio
     async def test_delete_success(self, nosql_service, mock_db):
         """Test successful document deletion."""
         # Mock the repository delete method
@@ -142,7 +133,6 @@ class TestNoSqlService:
         assert result is True
         nosql_service.repo.delete.assert_called_once_with(mock_db, "user_123")
 
-    @pytest.mark.asyncio
     async def test_delete_not_found(self, nosql_service, mock_db):
         """Test document deletion when document doesn't exist."""
         # Mock the repository delete method to return False
@@ -153,7 +143,6 @@ class TestNoSqlService:
         assert result is False
         nosql_service.repo.delete.assert_called_once_with(mock_db, "nonexistent_id")
 
-    @pytest.mark.asyncio
     async def test_exists_true(self, nosql_service, mock_db):
         """Test document existence check when document exists."""
         # Mock the repository exists method
@@ -166,7 +155,6 @@ class TestNoSqlService:
             mock_db, where=[{"email": "test@example.com"}]
         )
 
-    @pytest.mark.asyncio
     async def test_exists_false(self, nosql_service, mock_db):
         """Test document existence check when document doesn't exist."""
         # Mock the repository exists method
@@ -179,7 +167,6 @@ class TestNoSqlService:
             mock_db, where=[{"email": "nonexistent@example.com"}]
         )
 
-    @pytest.mark.asyncio
     async def test_count_success(self, nosql_service, mock_db):
         """Test document counting."""
         # Mock the repository count method
@@ -190,7 +177,6 @@ class TestNoSqlService:
         assert result == 5
         nosql_service.repo.count.assert_called_once_with(mock_db)
 
-    @pytest.mark.asyncio
     async def test_search_success(self, nosql_service, mock_db, sample_user_documents):
         """Test document search functionality."""
         # Convert documents to dictionaries
@@ -208,7 +194,6 @@ class TestNoSqlService:
             mock_db, q="test", fields=["email", "name"], limit=10, offset=0, sort=None
         )
 
-    @pytest.mark.asyncio
     async def test_count_filtered_success(self, nosql_service, mock_db):
         """Test filtered document counting."""
         # Mock the repository count_filtered method
@@ -221,7 +206,6 @@ class TestNoSqlService:
             mock_db, q="test", fields=["email", "name"]
         )
 
-    @pytest.mark.asyncio
     async def test_pre_create_hook(self, nosql_service, mock_db, sample_user_document_data):
         """Test pre-create hook functionality."""
         # Override the pre_create method to add a timestamp
@@ -245,7 +229,6 @@ class TestNoSqlService:
         finally:
             nosql_service.pre_create = original_pre_create
 
-    @pytest.mark.asyncio
     async def test_pre_update_hook(self, nosql_service, mock_db, sample_user_document_data):
         """Test pre-update hook functionality."""
         # Override the pre_update method to add a timestamp
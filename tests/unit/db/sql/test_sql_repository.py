@@ -21,7 +21,6 @@ class TestSqlRepository:
         """Create a SQL repository instance for testing."""
         return SqlRepository(model=UserModel)
 
-    @pytest.mark.asyncio
     async def test_save_success(self, sql_repository, mock_sqlalchemy_session):
         """Test successful record save."""
         # Mock the session.flush to simulate successful save
@@ -39,7 +38,6 @@ class TestSqlRepository:
         mock_sqlalchemy_session.add.assert_called_once()
         mock_sqlalchemy_session.flush.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_save_with_integrity_error(self, sql_repository, mock_sqlalchemy_session):
         """Test record saving with integrity error."""
         # Mock the session.flush to raise IntegrityError
@@ -55,7 +53,6 @@ class TestSqlRepository:
         mock_sqlalchemy_session.add.assert_called_once()
         mock_sqlalchemy_session.flush.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_find_by_id_success(self, sql_repository, mock_sqlalchemy_session):
         """Test successful record finding by ID."""
         # Create a mock user
@@ -75,7 +72,6 @@ class TestSqlRepository:
         # Verify session.execute was called
         mock_sqlalchemy_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_find_by_id_not_found(self, sql_repository, mock_sqlalchemy_session):
         """Test record finding when record doesn't exist."""
         # Mock the session.execute to return None
@@ -88,7 +84,6 @@ class TestSqlRepository:
         assert result is None
         mock_sqlalchemy_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_find_all_success(self, sql_repository, mock_sqlalchemy_session):
         """Test successful record finding all."""
         # Create mock users
@@ -108,7 +103,6 @@ class TestSqlRepository:
         assert result[0].email == "user1@example.com"
         assert result[1].email == "user2@example.com"
 
-    @pytest.mark.asyncio
     async def test_find_all_with_filters(self, sql_repository, mock_sqlalchemy_session):
         """Test record finding all with filters."""
         # Create mock users
@@ -129,7 +123,6 @@ class TestSqlRepository:
         # Verify the query was constructed
         mock_sqlalchemy_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_find_all_with_pagination(self, sql_repository, mock_sqlalchemy_session):
         """Test record finding all with pagination."""
         # Create mock users
@@ -150,7 +143,6 @@ class TestSqlRepository:
         # Verify the query was constructed with pagination
         mock_sqlalchemy_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_success(self, sql_repository, mock_sqlalchemy_session):
         """Test successful record update."""
         # Create a mock user
@@ -176,7 +168,6 @@ class TestSqlRepository:
         mock_sqlalchemy_session.execute.assert_called()
         mock_sqlalchemy_session.flush.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_not_found(self, sql_repository, mock_sqlalchemy_session):
         """Test record update when record doesn't exist."""
         # Mock the session.execute to return None
@@ -190,7 +181,6 @@ class TestSqlRepository:
         assert result is None
         mock_sqlalchemy_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delete_success(self, sql_repository, mock_sqlalchemy_session):
         """Test successful record deletion."""
         # Create a mock user
@@ -211,7 +201,6 @@ class TestSqlRepository:
         mock_sqlalchemy_session.delete.assert_called_once_with(mock_user)
         mock_sqlalchemy_session.flush.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delete_not_found(self, sql_repository, mock_sqlalchemy_session):
         """Test record deletion when record doesn't exist."""
         # Mock the session.get to return None
@@ -223,7 +212,6 @@ class TestSqlRepository:
         mock_sqlalchemy_session.get.assert_called_once_with(UserModel, 999)
         mock_sqlalchemy_session.delete.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_count_success(self, sql_repository, mock_sqlalchemy_session):
         """Test record counting."""
         # Mock the session.execute to return a count
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import pytest
-
 from svc_infra.db.sql.repository import SqlRepository
 
 
@@ -100,7 +98,6 @@ def _class_mapper_stub(model):
     return C()
 
 
-@pytest.mark.asyncio
 async def test_soft_delete_timestamps_and_flag(monkeypatch):
     # patch class_mapper used by SqlRepository
     monkeypatch.setattr("svc_infra.db.sql.repository.class_mapper", _class_mapper_stub)
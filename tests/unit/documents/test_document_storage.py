@@ -27,7 +27,6 @@ def clear_metadata():
     clear_storage()
 
 
-@pytest.mark.asyncio
 @pytest.mark.documents
 class TestUploadDocument:
     """Tests for upload_document function."""
@@ -99,7 +98,6 @@ class TestUploadDocument:
         assert retrieved_content == content
 
 
-@pytest.mark.asyncio
 @pytest.mark.documents
 class TestGetDocument:
     """Tests for get_document function."""
@@ -124,7 +122,6 @@ class TestGetDocument:
         assert result is None
 
 
-@pytest.mark.asyncio
 @pytest.mark.documents
 class TestDownloadDocument:
     """Tests for download_document function."""
@@ -149,7 +146,6 @@ class TestDownloadDocument:
             await download_document(storage, "nonexistent_id")
 
 
-@pytest.mark.asyncio
 @pytest.mark.documents
 class TestDeleteDocument:
     """Tests for delete_document function."""
@@ -181,7 +177,6 @@ class TestDeleteDocument:
         assert success is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.documents
 class TestListDocuments:
     """Tests for list_documents function."""
@@ -3,7 +3,6 @@ from __future__ import annotations
 from io import BytesIO
 from unittest.mock import Mock
 
-import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
@@ -11,7 +10,6 @@ from svc_infra.api.fastapi.auth.security import Principal, _current_principal
 from svc_infra.documents import add_documents
 
 
-@pytest.mark.asyncio
 async def test_add_documents_upload_accepts_multipart_file() -> None:
     app = FastAPI()
 
@@ -208,7 +208,6 @@ class TestHealthRegistry:
         registry.clear()
         assert len(registry.checks) == 0
 
-    @pytest.mark.asyncio
     async def test_check_one_success(self) -> None:
         """Test running a single check that succeeds."""
         registry = HealthRegistry()
@@ -224,14 +223,12 @@ class TestHealthRegistry:
         result = await registry.check_one("test")
         assert result.status == HealthStatus.HEALTHY
 
-    @pytest.mark.asyncio
     async def test_check_one_not_found(self) -> None:
         """Test running a check that doesn't exist."""
         registry = HealthRegistry()
         with pytest.raises(KeyError, match="not found"):
             await registry.check_one("nonexistent")
 
-    @pytest.mark.asyncio
     async def test_check_one_timeout(self) -> None:
         """Test check that times out."""
         registry = HealthRegistry()
@@ -245,7 +242,6 @@ class TestHealthRegistry:
         assert result.status == HealthStatus.UNHEALTHY
         assert "timed out" in (result.message or "")
 
-    @pytest.mark.asyncio
     async def test_check_one_exception(self) -> None:
         """Test check that raises an exception."""
         registry = HealthRegistry()
@@ -258,7 +254,6 @@ class TestHealthRegistry:
         assert result.status == HealthStatus.UNHEALTHY
         assert "Connection failed" in (result.message or "")
 
-    @pytest.mark.asyncio
     async def test_check_all_no_checks(self) -> None:
         """Test check_all with no registered checks."""
         registry = HealthRegistry()
@@ -266,7 +261,6 @@ class TestHealthRegistry:
         assert result.status == HealthStatus.HEALTHY
         assert len(result.checks) == 0
 
-    @pytest.mark.asyncio
     async def test_check_all_all_healthy(self) -> None:
         """Test check_all when all checks pass."""
         registry = HealthRegistry()
@@ -281,7 +275,6 @@ class TestHealthRegistry:
         assert result.status == HealthStatus.HEALTHY
         assert len(result.checks) == 2
 
-    @pytest.mark.asyncio
     async def test_check_all_critical_fails(self) -> None:
         """Test check_all when a critical check fails."""
         registry = HealthRegistry()
@@ -298,7 +291,6 @@ class TestHealthRegistry:
         result = await registry.check_all()
         assert result.status == HealthStatus.UNHEALTHY
 
-    @pytest.mark.asyncio
     async def test_check_all_noncritical_fails(self) -> None:
         """Test check_all when only non-critical check fails."""
         registry = HealthRegistry()
@@ -315,7 +307,6 @@ class TestHealthRegistry:
         result = await registry.check_all()
         assert result.status == HealthStatus.DEGRADED
 
-    @pytest.mark.asyncio
     async def test_wait_until_healthy_immediate(self) -> None:
         """Test wait_until_healthy when already healthy."""
         registry = HealthRegistry()
@@ -328,7 +319,6 @@ class TestHealthRegistry:
         result = await registry.wait_until_healthy(timeout=5)
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_wait_until_healthy_timeout(self) -> None:
         """Test wait_until_healthy times out when unhealthy."""
         registry = HealthRegistry()
@@ -341,7 +331,6 @@ class TestHealthRegistry:
         result = await registry.wait_until_healthy(timeout=0.3, interval=0.1)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_wait_until_healthy_becomes_healthy(self) -> None:
         """Test wait_until_healthy succeeds when check becomes healthy."""
         registry = HealthRegistry()
@@ -360,7 +349,6 @@ class TestHealthRegistry:
         assert result is True
         assert call_count >= 3
 
-    @pytest.mark.asyncio
     async def test_wait_until_healthy_specific_checks(self) -> None:
         """Test wait_until_healthy with specific check names."""
         registry = HealthRegistry()
@@ -428,7 +416,6 @@ class TestAggregatedHealthResult:
 class TestCheckDatabase:
     """Tests for check_database function."""
 
-    @pytest.mark.asyncio
     async def test_no_url(self) -> None:
         """Test with no URL configured."""
         check = check_database(None)
@@ -436,7 +423,6 @@ class TestCheckDatabase:
         assert result.status == HealthStatus.UNHEALTHY
         assert "not configured" in (result.message or "")
 
-    @pytest.mark.asyncio
     async def test_asyncpg_not_installed(self) -> None:
         """Test when asyncpg is not installed."""
         # If asyncpg is actually installed, this test just verifies
@@ -446,7 +432,6 @@ class TestCheckDatabase:
         # Should return unhealthy or unknown when connection fails
         assert result.status in (HealthStatus.UNHEALTHY, HealthStatus.UNKNOWN)
 
-    @pytest.mark.asyncio
     async def test_connection_success(self) -> None:
         """Test successful database connection (mocked)."""
         # Create a mock module for asyncpg
@@ -466,7 +451,6 @@ class TestCheckDatabase:
             result = await check()
             assert result.status == HealthStatus.HEALTHY
 
-    @pytest.mark.asyncio
     async def test_normalizes_url(self) -> None:
         """Test that postgres:// is normalized to postgresql://."""
         # Create a mock to capture the URL
@@ -499,7 +483,6 @@ class TestCheckDatabase:
 class TestCheckRedis:
     """Tests for check_redis function."""
 
-    @pytest.mark.asyncio
     async def test_no_url(self) -> None:
         """Test with no URL configured."""
         check = check_redis(None)
@@ -507,7 +490,6 @@ class TestCheckRedis:
         assert result.status == HealthStatus.UNHEALTHY
         assert "not configured" in (result.message or "")
 
-    @pytest.mark.asyncio
     async def test_connection_success(self) -> None:
         """Test successful Redis connection (mocked)."""
         mock_client = AsyncMock()
@@ -519,7 +501,6 @@ class TestCheckRedis:
             result = await check()
             assert result.status == HealthStatus.HEALTHY
 
-    @pytest.mark.asyncio
     async def test_ping_returns_false(self) -> None:
         """Test when Redis PING returns False."""
         mock_client = AsyncMock()
@@ -540,7 +521,6 @@ class TestCheckRedis:
 class TestCheckUrl:
     """Tests for check_url function."""
 
-    @pytest.mark.asyncio
     async def test_success(self) -> None:
         """Test successful HTTP check."""
         mock_response = MagicMock()
@@ -557,7 +537,6 @@ class TestCheckUrl:
             result = await check()
             assert result.status == HealthStatus.HEALTHY
 
-    @pytest.mark.asyncio
     async def test_wrong_status(self) -> None:
         """Test when status code doesn't match expected."""
         mock_response = MagicMock()
@@ -575,7 +554,6 @@ class TestCheckUrl:
             assert result.status == HealthStatus.UNHEALTHY
             assert "Expected status 200" in (result.message or "")
 
-    @pytest.mark.asyncio
     async def test_custom_expected_status(self) -> None:
         """Test with custom expected status code."""
         mock_response = MagicMock()
@@ -592,7 +570,6 @@ class TestCheckUrl:
             result = await check()
             assert result.status == HealthStatus.HEALTHY
 
-    @pytest.mark.asyncio
     async def test_timeout(self) -> None:
         """Test connection timeout."""
         import httpx
@@ -609,7 +586,6 @@ class TestCheckUrl:
             assert result.status == HealthStatus.UNHEALTHY
             assert "timeout" in (result.message or "").lower()
 
-    @pytest.mark.asyncio
     async def test_connection_error(self) -> None:
         """Test connection error."""
         import httpx
@@ -634,7 +610,6 @@ class TestCheckUrl:
 class TestCheckTcp:
     """Tests for check_tcp function."""
 
-    @pytest.mark.asyncio
     async def test_success(self) -> None:
         """Test successful TCP connection."""
         mock_writer = AsyncMock()
@@ -646,7 +621,6 @@ class TestCheckTcp:
             result = await check()
             assert result.status == HealthStatus.HEALTHY
 
-    @pytest.mark.asyncio
     async def test_timeout(self) -> None:
         """Test connection timeout."""
         with patch("asyncio.open_connection", side_effect=asyncio.TimeoutError):
@@ -655,7 +629,6 @@ class TestCheckTcp:
             assert result.status == HealthStatus.UNHEALTHY
             assert "timeout" in (result.message or "").lower()
 
-    @pytest.mark.asyncio
     async def test_connection_refused(self) -> None:
         """Test connection refused."""
         with patch("asyncio.open_connection", side_effect=OSError("Connection refused")):
@@ -663,7 +636,6 @@ class TestCheckTcp:
             result = await check()
             assert result.status == HealthStatus.UNHEALTHY
 
-    @pytest.mark.asyncio
     async def test_name_includes_host_port(self) -> None:
         """Test that result name includes host:port."""
         with patch("asyncio.open_connection", side_effect=OSError("refused")):
@@ -707,7 +679,6 @@ class TestAddHealthRoutes:
         routes = [r.path for r in app.routes]
         assert "/probes/live" in routes or "/probes/live/" in routes
 
-    @pytest.mark.asyncio
     async def test_liveness_always_ok(self) -> None:
         """Test liveness endpoint always returns 200."""
         from fastapi import FastAPI
@@ -725,7 +696,6 @@ class TestAddHealthRoutes:
             assert response.status_code == 200
             assert response.json()["status"] == "ok"
 
-    @pytest.mark.asyncio
     async def test_readiness_healthy(self) -> None:
         """Test readiness endpoint when all checks pass."""
         from fastapi import FastAPI
@@ -748,7 +718,6 @@ class TestAddHealthRoutes:
             assert response.status_code == 200
             assert response.json()["status"] == "healthy"
 
-    @pytest.mark.asyncio
     async def test_readiness_unhealthy(self) -> None:
         """Test readiness endpoint when checks fail."""
         from fastapi import FastAPI
@@ -770,7 +739,6 @@ class TestAddHealthRoutes:
             response = await client.get("/_health/ready")
             assert response.status_code == 503
 
-    @pytest.mark.asyncio
     async def test_single_check_endpoint(self) -> None:
         """Test single check endpoint."""
         from fastapi import FastAPI
@@ -793,7 +761,6 @@ class TestAddHealthRoutes:
             assert response.status_code == 200
             assert response.json()["name"] == "db"
 
-    @pytest.mark.asyncio
     async def test_single_check_not_found(self) -> None:
         """Test single check endpoint with unknown check."""
         from fastapi import FastAPI
@@ -814,7 +781,6 @@ class TestAddHealthRoutes:
 class TestAddStartupProbe:
     """Tests for add_startup_probe function."""
 
-    @pytest.mark.asyncio
     async def test_startup_success(self) -> None:
         """Test startup probe with healthy checks."""
         from fastapi import FastAPI
@@ -832,7 +798,6 @@ class TestAddStartupProbe:
 
         # If we get here, startup succeeded
 
-    @pytest.mark.asyncio
     async def test_startup_timeout(self) -> None:
         """Test startup probe times out with unhealthy checks."""
         from fastapi import FastAPI
@@ -904,7 +869,6 @@ class TestAddDependencyHealth:
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
-    @pytest.mark.asyncio
     async def test_check_latency_measured(self) -> None:
         """Test that latency is measured accurately."""
         registry = HealthRegistry()
@@ -919,7 +883,6 @@ class TestEdgeCases:
         # Latency should be at least 100ms (but allow some tolerance)
         assert result.latency_ms >= 95  # Allow 5ms tolerance
 
-    @pytest.mark.asyncio
     async def test_concurrent_checks(self) -> None:
         """Test that checks run concurrently."""
         registry = HealthRegistry()
@@ -943,7 +906,6 @@ class TestEdgeCases:
             time_spread = max(start_times) - min(start_times)
             assert time_spread < 0.05  # Less than 50ms difference
 
-    @pytest.mark.asyncio
     async def test_empty_registry_wait(self) -> None:
         """Test wait_until_healthy with empty registry."""
         registry = HealthRegistry()
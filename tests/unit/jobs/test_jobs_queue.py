@@ -11,7 +11,6 @@ from svc_infra.jobs.worker import process_one
 pytestmark = pytest.mark.jobs
 
 
-@pytest.mark.asyncio
 async def test_enqueue_and_process_success():
     queue, _sched = easy_jobs()
 
@@ -27,7 +26,6 @@ async def test_enqueue_and_process_success():
     assert processed is False
 
 
-@pytest.mark.asyncio
 async def test_fail_and_backoff_requeues_job():
     q = InMemoryJobQueue()
     q.enqueue("task", {})
@@ -43,7 +41,6 @@ async def test_fail_and_backoff_requeues_job():
     assert nxt is None
 
 
-@pytest.mark.asyncio
 async def test_delayed_enqueue_and_reserve():
     q = InMemoryJobQueue()
     q.enqueue("delayed", {}, delay_seconds=1)
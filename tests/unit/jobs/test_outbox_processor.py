@@ -7,7 +7,6 @@ from svc_infra.jobs.queue import InMemoryJobQueue
 pytestmark = pytest.mark.jobs
 
 
-@pytest.mark.asyncio
 async def test_outbox_tick_enqueues_job():
     outbox = InMemoryOutboxStore()
     queue = InMemoryJobQueue()
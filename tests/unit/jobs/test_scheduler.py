@@ -7,7 +7,6 @@ from svc_infra.jobs.scheduler import InMemoryScheduler
 pytestmark = pytest.mark.jobs
 
 
-@pytest.mark.asyncio
 async def test_scheduler_runs_task_on_tick():
     ran = False
 
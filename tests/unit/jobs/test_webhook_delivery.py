@@ -26,7 +26,6 @@ class FakeServer:
         return Resp(self.status)
 
 
-@pytest.mark.asyncio
 async def test_webhook_delivery_success(monkeypatch):
     outbox = InMemoryOutboxStore()
     inbox = InMemoryInboxStore()
@@ -82,7 +81,6 @@ async def test_webhook_delivery_success(monkeypatch):
     assert len(fake.calls) == 1
 
 
-@pytest.mark.asyncio
 async def test_webhook_delivery_retry_on_non_2xx(monkeypatch):
     outbox = InMemoryOutboxStore()
     inbox = InMemoryInboxStore()
@@ -128,7 +126,6 @@ async def test_webhook_delivery_retry_on_non_2xx(monkeypatch):
     assert queue.reserve_next() is None
 
 
-@pytest.mark.asyncio
 async def test_webhook_delivery_uses_subscription_envelope(monkeypatch):
     outbox = InMemoryOutboxStore()
     inbox = InMemoryInboxStore()
@@ -1,13 +1,10 @@
 import asyncio
 import time
 
-import pytest
-
 from svc_infra.jobs.queue import InMemoryJobQueue
 from svc_infra.jobs.runner import WorkerRunner
 
 
-@pytest.mark.asyncio
 async def test_worker_runner_graceful_stop_allows_inflight_to_finish():
     q = InMemoryJobQueue()
     q.enqueue("t", {})
@@ -28,7 +25,6 @@ async def test_worker_runner_graceful_stop_allows_inflight_to_finish():
     assert q.reserve_next() is None
 
 
-@pytest.mark.asyncio
 async def test_worker_runner_stop_timeout_does_not_hang():
     q = InMemoryJobQueue()
     q.enqueue("t", {})
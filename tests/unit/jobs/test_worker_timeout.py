@@ -1,13 +1,10 @@
 import asyncio
 import time
 
-import pytest
-
 from svc_infra.jobs.queue import InMemoryJobQueue
 from svc_infra.jobs.worker import process_one
 
 
-@pytest.mark.asyncio
 async def test_worker_times_out_and_fails_job(monkeypatch):
     # Set a very small timeout
     monkeypatch.setenv("JOB_DEFAULT_TIMEOUT_SECONDS", "0.05")
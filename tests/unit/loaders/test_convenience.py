@@ -88,7 +88,6 @@ class TestLoadedContent:
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
-    @pytest.mark.asyncio
     async def test_load_github_creates_loader(self):
         """Test that load_github creates GitHubLoader and calls load."""
         with patch.object(GitHubLoader, "load", new_callable=AsyncMock) as mock_load:
@@ -99,7 +98,6 @@ class TestConvenienceFunctions:
             assert len(contents) == 1
             mock_load.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_load_url_creates_loader(self):
         """Test that load_url creates URLLoader and calls load."""
         with patch.object(URLLoader, "load", new_callable=AsyncMock) as mock_load:
@@ -130,7 +128,6 @@ class TestConvenienceFunctions:
             assert len(contents) == 1
             mock_load.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_load_github_passes_kwargs(self):
         """Test that load_github passes extra kwargs to loader."""
         with patch.object(GitHubLoader, "__init__", return_value=None) as mock_init:
@@ -155,7 +152,6 @@ class TestConvenienceFunctions:
                     extra_metadata={"key": "value"},
                 )
 
-    @pytest.mark.asyncio
     async def test_load_url_passes_kwargs(self):
         """Test that load_url passes extra kwargs to loader."""
         with patch.object(URLLoader, "__init__", return_value=None) as mock_init:
@@ -190,7 +190,6 @@ class TestGitHubLoaderLoad:
             "truncated": False,
         }
 
-    @pytest.mark.asyncio
     async def test_load_filters_by_path(self, mock_tree_response):
         """Test that load() filters files by path prefix."""
         loader = GitHubLoader("owner/repo", path="docs", pattern="*.md")
@@ -222,7 +221,6 @@ class TestGitHubLoaderLoad:
             assert len(contents) == 2
             assert all(c.source.startswith("github://owner/repo/docs/") for c in contents)
 
-    @pytest.mark.asyncio
     async def test_load_skips_pycache(self, mock_tree_response):
         """Test that __pycache__ files are skipped."""
         loader = GitHubLoader("owner/repo", path="docs", pattern="*")
@@ -252,7 +250,6 @@ class TestGitHubLoaderLoad:
             sources = [c.source for c in contents]
             assert not any("__pycache__" in s for s in sources)
 
-    @pytest.mark.asyncio
     async def test_load_handles_404(self):
         """Test that 404 raises ValueError with helpful message."""
         loader = GitHubLoader("owner/nonexistent", path="docs")
@@ -269,7 +266,6 @@ class TestGitHubLoaderLoad:
             with pytest.raises(ValueError, match="Repository or branch not found"):
                 await loader.load()
 
-    @pytest.mark.asyncio
     async def test_load_handles_403_rate_limit(self):
         """Test that 403 raises ValueError with rate limit message."""
         loader = GitHubLoader("owner/repo")
@@ -287,7 +283,6 @@ class TestGitHubLoaderLoad:
             with pytest.raises(ValueError, match="rate limit"):
                 await loader.load()
 
-    @pytest.mark.asyncio
     async def test_load_populates_metadata(self, mock_tree_response):
         """Test that loaded content has correct metadata."""
         loader = GitHubLoader(
@@ -177,7 +177,6 @@ class TestURLLoaderHTMLExtraction:
 class TestURLLoaderLoad:
     """Tests for the load() method."""
 
-    @pytest.mark.asyncio
     async def test_load_single_url(self):
         """Test loading a single URL."""
         loader = URLLoader("https://example.com")
@@ -201,7 +200,6 @@ class TestURLLoaderLoad:
             assert contents[0].content == "Hello World"
             assert contents[0].source == "https://example.com"
 
-    @pytest.mark.asyncio
     async def test_load_multiple_urls(self):
         """Test loading multiple URLs."""
         loader = URLLoader(["https://example.com/1", "https://example.com/2"])
@@ -230,7 +228,6 @@ class TestURLLoaderLoad:
             assert contents[0].content == "Page 1"
             assert contents[1].content == "Page 2"
 
-    @pytest.mark.asyncio
     async def test_load_extracts_html_text(self):
         """Test that HTML text is extracted when extract_text=True."""
         loader = URLLoader("https://example.com", extract_text=True)
@@ -254,7 +251,6 @@ class TestURLLoaderLoad:
             assert "Hello World" in contents[0].content
             assert "<html>" not in contents[0].content
 
-    @pytest.mark.asyncio
     async def test_load_preserves_raw_html(self):
         """Test that HTML is preserved when extract_text=False."""
         loader = URLLoader("https://example.com", extract_text=False)
@@ -278,7 +274,6 @@ class TestURLLoaderLoad:
             assert len(contents) == 1
             assert contents[0].content == html
 
-    @pytest.mark.asyncio
     async def test_load_handles_404_skip(self):
         """Test that 404 is skipped when on_error='skip'."""
         loader = URLLoader(
@@ -309,7 +304,6 @@ class TestURLLoaderLoad:
             assert len(contents) == 1
             assert contents[0].source == "https://example.com/exists"
 
-    @pytest.mark.asyncio
     async def test_load_handles_404_raise(self):
         """Test that 404 raises when on_error='raise'."""
         loader = URLLoader("https://example.com/404", on_error="raise")
@@ -326,7 +320,6 @@ class TestURLLoaderLoad:
             with pytest.raises(RuntimeError, match="HTTP 404"):
                 await loader.load()
 
-    @pytest.mark.asyncio
     async def test_load_tracks_redirects(self):
         """Test that final URL after redirects is tracked."""
         loader = URLLoader("https://example.com/redirect")
@@ -350,7 +343,6 @@ class TestURLLoaderLoad:
             assert contents[0].metadata["url"] == "https://example.com/redirect"
             assert contents[0].metadata["final_url"] == "https://example.com/final"
 
-    @pytest.mark.asyncio
     async def test_load_populates_metadata(self):
         """Test that loaded content has correct metadata."""
         loader = URLLoader(
@@ -381,7 +373,6 @@ class TestURLLoaderLoad:
             assert metadata["status_code"] == 200
             assert metadata["category"] == "test"  # extra_metadata
 
-    @pytest.mark.asyncio
     async def test_load_parses_content_type(self):
         """Test that content type is parsed correctly."""
         loader = URLLoader("https://example.com")
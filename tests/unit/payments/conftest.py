@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import types
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 import pytest_asyncio
@@ -8,14 +10,66 @@ from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
 from svc_infra.apf_payments.provider.base import ProviderAdapter
+from svc_infra.apf_payments.provider.registry import get_provider_registry
+from svc_infra.apf_payments.schemas import (
+    CustomerOut,
+    IntentOut,
+    InvoiceOut,
+    PaymentMethodOut,
+    PriceOut,
+    ProductOut,
+    SetupIntentOut,
+)
 from svc_infra.api.fastapi.apf_payments.router import get_service
 from svc_infra.api.fastapi.apf_payments.setup import add_payments
+from svc_infra.api.fastapi.middleware.idempotency_store import InMemoryIdempotencyStore
 
 # -------------------- App + client --------------------
+#
+# The app, client and fake adapter are built once for the whole payments package.
+# Per-test isolation comes from the autouse ``_reset_payments_state`` fixture below,
+# which clears adapter stubs, cached idempotent responses and session rows between tests.
 
 
-@pytest_asyncio.fixture
-async def app(fake_adapter, mocker) -> FastAPI:
+class _MockResult:
+    def __init__(self, rows: list):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class DummySession:
+    """Minimal session used by routes; every query returns ``rows``."""
+
+    def __init__(self):
+        self.rows: list = []
+
+    async def flush(self):  # no-op
+        return None
+
+    async def execute(self, query):
+        return _MockResult(self.rows)
+
+
+@pytest.fixture(scope="package")
+def idempotency_store() -> InMemoryIdempotencyStore:
+    return InMemoryIdempotencyStore()
+
+
+@pytest.fixture(scope="package")
+def db_session() -> DummySession:
+    return DummySession()
+
+
+@pytest_asyncio.fixture(scope="package", loop_scope="session")
+async def app(fake_adapter, idempotency_store, db_session, _payments_env) -> FastAPI:
     app = FastAPI()
 
     # Add error handlers to handle RuntimeError and other exceptions
@@ -26,7 +80,7 @@ async def app(fake_adapter, mocker) -> FastAPI:
     from svc_infra.api.fastapi.middleware.idempotency import IdempotencyMiddleware
 
     app.add_middleware(CatchAllExceptionMiddleware)
-    app.add_middleware(IdempotencyMiddleware, store={})  # Use in-memory store for tests
+    app.add_middleware(IdempotencyMiddleware, store=idempotency_store)
     register_error_handlers(app)
 
     # Register ONLY our fake adapter so the registry returns it (incl. webhooks)
@@ -36,30 +90,11 @@ async def app(fake_adapter, mocker) -> FastAPI:
         adapters=[fake_adapter],
     )
 
-    # Minimal session used by routes
-    class _DummySession:
-        async def flush(self):  # no-op
-            return None
-
-        async def execute(self, query):
-            # Return a mock result for any database queries
-            class _MockResult:
-                def scalars(self):
-                    return self
-
-                def all(self):
-                    return []
-
-                def __iter__(self):
-                    return iter([])
-
-            return _MockResult()
-
     # Proxy service that forwards unknown attrs/methods to the adapter
     class _SvcProxy:
         def __init__(self, adapter: ProviderAdapter):
             self.adapter = adapter
-            self.session = _DummySession()
+            self.session = db_session
 
         async def get_customer(self, provider_customer_id: str):
             """Handle get_customer with proper None checking like the real service"""
@@ -86,7 +121,7 @@ async def app(fake_adapter, mocker) -> FastAPI:
     from svc_infra.api.fastapi.db.sql.session import get_session
 
     async def _mock_session():
-        return _DummySession()
+        return db_session
 
     app.dependency_overrides[get_session] = _mock_session
 
@@ -100,10 +135,10 @@ async def app(fake_adapter, mocker) -> FastAPI:
     )
 
     # Create a mock user and api key
-    mock_user = mocker.Mock()
+    mock_user = Mock()
     mock_user.id = "test-user-id"
 
-    mock_api_key = mocker.Mock()
+    mock_api_key = Mock()
     mock_api_key.id = "test-api-key-id"
 
     # Mock principal with both user and api_key for service routes
@@ -127,135 +162,316 @@ async def app(fake_adapter, mocker) -> FastAPI:
     return app
 
 
-@pytest_asyncio.fixture
-async def client(app: FastAPI):
+# List endpoints hit once, with empty pages, before the first test runs.
+_WARMUP_PATHS = (
+    "/payments/intents",
+    "/payments/invoices",
+    "/payments/products",
+    "/payments/prices",
+    "/payments/methods?customer_provider_id=cus_warmup",
+)
+
+
+@pytest_asyncio.fixture(scope="package", loop_scope="session")
+async def client(app: FastAPI, fake_adapter):
     # Provide an async httpx client against the ASGI app
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        # Warm the middleware stack, dependency resolution and response validators once,
+        # so the first test against each resource doesn't pay for it. The per-test
+        # reset below clears the stubs and recorded calls afterwards.
+        for method in ("list_intents", "list_invoices", "list_products", "list_prices"):
+            getattr(fake_adapter, method).return_value = ([], None)
+        fake_adapter.list_payment_methods.return_value = []
+        for path in _WARMUP_PATHS:
+            res = await ac.get(path)
+            assert res.status_code == 200, (path, res.text)
+        fake_adapter.reset()
         yield ac
 
 
-# -------------------- Helper functions --------------------
+# -------------------- Request headers and bodies --------------------
+#
+# One idempotency key serves every route test: the idempotency cache is cleared between
+# tests and keyed by method and path, so nothing relies on keys being unique. Passing the
+# same dict objects also keeps httpx from rebuilding header mappings per call.
+# Route test modules likewise encode their constant JSON bodies once at import.
+
+IDEMP = {"Idempotency-Key": "test-key-1"}
+JSON_HEADERS = {"content-type": "application/json", **IDEMP}
+EMPTY_JSON = b"{}"
+
+
+# -------------------- Canonical adapter responses --------------------
+#
+# Adapters return the same response models the routes declare, so each common shape is
+# built once as that model and shared. FastAPI's response validation is cheapest on
+# same-type input, and there is no Mock attribute machinery to walk. Derive variants with
+# ``model_copy(update=...)`` and treat these as read-only.
+
+CUSTOMER = CustomerOut(
+    id="cus_1",
+    provider="stripe",
+    provider_customer_id="cus_123",
+    email="test@example.com",
+    name="Test Customer",
+)
+
+INTENT_REQUIRES_CONFIRMATION = IntentOut(
+    id="pi_1",
+    provider="stripe",
+    provider_intent_id="pi_1",
+    status="requires_confirmation",
+    amount=1234,
+    currency="USD",
+    client_secret="secret",
+    next_action=None,
+)
+INTENT_REQUIRES_CAPTURE = INTENT_REQUIRES_CONFIRMATION.model_copy(
+    update={"status": "requires_capture"}
+)
+INTENT_SUCCEEDED = INTENT_REQUIRES_CONFIRMATION.model_copy(update={"status": "succeeded"})
+
+INVOICE_DRAFT = InvoiceOut(
+    id="inv_1",
+    provider="stripe",
+    provider_invoice_id="inv_123",
+    provider_customer_id="cus_123",
+    status="draft",
+    amount_due=1000,
+    currency="USD",
+    hosted_invoice_url="https://invoice.stripe.com/inv_123",
+    pdf_url="https://invoice.stripe.com/inv_123.pdf",
+)
+INVOICE_OPEN = INVOICE_DRAFT.model_copy(update={"status": "open"})
+INVOICE_VOID = INVOICE_DRAFT.model_copy(
+    update={"status": "void", "amount_due": 0, "hosted_invoice_url": None, "pdf_url": None}
+)
+INVOICE_PAID = INVOICE_DRAFT.model_copy(update={"status": "paid", "amount_due": 0})
+
+PAYMENT_METHOD = PaymentMethodOut(
+    id="pm_1",
+    provider="stripe",
+    provider_customer_id="cus_1",
+    provider_method_id="pm_1",
+    brand="visa",
+    last4="4242",
+    is_default=True,
+    exp_month=12,
+    exp_year=2025,
+)
+
+PRODUCT = ProductOut(
+    id="prod_1",
+    provider="stripe",
+    provider_product_id="prod_123",
+    name="Test Product",
+    active=True,
+)
+PRICE = PriceOut(
+    id="price_1",
+    provider="stripe",
+    provider_price_id="price_123",
+    provider_product_id="prod_123",
+    currency="USD",
+    unit_amount=1000,
+    interval="month",
+    trial_days=7,
+    active=True,
+)
+
+SETUP_INTENT = SetupIntentOut(
+    id="seti_1",
+    provider="stripe",
+    provider_setup_intent_id="seti_123",
+    status="requires_payment_method",
+    client_secret="seti_123_secret_abc",
+    next_action=None,
+)
 
 
-def create_mock_object(mocker, **kwargs):
-    """Create a mock object with proper attribute values"""
-    mock_obj = mocker.Mock()
-    for key, value in kwargs.items():
-        setattr(mock_obj, key, value)
-    return mock_obj
+# -------------------- Fake adapter --------------------
 
 
-# -------------------- Fake adapter --------------------
+_ADAPTER_METHODS = (
+    # intents
+    "ensure_customer",
+    "create_intent",
+    "confirm_intent",
+    "cancel_intent",
+    "capture_intent",
+    "refund",
+    "hydrate_intent",
+    "list_intents",
+    "get_intent",
+    # methods
+    "attach_payment_method",
+    "list_payment_methods",
+    "detach_payment_method",
+    "set_default_payment_method",
+    "get_payment_method",
+    "update_payment_method",
+    # invoices
+    "create_invoice",
+    "finalize_invoice",
+    "void_invoice",
+    "pay_invoice",
+    "add_invoice_line_item",
+    "list_invoices",
+    "get_invoice",
+    "preview_invoice",
+    "list_invoice_line_items",
+    # invoice line items
+    # other endpoints used by tests
+    "verify_and_parse_webhook",
+    "list_disputes",
+    "get_dispute",
+    "submit_dispute_evidence",
+    "get_balance_snapshot",
+    "list_payouts",
+    "get_payout",
+    "create_setup_intent",
+    "confirm_setup_intent",
+    "get_setup_intent",
+    "create_usage_record",
+    "list_usage_records",
+    "get_usage_record",
+    # webhook handling
+    "handle_webhook",
+    # customer management
+    "list_customers",
+    "get_customer",
+    # product/price management
+    "create_product",
+    "get_product",
+    "list_products",
+    "update_product",
+    "create_price",
+    "get_price",
+    "list_prices",
+    "update_price",
+    # subscription management
+    "create_subscription",
+    "get_subscription",
+    "list_subscriptions",
+    "update_subscription",
+    "cancel_subscription",
+    # refund management
+    "list_refunds",
+    "get_refund",
+    # setup intents
+    "resume_intent_after_action",
+    # webhook replay
+    "replay_webhooks",
+    # service methods (not adapter methods)
+    "daily_statements_rollup",
+)
+
+
+class FakeAdapter:
+    """Hand-rolled stand-in for a ``ProviderAdapter``.
+
+    Each method is an ``AsyncMock`` created up front and held in a slot, so lookups are
+    plain attribute reads rather than ``NonCallableMagicMock``'s spec-checked child
+    creation. The slots still reject misspelled method names.
+    """
+
+    __slots__ = _ADAPTER_METHODS
+    name = "stripe"
+
+    def __init__(self):
+        for method in _ADAPTER_METHODS:
+            setattr(self, method, AsyncMock())
+
+    def reset(self) -> None:
+        for method in _ADAPTER_METHODS:
+            getattr(self, method).reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="package")
+def fake_adapter() -> FakeAdapter:
+    return FakeAdapter()
 
 
 @pytest.fixture
-def fake_adapter(mocker) -> ProviderAdapter:
-    class _FakeAdapter:
-        name = "stripe"
-        # intents
-        ensure_customer = mocker.AsyncMock()
-        create_intent = mocker.AsyncMock()
-        confirm_intent = mocker.AsyncMock()
-        cancel_intent = mocker.AsyncMock()
-        capture_intent = mocker.AsyncMock()
-        refund = mocker.AsyncMock()
-        hydrate_intent = mocker.AsyncMock()
-        list_intents = mocker.AsyncMock()
-        get_intent = mocker.AsyncMock()
-        # methods
-        attach_payment_method = mocker.AsyncMock()
-        list_payment_methods = mocker.AsyncMock()
-        detach_payment_method = mocker.AsyncMock()
-        set_default_payment_method = mocker.AsyncMock()
-        get_payment_method = mocker.AsyncMock()
-        update_payment_method = mocker.AsyncMock()
-        # invoices
-        create_invoice = mocker.AsyncMock()
-        finalize_invoice = mocker.AsyncMock()
-        void_invoice = mocker.AsyncMock()
-        pay_invoice = mocker.AsyncMock()
-        add_invoice_line_item = mocker.AsyncMock()
-        list_invoices = mocker.AsyncMock()
-        get_invoice = mocker.AsyncMock()
-        preview_invoice = mocker.AsyncMock()
-        list_invoice_line_items = mocker.AsyncMock()
-        # invoice line items
-        # other endpoints used by tests
-        verify_and_parse_webhook = mocker.AsyncMock()
-        list_disputes = mocker.AsyncMock()
-        get_dispute = mocker.AsyncMock()
-        submit_dispute_evidence = mocker.AsyncMock()
-        get_balance_snapshot = mocker.AsyncMock()
-        list_payouts = mocker.AsyncMock()
-        get_payout = mocker.AsyncMock()
-        create_setup_intent = mocker.AsyncMock()
-        confirm_setup_intent = mocker.AsyncMock()
-        get_setup_intent = mocker.AsyncMock()
-        create_usage_record = mocker.AsyncMock()
-        list_usage_records = mocker.AsyncMock()
-        get_usage_record = mocker.AsyncMock()
-        # webhook handling
-        handle_webhook = mocker.AsyncMock()
-        # customer management
-        list_customers = mocker.AsyncMock()
-        get_customer = mocker.AsyncMock()
-        # product/price management
-        create_product = mocker.AsyncMock()
-        get_product = mocker.AsyncMock()
-        list_products = mocker.AsyncMock()
-        update_product = mocker.AsyncMock()
-        create_price = mocker.AsyncMock()
-        get_price = mocker.AsyncMock()
-        list_prices = mocker.AsyncMock()
-        update_price = mocker.AsyncMock()
-        # subscription management
-        create_subscription = mocker.AsyncMock()
-        get_subscription = mocker.AsyncMock()
-        list_subscriptions = mocker.AsyncMock()
-        update_subscription = mocker.AsyncMock()
-        cancel_subscription = mocker.AsyncMock()
-        # refund management
-        list_refunds = mocker.AsyncMock()
-        get_refund = mocker.AsyncMock()
-        # setup intents
-        resume_intent_after_action = mocker.AsyncMock()
-        # webhook replay
-        replay_webhooks = mocker.AsyncMock()
-        # service methods (not adapter methods)
-        daily_statements_rollup = mocker.AsyncMock()
-
-    return mocker.NonCallableMagicMock(spec_set=_FakeAdapter)
+def program_adapter(fake_adapter):
+    """Stub one adapter method for the duration of a block and check it was awaited once.
 
+    Usage::
 
-# -------------------- Env + Stripe settings shim --------------------
+        async with program_adapter("create_invoice", INVOICE_DRAFT) as stub:
+            res = await client.post(...)
+        stub.assert_awaited_once_with(...)  # optional, for argument checks
+    """
+
+    @asynccontextmanager
+    async def _program(method: str, response):
+        stub = getattr(fake_adapter, method)
+        stub.return_value = response
+        yield stub
+        stub.assert_awaited_once()
+
+    return _program
 
 
 @pytest.fixture(autouse=True)
-def _payments_env(monkeypatch):
+def _reset_payments_state(fake_adapter, idempotency_store, db_session):
+    """Give every test a clean adapter, idempotency cache and session on the shared app."""
+    fake_adapter.reset()
+    idempotency_store._store.clear()
+    db_session.rows = []
+
+
+# -------------------- Provider registry isolation --------------------
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    """Restore the global provider registry after each test.
+
+    ``add_payments`` and direct ``register()`` calls write into a process-wide
+    registry; snapshotting it keeps adapters from leaking between tests.
+    """
+    reg = get_provider_registry()
+    before = dict(reg._adapters)
+    yield reg
+    reg._adapters.clear()
+    reg._adapters.update(before)
+
+
+# -------------------- Env + Stripe settings shim --------------------
+
+
+@pytest.fixture(scope="package", autouse=True)
+def _payments_env():
     """
     1) Force LOCAL env so user/protected routers don't enforce auth in tests.
     2) Provide Stripe-like settings objects with get_secret_value().
+
+    Package-scoped to match the shared app; the patches are undone once the
+    payments package finishes so they don't leak into other test packages.
     """
-    # (1) LOCAL env = permissive auth posture for user/protected routers
-    from svc_infra.app import env as env_mod
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # (1) LOCAL env = permissive auth posture for user/protected routers
+        from svc_infra.app import env as env_mod
 
-    monkeypatch.setattr(env_mod, "CURRENT_ENVIRONMENT", env_mod.LOCAL_ENV, raising=False)
+        monkeypatch.setattr(env_mod, "CURRENT_ENVIRONMENT", env_mod.LOCAL_ENV, raising=False)
 
-    # (2) Stripe settings shim
-    from svc_infra.apf_payments.provider import stripe as stripe_mod
+        # (2) Stripe settings shim
+        from svc_infra.apf_payments.provider import stripe as stripe_mod
 
-    class _Key:
-        def __init__(self, v: str):
-            self._v = v
+        class _Key:
+            def __init__(self, v: str):
+                self._v = v
 
-        def get_secret_value(self):
-            return self._v
+            def get_secret_value(self):
+                return self._v
 
-    fake_settings = types.SimpleNamespace(
-        stripe=types.SimpleNamespace(
-            secret_key=_Key("sk_test_123"),
-            webhook_secret=_Key("whsec_test"),  # MUST have get_secret_value()
+        fake_settings = types.SimpleNamespace(
+            stripe=types.SimpleNamespace(
+                secret_key=_Key("sk_test_123"),
+                webhook_secret=_Key("whsec_test"),  # MUST have get_secret_value()
+            )
         )
-    )
-    monkeypatch.setattr(stripe_mod, "get_payments_settings", lambda: fake_settings)
+        monkeypatch.setattr(stripe_mod, "get_payments_settings", lambda: fake_settings)
+        yield
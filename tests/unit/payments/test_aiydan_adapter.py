@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-import pytest
-
 from svc_infra.apf_payments.provider.aiydan import AiydanAdapter
 from svc_infra.apf_payments.schemas import CustomerUpsertIn
 
 
-@pytest.mark.asyncio
 async def test_aiydan_adapter_customer_and_methods(mocker):
     client = mocker.Mock()
     client.ensure_customer = mocker.AsyncMock(
@@ -44,7 +41,6 @@ async def test_aiydan_adapter_customer_and_methods(mocker):
     assert methods[0].is_default is True
 
 
-@pytest.mark.asyncio
 async def test_aiydan_adapter_list_prices_with_cursor(mocker):
     client = mocker.Mock()
     client.list_prices = mocker.AsyncMock(
@@ -75,7 +71,6 @@ async def test_aiydan_adapter_list_prices_with_cursor(mocker):
     assert prices[0].unit_amount == 1500
 
 
-@pytest.mark.asyncio
 async def test_aiydan_adapter_verify_webhook(mocker):
     client = mocker.Mock()
     client.verify_and_parse_webhook = mocker.AsyncMock(return_value={"ok": True})
@@ -92,7 +87,6 @@ async def test_aiydan_adapter_verify_webhook(mocker):
     assert result == {"ok": True}
 
 
-@pytest.mark.asyncio
 async def test_aiydan_adapter_list_customers_none(mocker):
     client = mocker.Mock()
     client.list_customers = mocker.AsyncMock(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from typing import Any
 
 import pytest
@@ -7,6 +8,7 @@ from sqlalchemy import select
 
 from svc_infra.apf_payments.models import LedgerEntry, PayIntent
 from svc_infra.apf_payments.provider.aiydan import AiydanAdapter
+from svc_infra.apf_payments.provider.registry import get_provider_registry
 from svc_infra.apf_payments.schemas import (
     BalanceSnapshotOut,
     CaptureIn,
@@ -65,6 +67,10 @@ class DummyClient:
         }
 
 
+# Deterministic ids for rows added without one; avoids a urandom call per insert.
+_id_counter = itertools.count()
+
+
 class FakeSession:
     def __init__(self):
         self._rows = []
@@ -72,9 +78,7 @@ class FakeSession:
     def add(self, obj):  # sync path used in service
         # auto id assignment if missing
         if hasattr(obj, "id") and obj.id in (None, ""):
-            import uuid
-
-            obj.id = uuid.uuid4().hex[:18]
+            obj.id = f"id_{next(_id_counter):018d}"
         self._rows.append(obj)
 
     async def flush(self):
@@ -140,15 +144,16 @@ class FakeSession:
         return _Result()
 
 
-@pytest.mark.asyncio
-async def test_balance_snapshot_and_usage_record(mocker):
-    # Setup adapter with dummy client
+@pytest.fixture
+def aiydan_adapter() -> AiydanAdapter:
+    # Registered per test; conftest's _clean_registry drops it again afterwards.
     adapter = AiydanAdapter(client=DummyClient())
-    # Inject adapter into registry manually
-    from svc_infra.apf_payments.provider.registry import get_provider_registry
+    get_provider_registry().register(adapter)
+    return adapter
 
-    reg = get_provider_registry()
-    reg.register(adapter)
+
+async def test_balance_snapshot_and_usage_record(aiydan_adapter):
+    adapter = aiydan_adapter
     fake_session = FakeSession()
     service = PaymentsService(session=fake_session, tenant_id="tenant_x", provider_name="aiydan")
 
@@ -161,13 +166,7 @@ async def test_balance_snapshot_and_usage_record(mocker):
     assert usage.action == "increment"
 
 
-@pytest.mark.asyncio
-async def test_tenant_persistence_and_ledger(mocker):
-    adapter = AiydanAdapter(client=DummyClient())
-    from svc_infra.apf_payments.provider.registry import get_provider_registry
-
-    reg = get_provider_registry()
-    reg.register(adapter)
+async def test_tenant_persistence_and_ledger(aiydan_adapter):
     fake_session = FakeSession()
     service = PaymentsService(session=fake_session, tenant_id="tenant_y", provider_name="aiydan")
 
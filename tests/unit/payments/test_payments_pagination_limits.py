@@ -1,11 +1,10 @@
-import pytest
+from svc_infra.apf_payments.schemas import IntentOut, PaymentMethodOut
 
 
-@pytest.mark.asyncio
-async def test_methods_pagination_limit_and_cursor(client, fake_adapter, mocker):
+async def test_methods_pagination_limit_and_cursor(client, fake_adapter):
     # Create 3 methods to validate windowing
     methods = [
-        mocker.Mock(
+        PaymentMethodOut(
             id=f"pm_{i}",
             provider="stripe",
             provider_customer_id="cus_1",
@@ -41,12 +40,11 @@ async def test_methods_pagination_limit_and_cursor(client, fake_adapter, mocker)
     assert len(data2["items"]) >= 1
 
 
-@pytest.mark.asyncio
-async def test_intents_pagination_limit_and_cursor(client, fake_adapter, mocker):
+async def test_intents_pagination_limit_and_cursor(client, fake_adapter):
     # Adapter returns window and cursor; route passes through
     fake_adapter.list_intents.return_value = (
         [
-            mocker.Mock(
+            IntentOut(
                 id="pi_1",
                 provider="stripe",
                 provider_intent_id="pi_1",
@@ -56,7 +54,7 @@ async def test_intents_pagination_limit_and_cursor(client, fake_adapter, mocker)
                 client_secret="secret",
                 next_action=None,
             ),
-            mocker.Mock(
+            IntentOut(
                 id="pi_2",
                 provider="stripe",
                 provider_intent_id="pi_2",
@@ -1,17 +1,16 @@
-import pytest
+from svc_infra.apf_payments.schemas import BalanceAmount, BalanceSnapshotOut, PayoutOut
 
 
-@pytest.mark.asyncio
-async def test_get_balance(client, fake_adapter, mocker):
+async def test_get_balance(client, fake_adapter):
     """Test getting balance snapshot"""
-    fake_adapter.get_balance_snapshot.return_value = mocker.Mock(
+    fake_adapter.get_balance_snapshot.return_value = BalanceSnapshotOut(
         available=[
-            mocker.Mock(currency="USD", amount=5000),
-            mocker.Mock(currency="EUR", amount=3000),
+            BalanceAmount(currency="USD", amount=5000),
+            BalanceAmount(currency="EUR", amount=3000),
         ],
         pending=[
-            mocker.Mock(currency="USD", amount=1000),
-            mocker.Mock(currency="GBP", amount=500),
+            BalanceAmount(currency="USD", amount=1000),
+            BalanceAmount(currency="GBP", amount=500),
         ],
     )
 
@@ -36,12 +35,11 @@ async def test_get_balance(client, fake_adapter, mocker):
     fake_adapter.get_balance_snapshot.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_list_payouts(client, fake_adapter, mocker):
+async def test_list_payouts(client, fake_adapter):
     """Test payout listing with pagination"""
     fake_adapter.list_payouts.return_value = (
         [
-            mocker.Mock(
+            PayoutOut(
                 id="po_1",
                 provider="stripe",
                 provider_payout_id="po_123",
@@ -51,7 +49,7 @@ async def test_list_payouts(client, fake_adapter, mocker):
                 arrival_date="2024-01-15T00:00:00Z",
                 type="bank_account",
             ),
-            mocker.Mock(
+            PayoutOut(
                 id="po_2",
                 provider="stripe",
                 provider_payout_id="po_456",
@@ -78,10 +76,9 @@ async def test_list_payouts(client, fake_adapter, mocker):
     fake_adapter.list_payouts.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_get_payout(client, fake_adapter, mocker):
+async def test_get_payout(client, fake_adapter):
     """Test getting a specific payout"""
-    fake_adapter.get_payout.return_value = mocker.Mock(
+    fake_adapter.get_payout.return_value = PayoutOut(
         id="po_1",
         provider="stripe",
         provider_payout_id="po_123",
@@ -105,10 +102,9 @@ async def test_get_payout(client, fake_adapter, mocker):
     fake_adapter.get_payout.assert_awaited_once_with("po_123")
 
 
-@pytest.mark.asyncio
-async def test_get_balance_empty(client, fake_adapter, mocker):
+async def test_get_balance_empty(client, fake_adapter):
     """Test getting balance when no funds available"""
-    fake_adapter.get_balance_snapshot.return_value = mocker.Mock(available=[], pending=[])
+    fake_adapter.get_balance_snapshot.return_value = BalanceSnapshotOut(available=[], pending=[])
 
     res = await client.get("/payments/balance")
     assert res.status_code == 200
@@ -120,8 +116,7 @@ async def test_get_balance_empty(client, fake_adapter, mocker):
     fake_adapter.get_balance_snapshot.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_list_payouts_empty(client, fake_adapter, mocker):
+async def test_list_payouts_empty(client, fake_adapter):
     """Test payout listing when no payouts exist"""
     fake_adapter.list_payouts.return_value = ([], None)
 
@@ -1,12 +1,11 @@
-import pytest
+from svc_infra.apf_payments.schemas import DisputeOut
 
 
-@pytest.mark.asyncio
-async def test_list_disputes(client, fake_adapter, mocker):
+async def test_list_disputes(client, fake_adapter):
     """Test dispute listing with pagination"""
     fake_adapter.list_disputes.return_value = (
         [
-            mocker.Mock(
+            DisputeOut(
                 id="dp_1",
                 provider="stripe",
                 provider_dispute_id="dp_123",
@@ -17,7 +16,7 @@ async def test_list_disputes(client, fake_adapter, mocker):
                 evidence_due_by="2024-12-31T23:59:59Z",
                 created_at="2024-01-01T00:00:00Z",
             ),
-            mocker.Mock(
+            DisputeOut(
                 id="dp_2",
                 provider="stripe",
                 provider_dispute_id="dp_456",
@@ -44,8 +43,7 @@ async def test_list_disputes(client, fake_adapter, mocker):
     fake_adapter.list_disputes.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_list_disputes_with_status_filter(client, fake_adapter, mocker):
+async def test_list_disputes_with_status_filter(client, fake_adapter):
     """Test dispute listing with status filter"""
     fake_adapter.list_disputes.return_value = ([], None)
 
@@ -57,10 +55,9 @@ async def test_list_disputes_with_status_filter(client, fake_adapter, mocker):
     )
 
 
-@pytest.mark.asyncio
-async def test_get_dispute(client, fake_adapter, mocker):
+async def test_get_dispute(client, fake_adapter):
     """Test getting a specific dispute"""
-    fake_adapter.get_dispute.return_value = mocker.Mock(
+    fake_adapter.get_dispute.return_value = DisputeOut(
         id="dp_1",
         provider="stripe",
         provider_dispute_id="dp_123",
@@ -84,10 +81,9 @@ async def test_get_dispute(client, fake_adapter, mocker):
     fake_adapter.get_dispute.assert_awaited_once_with("dp_123")
 
 
-@pytest.mark.asyncio
-async def test_submit_dispute_evidence(client, fake_adapter, mocker):
+async def test_submit_dispute_evidence(client, fake_adapter):
     """Test submitting dispute evidence"""
-    fake_adapter.submit_dispute_evidence.return_value = mocker.Mock(
+    fake_adapter.submit_dispute_evidence.return_value = DisputeOut(
         id="dp_1",
         provider="stripe",
         provider_dispute_id="dp_123",
@@ -120,10 +116,9 @@ async def test_submit_dispute_evidence(client, fake_adapter, mocker):
     fake_adapter.submit_dispute_evidence.assert_awaited_once_with("dp_123", evidence_data)
 
 
-@pytest.mark.asyncio
-async def test_submit_dispute_evidence_minimal(client, fake_adapter, mocker):
+async def test_submit_dispute_evidence_minimal(client, fake_adapter):
     """Test submitting minimal dispute evidence"""
-    fake_adapter.submit_dispute_evidence.return_value = mocker.Mock(
+    fake_adapter.submit_dispute_evidence.return_value = DisputeOut(
         id="dp_1",
         provider="stripe",
         provider_dispute_id="dp_123",
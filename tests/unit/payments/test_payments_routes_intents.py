@@ -1,69 +1,46 @@
-import pytest
+import json
+
+from tests.unit.payments.conftest import (
+    IDEMP,
+    INTENT_REQUIRES_CAPTURE,
+    INTENT_REQUIRES_CONFIRMATION,
+    INTENT_SUCCEEDED,
+    JSON_HEADERS,
+)
+
+CREATE_INTENT_BODY = json.dumps(
+    {"amount": 1234, "currency": "USD", "capture_method": "manual", "payment_method_types": []}
+).encode()
+CAPTURE_BODY = json.dumps({"amount": 1234}).encode()
+
+
+async def test_create_intent(client, program_adapter):
+    # stub adapter return for the duration of the request
+    async with program_adapter("create_intent", INTENT_REQUIRES_CONFIRMATION):
+        res = await client.post(
+            "/payments/intents",
+            content=CREATE_INTENT_BODY,
+            headers=JSON_HEADERS,
+        )
 
-IDEMP = {"Idempotency-Key": "test-key-1"}
-
-
-@pytest.mark.asyncio
-async def test_create_intent(client, fake_adapter, mocker):
-    # stub adapter return
-    fake_adapter.create_intent.return_value = mocker.Mock(
-        id="pi_1",
-        provider="stripe",
-        provider_intent_id="pi_1",
-        status="requires_confirmation",
-        amount=1234,
-        currency="USD",
-        client_secret="secret",
-        next_action=None,
-    )
-
-    res = await client.post(
-        "/payments/intents",
-        json={
-            "amount": 1234,
-            "currency": "USD",
-            "capture_method": "manual",
-            "payment_method_types": [],
-        },
-        headers=IDEMP,
-    )
     assert res.status_code == 201
     body = res.json()
     assert body["provider_intent_id"] == "pi_1"
     # Location header points to GET intent
     assert res.headers["Location"].endswith("/payments/intents/pi_1")
 
-    fake_adapter.create_intent.assert_awaited_once()
 
-
-@pytest.mark.asyncio
-async def test_confirm_cancel_capture_flow(client, fake_adapter, mocker):
-    fake_adapter.confirm_intent.return_value = mocker.Mock(
-        id="pi_1",
-        provider="stripe",
-        provider_intent_id="pi_1",
-        status="requires_capture",
-        amount=1234,
-        currency="USD",
-        client_secret="secret",
-        next_action=None,
-    )
-    fake_adapter.capture_intent.return_value = mocker.Mock(
-        id="pi_1",
-        provider="stripe",
-        provider_intent_id="pi_1",
-        status="succeeded",
-        amount=1234,
-        currency="USD",
-        client_secret="secret",
-        next_action=None,
-    )
+async def test_confirm_cancel_capture_flow(client, fake_adapter):
+    fake_adapter.confirm_intent.return_value = INTENT_REQUIRES_CAPTURE
+    fake_adapter.capture_intent.return_value = INTENT_SUCCEEDED
 
     res = await client.post("/payments/intents/pi_1/confirm", headers=IDEMP)
     assert res.status_code == 200
     assert res.json()["status"] == "requires_capture"
 
-    res = await client.post("/payments/intents/pi_1/capture", json={"amount": 1234}, headers=IDEMP)
+    res = await client.post(
+        "/payments/intents/pi_1/capture", content=CAPTURE_BODY, headers=JSON_HEADERS
+    )
     assert res.status_code == 200
     assert res.json()["status"] == "succeeded"
 
@@ -0,0 +1,98 @@
+from unittest.mock import call
+
+import pytest
+
+from svc_infra.apf_payments.schemas import CustomersListFilter, InvoicesListFilter
+from tests.unit.payments.conftest import (
+    INTENT_REQUIRES_CAPTURE,
+    INTENT_SUCCEEDED,
+    INVOICE_OPEN,
+    INVOICE_PAID,
+    PRICE,
+    PRODUCT,
+)
+
+INTENT_2 = INTENT_REQUIRES_CAPTURE.model_copy(update={"id": "pi_2", "provider_intent_id": "pi_2"})
+INVOICE_456 = INVOICE_PAID.model_copy(
+    update={
+        "id": "inv_2",
+        "provider_invoice_id": "inv_456",
+        "hosted_invoice_url": "https://invoice.stripe.com/inv_456",
+        "pdf_url": "https://invoice.stripe.com/inv_456.pdf",
+    }
+)
+PRODUCT_456 = PRODUCT.model_copy(
+    update={"id": "prod_2", "provider_product_id": "prod_456", "active": False}
+)
+PRICE_456 = PRICE.model_copy(
+    update={
+        "id": "price_2",
+        "provider_price_id": "price_456",
+        "unit_amount": 2000,
+        "interval": "year",
+        "trial_days": None,
+    }
+)
+
+
+@pytest.mark.parametrize(
+    ("path", "adapter_method", "items", "id_field"),
+    [
+        ("/payments/intents", "list_intents", [INTENT_SUCCEEDED, INTENT_2], "provider_intent_id"),
+        ("/payments/invoices", "list_invoices", [INVOICE_OPEN, INVOICE_456], "provider_invoice_id"),
+        ("/payments/products", "list_products", [PRODUCT, PRODUCT_456], "provider_product_id"),
+        ("/payments/prices", "list_prices", [PRICE, PRICE_456], "provider_price_id"),
+    ],
+    ids=["intents", "invoices", "products", "prices"],
+)
+async def test_list_endpoint_pagination(
+    client, fake_adapter, path, adapter_method, items, id_field
+):
+    """Test list endpoints pass through the adapter's page and cursor"""
+    getattr(fake_adapter, adapter_method).return_value = (items, "cursor_next")
+
+    res = await client.get(path)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["next_cursor"] == "cursor_next"
+    assert [item[id_field] for item in body["items"]] == [getattr(item, id_field) for item in items]
+
+    getattr(fake_adapter, adapter_method).assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ("path", "adapter_method", "expected"),
+    [
+        (
+            "/payments/customers?provider=stripe&user_id=user_123",
+            "list_customers",
+            call(CustomersListFilter(provider="stripe", user_id="user_123", limit=50, cursor=None)),
+        ),
+        (
+            "/payments/invoices?customer_provider_id=cus_123&status=open",
+            "list_invoices",
+            call(InvoicesListFilter(customer_provider_id="cus_123", status="open", limit=50)),
+        ),
+        (
+            "/payments/products?active=true",
+            "list_products",
+            call(active=True, limit=50, cursor=None),
+        ),
+        (
+            "/payments/prices?provider_product_id=prod_123&active=true",
+            "list_prices",
+            call(provider_product_id="prod_123", active=True, limit=50, cursor=None),
+        ),
+    ],
+    ids=["customers", "invoices", "products", "prices"],
+)
+async def test_list_endpoint_filters(client, fake_adapter, path, adapter_method, expected):
+    """Test list endpoints forward query filters and the default page size"""
+    getattr(fake_adapter, adapter_method).return_value = ([], None)
+
+    res = await client.get(path)
+    assert res.status_code == 200
+
+    getattr(fake_adapter, adapter_method).assert_awaited_once_with(
+        *expected.args, **expected.kwargs
+    )
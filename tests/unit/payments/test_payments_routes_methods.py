@@ -1,43 +1,20 @@
-import pytest
+import json
 
-IDEMP = {"Idempotency-Key": "k2"}
+from tests.unit.payments.conftest import JSON_HEADERS, PAYMENT_METHOD
 
+ATTACH_METHOD_BODY = json.dumps(
+    {"customer_provider_id": "cus_1", "payment_method_token": "pm_1", "make_default": True}
+).encode()
 
-@pytest.mark.asyncio
-async def test_attach_and_list_methods(client, fake_adapter, mocker):
-    fake_adapter.attach_payment_method.return_value = mocker.Mock(
-        id="pm_1",
-        provider="stripe",
-        provider_customer_id="cus_1",
-        provider_method_id="pm_1",
-        brand="visa",
-        last4="4242",
-        is_default=True,
-        exp_month=12,
-        exp_year=2025,
-    )
-    fake_adapter.list_payment_methods.return_value = [
-        mocker.Mock(
-            id="pm_1",
-            provider="stripe",
-            provider_customer_id="cus_1",
-            provider_method_id="pm_1",
-            brand="visa",
-            last4="4242",
-            is_default=True,
-            exp_month=12,
-            exp_year=2025,
-        )
-    ]
+
+async def test_attach_and_list_methods(client, fake_adapter):
+    fake_adapter.attach_payment_method.return_value = PAYMENT_METHOD
+    fake_adapter.list_payment_methods.return_value = [PAYMENT_METHOD]
 
     res = await client.post(
         "/payments/methods/attach",
-        json={
-            "customer_provider_id": "cus_1",
-            "payment_method_token": "pm_1",
-            "make_default": True,
-        },
-        headers=IDEMP,
+        content=ATTACH_METHOD_BODY,
+        headers=JSON_HEADERS,
     )
     assert res.status_code == 201
     assert res.json()["provider_method_id"] == "pm_1"
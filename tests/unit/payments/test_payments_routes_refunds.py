@@ -1,12 +1,11 @@
-import pytest
+from svc_infra.apf_payments.schemas import RefundOut
 
 
-@pytest.mark.asyncio
-async def test_list_refunds(client, fake_adapter, mocker):
+async def test_list_refunds(client, fake_adapter):
     """Test refund listing with pagination"""
     fake_adapter.list_refunds.return_value = (
         [
-            mocker.Mock(
+            RefundOut(
                 id="re_1",
                 provider="stripe",
                 provider_refund_id="re_123",
@@ -17,7 +16,7 @@ async def test_list_refunds(client, fake_adapter, mocker):
                 reason="requested_by_customer",
                 created_at="2024-01-01T00:00:00Z",
             ),
-            mocker.Mock(
+            RefundOut(
                 id="re_2",
                 provider="stripe",
                 provider_refund_id="re_456",
@@ -45,8 +44,7 @@ async def test_list_refunds(client, fake_adapter, mocker):
     fake_adapter.list_refunds.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_list_refunds_with_payment_intent_filter(client, fake_adapter, mocker):
+async def test_list_refunds_with_payment_intent_filter(client, fake_adapter):
     """Test refund listing filtered by payment intent"""
     fake_adapter.list_refunds.return_value = ([], None)
 
@@ -58,10 +56,9 @@ async def test_list_refunds_with_payment_intent_filter(client, fake_adapter, moc
     )
 
 
-@pytest.mark.asyncio
-async def test_get_refund(client, fake_adapter, mocker):
+async def test_get_refund(client, fake_adapter):
     """Test getting a specific refund"""
-    fake_adapter.get_refund.return_value = mocker.Mock(
+    fake_adapter.get_refund.return_value = RefundOut(
         id="re_1",
         provider="stripe",
         provider_refund_id="re_123",
@@ -87,8 +84,7 @@ async def test_get_refund(client, fake_adapter, mocker):
     fake_adapter.get_refund.assert_awaited_once_with("re_123")
 
 
-@pytest.mark.asyncio
-async def test_list_refunds_empty(client, fake_adapter, mocker):
+async def test_list_refunds_empty(client, fake_adapter):
     """Test refund listing when no refunds exist"""
     fake_adapter.list_refunds.return_value = ([], None)
 
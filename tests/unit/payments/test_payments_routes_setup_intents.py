@@ -1,130 +1,79 @@
-import pytest
-
-IDEMP = {"Idempotency-Key": "setup-intent-test-1"}
+import json
 
+import pytest
 
-@pytest.mark.asyncio
-async def test_create_setup_intent(client, fake_adapter, mocker):
-    """Test setup intent creation for 3DS/SCA"""
-    fake_adapter.create_setup_intent.return_value = mocker.Mock(
-        id="seti_1",
-        provider="stripe",
-        provider_setup_intent_id="seti_123",
-        status="requires_payment_method",
-        client_secret="seti_123_secret_abc",
-        next_action=None,
-    )
-
-    res = await client.post(
-        "/payments/setup_intents",
-        json={"payment_method_types": ["card"]},
-        headers=IDEMP,
-    )
+from svc_infra.apf_payments.schemas import NextAction
+from tests.unit.payments.conftest import IDEMP, INTENT_SUCCEEDED, JSON_HEADERS, SETUP_INTENT
+
+CREATE_SETUP_INTENT_BODY = json.dumps({"payment_method_types": ["card"]}).encode()
+
+SETUP_INTENT_SUCCEEDED = SETUP_INTENT.model_copy(update={"status": "succeeded"})
+SETUP_INTENT_REQUIRES_ACTION = SETUP_INTENT.model_copy(update={"status": "requires_action"})
+SETUP_INTENT_3DS = SETUP_INTENT_REQUIRES_ACTION.model_copy(
+    update={
+        "next_action": NextAction(type="use_stripe_sdk", data={"type": "three_d_secure_redirect"}),
+    }
+)
+INTENT_RESUMED = INTENT_SUCCEEDED.model_copy(
+    update={"provider_intent_id": "pi_123", "amount": 1000, "client_secret": "pi_123_secret_abc"}
+)
+
+
+@pytest.mark.parametrize("setup_intent", [SETUP_INTENT, SETUP_INTENT_3DS], ids=["no_action", "3ds"])
+async def test_create_setup_intent(client, program_adapter, setup_intent):
+    """Test setup intent creation for 3DS/SCA, with and without a pending next_action"""
+    async with program_adapter("create_setup_intent", setup_intent):
+        res = await client.post(
+            "/payments/setup_intents",
+            content=CREATE_SETUP_INTENT_BODY,
+            headers=JSON_HEADERS,
+        )
 
     assert res.status_code == 201
-    body = res.json()
-    assert body["provider_setup_intent_id"] == "seti_123"
-    assert body["status"] == "requires_payment_method"
-    assert body["client_secret"] == "seti_123_secret_abc"
-
-    fake_adapter.create_setup_intent.assert_awaited_once()
+    assert res.json() == setup_intent.model_dump()
+
+
+@pytest.mark.parametrize(
+    ("http_method", "path", "adapter_method", "setup_intent"),
+    [
+        (
+            "POST",
+            "/payments/setup_intents/seti_123/confirm",
+            "confirm_setup_intent",
+            SETUP_INTENT_SUCCEEDED,
+        ),
+        (
+            "GET",
+            "/payments/setup_intents/seti_123",
+            "get_setup_intent",
+            SETUP_INTENT_REQUIRES_ACTION,
+        ),
+    ],
+    ids=["confirm", "get"],
+)
+async def test_setup_intent_by_id(
+    client, program_adapter, http_method, path, adapter_method, setup_intent
+):
+    """Test confirming and fetching a specific setup intent"""
+    async with program_adapter(adapter_method, setup_intent) as stub:
+        res = await client.request(http_method, path, headers=IDEMP)
 
-
-@pytest.mark.asyncio
-async def test_confirm_setup_intent(client, fake_adapter, mocker):
-    """Test setup intent confirmation"""
-    fake_adapter.confirm_setup_intent.return_value = mocker.Mock(
-        id="seti_1",
-        provider="stripe",
-        provider_setup_intent_id="seti_123",
-        status="succeeded",
-        client_secret="seti_123_secret_abc",
-        next_action=None,
-    )
-
-    res = await client.post("/payments/setup_intents/seti_123/confirm", headers=IDEMP)
     assert res.status_code == 200
     body = res.json()
     assert body["provider_setup_intent_id"] == "seti_123"
-    assert body["status"] == "succeeded"
-
-    fake_adapter.confirm_setup_intent.assert_awaited_once_with("seti_123")
-
-
-@pytest.mark.asyncio
-async def test_get_setup_intent(client, fake_adapter, mocker):
-    """Test getting a specific setup intent"""
-    fake_adapter.get_setup_intent.return_value = mocker.Mock(
-        id="seti_1",
-        provider="stripe",
-        provider_setup_intent_id="seti_123",
-        status="requires_action",
-        client_secret="seti_123_secret_abc",
-        next_action=mocker.Mock(type="use_stripe_sdk", data={"type": "three_d_secure_redirect"}),
-    )
-
-    res = await client.get("/payments/setup_intents/seti_123")
-    assert res.status_code == 200
-    body = res.json()
-    assert body["provider_setup_intent_id"] == "seti_123"
-    assert body["status"] == "requires_action"
+    assert body["status"] == setup_intent.status
     assert body["client_secret"] == "seti_123_secret_abc"
+    stub.assert_awaited_once_with("seti_123")
 
-    fake_adapter.get_setup_intent.assert_awaited_once_with("seti_123")
-
-
-@pytest.mark.asyncio
-async def test_setup_intent_with_3ds_action(client, fake_adapter, mocker):
-    """Test setup intent that requires 3DS authentication"""
-    # Mock the next_action object properly
-    next_action_mock = mocker.Mock()
-    next_action_mock.type = "use_stripe_sdk"
-    next_action_mock.data = {"type": "three_d_secure_redirect"}
-
-    fake_adapter.create_setup_intent.return_value = mocker.Mock(
-        id="seti_1",
-        provider="stripe",
-        provider_setup_intent_id="seti_123",
-        status="requires_action",
-        client_secret="seti_123_secret_abc",
-        next_action=next_action_mock,
-    )
-
-    res = await client.post(
-        "/payments/setup_intents",
-        json={"payment_method_types": ["card"]},
-        headers=IDEMP,
-    )
 
-    assert res.status_code == 201
-    body = res.json()
-    assert body["provider_setup_intent_id"] == "seti_123"
-    assert body["status"] == "requires_action"
-    assert body["next_action"]["type"] == "use_stripe_sdk"
-    assert body["next_action"]["data"]["type"] == "three_d_secure_redirect"
-
-    fake_adapter.create_setup_intent.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_resume_intent_after_action(client, fake_adapter, mocker):
+async def test_resume_intent_after_action(client, program_adapter):
     """Test resuming payment intent after 3DS/SCA action"""
-    fake_adapter.resume_intent_after_action.return_value = mocker.Mock(
-        id="pi_1",
-        provider="stripe",
-        provider_intent_id="pi_123",
-        status="succeeded",
-        amount=1000,
-        currency="USD",
-        client_secret="pi_123_secret_abc",
-        next_action=None,
-    )
+    async with program_adapter("resume_intent_after_action", INTENT_RESUMED) as stub:
+        res = await client.post("/payments/intents/pi_123/resume", headers=IDEMP)
 
-    res = await client.post("/payments/intents/pi_123/resume", headers=IDEMP)
     assert res.status_code == 200
     body = res.json()
     assert body["provider_intent_id"] == "pi_123"
     assert body["status"] == "succeeded"
     assert body["amount"] == 1000
-
-    fake_adapter.resume_intent_after_action.assert_awaited_once_with("pi_123")
+    stub.assert_awaited_once_with("pi_123")
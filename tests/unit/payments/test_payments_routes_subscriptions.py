@@ -1,12 +1,11 @@
-import pytest
+from svc_infra.apf_payments.schemas import SubscriptionOut
 
 IDEMP = {"Idempotency-Key": "subscription-test-1"}
 
 
-@pytest.mark.asyncio
-async def test_create_subscription(client, fake_adapter, mocker):
+async def test_create_subscription(client, fake_adapter):
     """Test subscription creation"""
-    fake_adapter.create_subscription.return_value = mocker.Mock(
+    fake_adapter.create_subscription.return_value = SubscriptionOut(
         id="sub_1",
         provider="stripe",
         provider_subscription_id="sub_123",
@@ -40,10 +39,9 @@ async def test_create_subscription(client, fake_adapter, mocker):
     fake_adapter.create_subscription.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_get_subscription(client, fake_adapter, mocker):
+async def test_get_subscription(client, fake_adapter):
     """Test getting a specific subscription"""
-    fake_adapter.get_subscription.return_value = mocker.Mock(
+    fake_adapter.get_subscription.return_value = SubscriptionOut(
         id="sub_1",
         provider="stripe",
         provider_subscription_id="sub_123",
@@ -64,12 +62,11 @@ async def test_get_subscription(client, fake_adapter, mocker):
     fake_adapter.get_subscription.assert_awaited_once_with("sub_123")
 
 
-@pytest.mark.asyncio
-async def test_list_subscriptions(client, fake_adapter, mocker):
+async def test_list_subscriptions(client, fake_adapter):
     """Test subscription listing with pagination"""
     fake_adapter.list_subscriptions.return_value = (
         [
-            mocker.Mock(
+            SubscriptionOut(
                 id="sub_1",
                 provider="stripe",
                 provider_subscription_id="sub_123",
@@ -79,7 +76,7 @@ async def test_list_subscriptions(client, fake_adapter, mocker):
                 cancel_at_period_end=False,
                 current_period_end="2024-12-31T23:59:59Z",
             ),
-            mocker.Mock(
+            SubscriptionOut(
                 id="sub_2",
                 provider="stripe",
                 provider_subscription_id="sub_456",
@@ -103,8 +100,7 @@ async def test_list_subscriptions(client, fake_adapter, mocker):
     fake_adapter.list_subscriptions.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_list_subscriptions_with_filters(client, fake_adapter, mocker):
+async def test_list_subscriptions_with_filters(client, fake_adapter):
     """Test subscription listing with filters"""
     fake_adapter.list_subscriptions.return_value = ([], None)
 
@@ -116,10 +112,9 @@ async def test_list_subscriptions_with_filters(client, fake_adapter, mocker):
     )
 
 
-@pytest.mark.asyncio
-async def test_update_subscription(client, fake_adapter, mocker):
+async def test_update_subscription(client, fake_adapter):
     """Test subscription update"""
-    fake_adapter.update_subscription.return_value = mocker.Mock(
+    fake_adapter.update_subscription.return_value = SubscriptionOut(
         id="sub_1",
         provider="stripe",
         provider_subscription_id="sub_123",
@@ -150,10 +145,9 @@ async def test_update_subscription(client, fake_adapter, mocker):
     fake_adapter.update_subscription.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_cancel_subscription(client, fake_adapter, mocker):
+async def test_cancel_subscription(client, fake_adapter):
     """Test subscription cancellation"""
-    fake_adapter.cancel_subscription.return_value = mocker.Mock(
+    fake_adapter.cancel_subscription.return_value = SubscriptionOut(
         id="sub_1",
         provider="stripe",
         provider_subscription_id="sub_123",
@@ -178,10 +172,9 @@ async def test_cancel_subscription(client, fake_adapter, mocker):
     fake_adapter.cancel_subscription.assert_awaited_once_with("sub_123", True)
 
 
-@pytest.mark.asyncio
-async def test_cancel_subscription_immediate(client, fake_adapter, mocker):
+async def test_cancel_subscription_immediate(client, fake_adapter):
     """Test immediate subscription cancellation"""
-    fake_adapter.cancel_subscription.return_value = mocker.Mock(
+    fake_adapter.cancel_subscription.return_value = SubscriptionOut(
         id="sub_1",
         provider="stripe",
         provider_subscription_id="sub_123",
@@ -1,92 +1,92 @@
-import pytest
+from datetime import datetime
+from types import SimpleNamespace
 
+from svc_infra.apf_payments.schemas import StatementRow
 
-@pytest.mark.asyncio
-async def test_list_transactions(client, fake_adapter, mocker):
-    """Test transaction listing from ledger entries"""
-    # Mock the database query result
-    from datetime import datetime
-
-    # Create mock ledger entries
-    mock_entries = [
-        mocker.Mock(
-            id="le_1",
-            ts=datetime(2024, 1, 1, 12, 0, 0),
-            kind="payment",
-            amount=1000,
-            currency="USD",
-            status="posted",
-            provider="stripe",
-            provider_ref="pi_123",
-            user_id="user_123",
-        ),
-        mocker.Mock(
-            id="le_2",
-            ts=datetime(2024, 1, 2, 12, 0, 0),
-            kind="refund",
-            amount=500,
-            currency="USD",
-            status="posted",
-            provider="stripe",
-            provider_ref="re_123",
-            user_id="user_123",
-        ),
-        mocker.Mock(
-            id="le_3",
-            ts=datetime(2024, 1, 3, 12, 0, 0),
-            kind="fee",
-            amount=50,
-            currency="USD",
-            status="posted",
-            provider="stripe",
-            provider_ref="fee_123",
-            user_id="user_123",
-        ),
-    ]
-
-    # Mock the session execute method to return our mock entries
-    async def mock_execute(query):
-        class MockResult:
-            def scalars(self):
-                return self
+LEDGER_ENTRIES = [
+    SimpleNamespace(
+        id="le_1",
+        ts=datetime(2024, 1, 1, 12, 0, 0),
+        kind="payment",
+        amount=1000,
+        currency="USD",
+        status="posted",
+        provider="stripe",
+        provider_ref="pi_123",
+        user_id="user_123",
+    ),
+    SimpleNamespace(
+        id="le_2",
+        ts=datetime(2024, 1, 2, 12, 0, 0),
+        kind="refund",
+        amount=500,
+        currency="USD",
+        status="posted",
+        provider="stripe",
+        provider_ref="re_123",
+        user_id="user_123",
+    ),
+    SimpleNamespace(
+        id="le_3",
+        ts=datetime(2024, 1, 3, 12, 0, 0),
+        kind="fee",
+        amount=50,
+        currency="USD",
+        status="posted",
+        provider="stripe",
+        provider_ref="fee_123",
+        user_id="user_123",
+    ),
+]
 
-            def all(self):
-                return mock_entries
+STATEMENT_ROWS = [
+    StatementRow(
+        period_start="2024-01-01T00:00:00+00:00",
+        period_end="2024-01-01T23:59:59+00:00",
+        currency="USD",
+        gross=1000,
+        refunds=500,
+        fees=50,
+        net=450,
+        count=3,
+    )
+]
 
-        return MockResult()
 
-    # We need to patch the session in the service
-    # This is a bit complex since we need to mock the database query
-    # For now, let's test the endpoint structure
+async def test_list_transactions(client, db_session):
+    """Test transaction listing from ledger entries"""
+    db_session.rows = LEDGER_ENTRIES
 
     res = await client.get("/payments/transactions")
-    # This will fail because we don't have real database entries
-    # But we can verify the endpoint exists and returns the right structure
-    assert res.status_code in [200, 500]  # 500 if no data, 200 if mock data works
+    assert res.status_code == 200
+    body = res.json()
+    # Newest first
+    assert [item["id"] for item in body["items"]] == ["le_3", "le_2", "le_1"]
+    assert [item["type"] for item in body["items"]] == ["fee", "refund", "payment"]
+    assert body["items"][0]["ts"] == "2024-01-03T12:00:00"
+    assert body["next_cursor"] is None
 
 
-@pytest.mark.asyncio
-async def test_daily_statements(client, fake_adapter, mocker):
+async def test_daily_statements(client, fake_adapter):
     """Test daily statements rollup"""
-    # Mock the service method directly
-    from svc_infra.apf_payments.schemas import StatementRow
-
-    _ = StatementRow
-
-    # We need to mock the service method
-    # This is complex because it involves database queries
-    # For now, let's test the endpoint structure
+    fake_adapter.daily_statements_rollup.return_value = STATEMENT_ROWS
 
     res = await client.get("/payments/statements/daily")
-    # This will fail because we don't have real database entries
-    # But we can verify the endpoint exists
-    assert res.status_code in [200, 500]  # 500 if no data, 200 if mock data works
+    assert res.status_code == 200
+    body = res.json()
+    assert len(body) == 1
+    assert body[0]["net"] == 450
+    assert body[0]["count"] == 3
+
+    fake_adapter.daily_statements_rollup.assert_awaited_once_with(None, None)
 
 
-@pytest.mark.asyncio
-async def test_daily_statements_with_date_filters(client, fake_adapter, mocker):
+async def test_daily_statements_with_date_filters(client, fake_adapter):
     """Test daily statements with date range filters"""
+    fake_adapter.daily_statements_rollup.return_value = []
+
     res = await client.get("/payments/statements/daily?date_from=2024-01-01&date_to=2024-01-31")
-    # This will fail because we don't have real database entries
-    # But we can verify the endpoint exists and accepts parameters
-    assert res.status_code in [200, 500]  # 500 if no data, 200 if mock data works
+    assert res.status_code == 200
+    assert res.json() == []
+
+    fake_adapter.daily_statements_rollup.assert_awaited_once_with("2024-01-01", "2024-01-31")
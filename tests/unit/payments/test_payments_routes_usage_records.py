@@ -1,177 +1,97 @@
-import pytest
-
-IDEMP = {"Idempotency-Key": "usage-record-test-1"}
-
-
-@pytest.mark.asyncio
-async def test_create_usage_record(client, fake_adapter, mocker):
-    """Test usage record creation for metered billing"""
-    fake_adapter.create_usage_record.return_value = mocker.Mock(
-        id="ur_1",
-        quantity=100,
-        timestamp=1704067200,
-        subscription_item="si_123",
-        provider_price_id="price_123",
-        action="increment",
-    )
-
-    res = await client.post(
-        "/payments/usage_records",
-        json={
-            "subscription_item": "si_123",
-            "provider_price_id": "price_123",
-            "quantity": 100,
-            "timestamp": 1704067200,
-            "action": "increment",
-        },
-        headers=IDEMP,
-    )
-
-    assert res.status_code == 201
-    body = res.json()
-    assert body["id"] == "ur_1"
-    assert body["quantity"] == 100
-    assert body["timestamp"] == 1704067200
-    assert body["subscription_item"] == "si_123"
-    assert body["provider_price_id"] == "price_123"
-
-    fake_adapter.create_usage_record.assert_awaited_once()
+import json
 
+import pytest
 
-@pytest.mark.asyncio
-async def test_create_usage_record_with_set_action(client, fake_adapter, mocker):
-    """Test usage record creation with set action"""
-    fake_adapter.create_usage_record.return_value = mocker.Mock(
-        id="ur_2",
-        quantity=250,
-        timestamp=1704067200,
-        subscription_item="si_456",
-        provider_price_id="price_456",
-        action="set",
-    )
-
-    res = await client.post(
-        "/payments/usage_records",
-        json={
+from svc_infra.apf_payments.schemas import UsageRecordListFilter, UsageRecordOut
+from tests.unit.payments.conftest import JSON_HEADERS
+
+RECORD_INCREMENT = UsageRecordOut(
+    id="ur_1",
+    quantity=100,
+    timestamp=1704067200,
+    subscription_item="si_123",
+    provider_price_id="price_123",
+    action="increment",
+)
+RECORD_SET = UsageRecordOut(
+    id="ur_2",
+    quantity=250,
+    timestamp=1704067200,
+    subscription_item="si_456",
+    provider_price_id="price_456",
+    action="set",
+)
+RECORDS_PAGE = [
+    RECORD_INCREMENT,
+    RECORD_INCREMENT.model_copy(update={"id": "ur_2", "quantity": 150, "timestamp": 1704153600}),
+    RECORD_INCREMENT.model_copy(
+        update={
+            "id": "ur_3",
+            "quantity": 200,
+            "timestamp": 1704240000,
             "subscription_item": "si_456",
             "provider_price_id": "price_456",
-            "quantity": 250,
-            "timestamp": 1704067200,
-            "action": "set",
-        },
-        headers=IDEMP,
-    )
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("record", "body"),
+    [
+        (record, json.dumps(record.model_dump(exclude={"id"})).encode())
+        for record in (RECORD_INCREMENT, RECORD_SET)
+    ],
+    ids=["increment", "set"],
+)
+async def test_create_usage_record(client, program_adapter, record, body):
+    """Test usage record creation for metered billing"""
+    async with program_adapter("create_usage_record", record):
+        res = await client.post("/payments/usage_records", content=body, headers=JSON_HEADERS)
 
     assert res.status_code == 201
-    body = res.json()
-    assert body["id"] == "ur_2"
-    assert body["quantity"] == 250
-    assert body["action"] == "set"
-
-    fake_adapter.create_usage_record.assert_awaited_once()
+    assert res.json() == record.model_dump()
+
+
+@pytest.mark.parametrize(
+    ("query", "records", "next_cursor", "expected_filter"),
+    [
+        ("", RECORDS_PAGE, "cursor_next", UsageRecordListFilter()),
+        (
+            "?subscription_item=si_123",
+            [],
+            None,
+            UsageRecordListFilter(subscription_item="si_123"),
+        ),
+        (
+            "?provider_price_id=price_123",
+            [],
+            None,
+            UsageRecordListFilter(provider_price_id="price_123"),
+        ),
+        ("", [], None, UsageRecordListFilter()),
+    ],
+    ids=["page", "subscription_item_filter", "provider_price_filter", "empty"],
+)
+async def test_list_usage_records(
+    client, program_adapter, query, records, next_cursor, expected_filter
+):
+    """Test usage record listing, filters and the empty page"""
+    async with program_adapter("list_usage_records", (records, next_cursor)) as stub:
+        res = await client.get(f"/payments/usage_records{query}")
 
-
-@pytest.mark.asyncio
-async def test_list_usage_records(client, fake_adapter, mocker):
-    """Test usage record listing with pagination"""
-    fake_adapter.list_usage_records.return_value = (
-        [
-            mocker.Mock(
-                id="ur_1",
-                quantity=100,
-                timestamp=1704067200,
-                subscription_item="si_123",
-                provider_price_id="price_123",
-                action="increment",
-            ),
-            mocker.Mock(
-                id="ur_2",
-                quantity=150,
-                timestamp=1704153600,
-                subscription_item="si_123",
-                provider_price_id="price_123",
-                action="increment",
-            ),
-            mocker.Mock(
-                id="ur_3",
-                quantity=200,
-                timestamp=1704240000,
-                subscription_item="si_456",
-                provider_price_id="price_456",
-                action="increment",
-            ),
-        ],
-        "cursor_next",
-    )
-
-    res = await client.get("/payments/usage_records")
     assert res.status_code == 200
     body = res.json()
-    assert len(body["items"]) == 3
-    assert body["next_cursor"] == "cursor_next"
-    assert body["items"][0]["id"] == "ur_1"
-    assert body["items"][0]["quantity"] == 100
-    assert body["items"][0]["subscription_item"] == "si_123"
-
-    fake_adapter.list_usage_records.assert_awaited_once()
-
+    assert body["items"] == [record.model_dump() for record in records]
+    assert body["next_cursor"] == next_cursor
+    stub.assert_awaited_once_with(expected_filter)
 
-@pytest.mark.asyncio
-async def test_list_usage_records_with_subscription_item_filter(client, fake_adapter, mocker):
-    """Test usage record listing filtered by subscription item"""
-    fake_adapter.list_usage_records.return_value = ([], None)
 
-    res = await client.get("/payments/usage_records?subscription_item=si_123")
-    assert res.status_code == 200
-
-    fake_adapter.list_usage_records.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_list_usage_records_with_provider_price_filter(client, fake_adapter, mocker):
-    """Test usage record listing filtered by provider price"""
-    fake_adapter.list_usage_records.return_value = ([], None)
-
-    res = await client.get("/payments/usage_records?provider_price_id=price_123")
-    assert res.status_code == 200
-
-    fake_adapter.list_usage_records.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_get_usage_record(client, fake_adapter, mocker):
+async def test_get_usage_record(client, program_adapter):
     """Test getting a specific usage record"""
-    fake_adapter.get_usage_record.return_value = mocker.Mock(
-        id="ur_1",
-        quantity=100,
-        timestamp=1704067200,
-        subscription_item="si_123",
-        provider_price_id="price_123",
-        action="increment",
-    )
+    async with program_adapter("get_usage_record", RECORD_INCREMENT) as stub:
+        res = await client.get("/payments/usage_records/ur_1")
 
-    res = await client.get("/payments/usage_records/ur_1")
     assert res.status_code == 200
-    body = res.json()
-    assert body["id"] == "ur_1"
-    assert body["quantity"] == 100
-    assert body["timestamp"] == 1704067200
-    assert body["subscription_item"] == "si_123"
-    assert body["provider_price_id"] == "price_123"
-
-    fake_adapter.get_usage_record.assert_awaited_once_with("ur_1")
-
-
-@pytest.mark.asyncio
-async def test_list_usage_records_empty(client, fake_adapter, mocker):
-    """Test usage record listing when no records exist"""
-    fake_adapter.list_usage_records.return_value = ([], None)
-
-    res = await client.get("/payments/usage_records")
-    assert res.status_code == 200
-    body = res.json()
-
-    assert len(body["items"]) == 0
-    assert body["next_cursor"] is None
-
-    fake_adapter.list_usage_records.assert_awaited_once()
+    assert res.json() == RECORD_INCREMENT.model_dump()
+    stub.assert_awaited_once_with("ur_1")
@@ -1,249 +1,110 @@
-import pytest
-
-IDEMP = {"Idempotency-Key": "validation-test-1"}
-
-
-@pytest.mark.asyncio
-async def test_create_intent_invalid_currency(client, fake_adapter):
-    """Test payment intent creation with invalid currency"""
-    res = await client.post(
-        "/payments/intents",
-        json={
-            "amount": 1000,
-            "currency": "INVALID",  # Invalid currency code
-            "capture_method": "automatic",
-            "payment_method_types": ["card"],
-        },
-        headers=IDEMP,
-    )
-
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
-
-
-@pytest.mark.asyncio
-async def test_create_intent_negative_amount(client, fake_adapter):
-    """Test payment intent creation with negative amount"""
-    res = await client.post(
-        "/payments/intents",
-        json={
-            "amount": -1000,  # Negative amount
-            "currency": "USD",
-            "capture_method": "automatic",
-            "payment_method_types": ["card"],
-        },
-        headers=IDEMP,
-    )
-
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
-
-
-@pytest.mark.asyncio
-async def test_create_intent_missing_required_fields(client, fake_adapter):
-    """Test payment intent creation with missing required fields"""
-    res = await client.post(
-        "/payments/intents",
-        json={
-            # Missing amount and currency
-            "capture_method": "automatic",
-            "payment_method_types": ["card"],
-        },
-        headers=IDEMP,
-    )
-
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
-
-
-@pytest.mark.asyncio
-async def test_create_customer_invalid_email(client, fake_adapter, mocker):
-    """Test customer creation with invalid email format"""
-    from tests.unit.payments.conftest import create_mock_object
-
-    # Set up mock to return a valid customer - validation happens at schema level
-    mock_customer = create_mock_object(
-        mocker,
-        id="cus_1",
-        provider="stripe",
-        provider_customer_id="cus_123",
-        email="invalid-email",
-        name="Test Customer",
-    )
-    fake_adapter.ensure_customer.return_value = mock_customer
-
-    res = await client.post(
-        "/payments/customers",
-        json={
-            "user_id": "user_123",
-            "email": "invalid-email",  # Invalid email format
-            "name": "Test Customer",
-        },
-        headers=IDEMP,
-    )
-
-    # Note: The current schema doesn't validate email format, so this might pass
-    # But we're testing the validation framework
-    assert res.status_code in [200, 422]
-
-
-@pytest.mark.asyncio
-async def test_create_product_missing_name(client, fake_adapter):
-    """Test product creation with missing required name"""
-    res = await client.post(
-        "/payments/products",
-        json={
-            # Missing name field
-            "active": True
-        },
-        headers=IDEMP,
-    )
-
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
+import json
 
+import pytest
 
-@pytest.mark.asyncio
-async def test_create_price_invalid_interval(client, fake_adapter):
-    """Test price creation with invalid interval"""
-    res = await client.post(
+from tests.unit.payments.conftest import CUSTOMER, JSON_HEADERS
+
+VALID_INTENT = {
+    "amount": 1000,
+    "currency": "USD",
+    "capture_method": "automatic",
+    "payment_method_types": ["card"],
+}
+
+# Invalid request bodies, encoded once at import; every case must be rejected with 422.
+INVALID_BODY_CASES = [
+    ("/payments/intents", {**VALID_INTENT, "currency": "INVALID"}),
+    ("/payments/intents", {**VALID_INTENT, "amount": -1000}),
+    # Missing amount and currency
+    ("/payments/intents", {"capture_method": "automatic", "payment_method_types": ["card"]}),
+    # Missing name field
+    ("/payments/products", {"active": True}),
+    (
         "/payments/prices",
-        json={
+        {
             "provider_product_id": "prod_123",
             "currency": "USD",
             "unit_amount": 1000,
-            "interval": "invalid_interval",  # Invalid interval
+            "interval": "invalid_interval",
             "active": True,
         },
-        headers=IDEMP,
-    )
-
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
-
-
-@pytest.mark.asyncio
-async def test_create_subscription_missing_customer(client, fake_adapter):
-    """Test subscription creation with missing customer"""
-    res = await client.post(
-        "/payments/subscriptions",
-        json={
-            # Missing customer_provider_id
-            "price_provider_id": "price_123",
-            "quantity": 1,
-        },
-        headers=IDEMP,
-    )
-
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
-
-
-@pytest.mark.asyncio
-async def test_create_usage_record_negative_quantity(client, fake_adapter):
-    """Test usage record creation with negative quantity"""
-    res = await client.post(
+    ),
+    # Missing customer_provider_id
+    ("/payments/subscriptions", {"price_provider_id": "price_123", "quantity": 1}),
+    (
         "/payments/usage_records",
-        json={
-            "subscription_item": "si_123",
-            "quantity": -100,  # Negative quantity
-            "action": "increment",
-        },
-        headers=IDEMP,
-    )
-
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
-
-
-@pytest.mark.asyncio
-async def test_create_usage_record_invalid_action(client, fake_adapter):
-    """Test usage record creation with invalid action"""
-    res = await client.post(
+        {"subscription_item": "si_123", "quantity": -100, "action": "increment"},
+    ),
+    (
         "/payments/usage_records",
-        json={
-            "subscription_item": "si_123",
-            "quantity": 100,
-            "action": "invalid_action",  # Invalid action
-        },
-        headers=IDEMP,
-    )
+        {"subscription_item": "si_123", "quantity": 100, "action": "invalid_action"},
+    ),
+    # Missing customer_provider_id
+    ("/payments/methods/attach", {"payment_method_token": "pm_123", "make_default": True}),
+    # Missing payment_method_token
+    ("/payments/methods/attach", {"customer_provider_id": "cus_123", "make_default": True}),
+]
+INVALID_BODY_IDS = [
+    "intent_invalid_currency",
+    "intent_negative_amount",
+    "intent_missing_required_fields",
+    "product_missing_name",
+    "price_invalid_interval",
+    "subscription_missing_customer",
+    "usage_record_negative_quantity",
+    "usage_record_invalid_action",
+    "attach_method_missing_customer",
+    "attach_method_missing_token",
+]
+
+
+@pytest.mark.parametrize(
+    ("path", "body"),
+    [(path, json.dumps(payload).encode()) for path, payload in INVALID_BODY_CASES],
+    ids=INVALID_BODY_IDS,
+)
+async def test_invalid_body_rejected(client, path, body):
+    """Test that schema violations in request bodies are rejected"""
+    res = await client.post(path, content=body, headers=JSON_HEADERS)
 
     assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
+    assert "detail" in res.json()
 
 
-@pytest.mark.asyncio
-async def test_attach_payment_method_missing_customer(client, fake_adapter):
-    """Test payment method attachment with missing customer"""
-    res = await client.post(
-        "/payments/methods/attach",
-        json={
-            # Missing customer_provider_id
-            "payment_method_token": "pm_123",
-            "make_default": True,
-        },
-        headers=IDEMP,
+async def test_create_customer_invalid_email(client, fake_adapter):
+    """Test customer creation with invalid email format"""
+    # CustomerUpsertIn.email is a plain string, so the value is passed through to the
+    # provider rather than rejected at the schema level
+    fake_adapter.ensure_customer.return_value = CUSTOMER.model_copy(
+        update={"email": "invalid-email"}
     )
 
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
-
-
-@pytest.mark.asyncio
-async def test_attach_payment_method_missing_token(client, fake_adapter):
-    """Test payment method attachment with missing token"""
     res = await client.post(
-        "/payments/methods/attach",
-        json={
-            "customer_provider_id": "cus_123",
-            # Missing payment_method_token
-            "make_default": True,
-        },
-        headers=IDEMP,
+        "/payments/customers",
+        content=json.dumps(
+            {"user_id": "user_123", "email": "invalid-email", "name": "Test Customer"}
+        ).encode(),
+        headers=JSON_HEADERS,
     )
 
-    assert res.status_code == 422  # Validation error
-    body = res.json()
-    assert "detail" in body
+    assert res.status_code == 200
+    assert res.json()["email"] == "invalid-email"
+    fake_adapter.ensure_customer.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_pagination_invalid_limit(client, fake_adapter):
+@pytest.mark.parametrize("limit", ["1000", "0", "-1"], ids=["too_high", "too_low", "negative"])
+async def test_pagination_invalid_limit(client, limit):
     """Test pagination with invalid limit values"""
-    # Test limit too high
-    res = await client.get("/payments/intents?limit=1000")
-    assert res.status_code == 422  # Validation error
-
-    # Test limit too low
-    res = await client.get("/payments/intents?limit=0")
-    assert res.status_code == 422  # Validation error
-
-    # Test negative limit
-    res = await client.get("/payments/intents?limit=-1")
+    res = await client.get(f"/payments/intents?limit={limit}")
     assert res.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
-async def test_missing_idempotency_key(client, fake_adapter):
+async def test_missing_idempotency_key(client):
     """Test endpoints that require idempotency key"""
     res = await client.post(
         "/payments/intents",
-        json={
-            "amount": 1000,
-            "currency": "USD",
-            "capture_method": "automatic",
-            "payment_method_types": ["card"],
-        },
+        content=json.dumps(VALID_INTENT).encode(),
+        headers={"content-type": "application/json"},
     )  # Missing Idempotency-Key header
 
     assert res.status_code == 422  # Validation error due to missing idempotency key header
@@ -1,12 +1,11 @@
-import pytest
+from tests.unit.payments.conftest import EMPTY_JSON
 
 
-@pytest.mark.asyncio
 async def test_webhook_ok(client, fake_adapter):
     fake_adapter.handle_webhook.return_value = {"ok": True}
     res = await client.post(
         "/payments/webhooks/stripe",
-        content=b"{}",
+        content=EMPTY_JSON,
         headers={"Stripe-Signature": "t=1,v1=abc"},
     )
     assert res.status_code == 200
@@ -19,30 +19,45 @@ class _DummySession:
         return None
 
 
+_BASE_SCOPE = {
+    "type": "http",
+    "http_version": "1.1",
+    "method": "GET",
+    "path": "/",
+    "headers": [],
+}
+
+
+@pytest.fixture(scope="module")
+def dummy_session() -> _DummySession:
+    return _DummySession()
+
+
+@pytest.fixture(scope="module")
+def user_principal() -> Principal:
+    return Principal(user=types.SimpleNamespace(tenant_id="tenant_user"), scopes=[], via="jwt")
+
+
+@pytest.fixture(scope="module")
+def api_key_principal() -> Principal:
+    api_key = types.SimpleNamespace(tenant_id="tenant_api")
+    return Principal(user=None, scopes=[], via="api_key", api_key=api_key)
+
+
 def _request(*, headers: list[tuple[bytes, bytes]] | None = None) -> Request:
-    scope = {
-        "type": "http",
-        "http_version": "1.1",
-        "method": "GET",
-        "path": "/",
-        "headers": headers or [],
-    }
+    # Always hand Request its own scope dict: request.state writes into scope["state"].
+    scope = {**_BASE_SCOPE} if headers is None else {**_BASE_SCOPE, "headers": headers}
     return Request(scope)
 
 
-@pytest.mark.asyncio
-async def test_resolve_tenant_from_principal_user():
-    user = types.SimpleNamespace(tenant_id="tenant_user")
-    principal = Principal(user=user, scopes=[], via="jwt")
-
-    tenant_id = await resolve_payments_tenant_id(_request(), identity=principal)
-    service = await get_service(session=_DummySession(), tenant_id=tenant_id)
+async def test_resolve_tenant_from_principal_user(user_principal, dummy_session):
+    tenant_id = await resolve_payments_tenant_id(_request(), identity=user_principal)
+    service = await get_service(session=dummy_session, tenant_id=tenant_id)
 
     assert service.tenant_id == "tenant_user"
 
 
-@pytest.mark.asyncio
-async def test_override_hook_takes_precedence():
+async def test_override_hook_takes_precedence(dummy_session):
     override_calls: list[tuple[Request, Principal | None, str | None]] = []
 
     async def _override(request: Request, identity: Principal | None, header: str | None) -> str:
@@ -58,12 +73,11 @@ async def test_override_hook_takes_precedence():
     assert override_calls, "override hook should be invoked"
     assert tenant_id == "tenant_override"
 
-    service = await get_service(session=_DummySession(), tenant_id=tenant_id)
+    service = await get_service(session=dummy_session, tenant_id=tenant_id)
     assert service.tenant_id == "tenant_override"
 
 
-@pytest.mark.asyncio
-async def test_async_override_hook_supported():
+async def test_async_override_hook_supported(dummy_session):
     calls: list[tuple[Request, Principal | None, str | None]] = []
 
     async def _override(request: Request, identity: Principal | None, header: str | None) -> str:
@@ -79,11 +93,10 @@ async def test_async_override_hook_supported():
     assert calls, "async override should be invoked"
     assert tenant_id == "tenant_async"
 
-    service = await get_service(session=_DummySession(), tenant_id=tenant_id)
+    service = await get_service(session=dummy_session, tenant_id=tenant_id)
     assert service.tenant_id == "tenant_async"
 
 
-@pytest.mark.asyncio
 async def test_override_can_defer_to_default_flow():
     override_calls: list[tuple[Request, Principal | None, str | None]] = []
 
@@ -101,24 +114,18 @@ async def test_override_can_defer_to_default_flow():
     assert tenant_id == "tenant_header"
 
 
-@pytest.mark.asyncio
-async def test_resolve_tenant_from_principal_api_key():
-    api_key = types.SimpleNamespace(tenant_id="tenant_api")
-    principal = Principal(user=None, scopes=[], via="api_key", api_key=api_key)
-
-    tenant_id = await resolve_payments_tenant_id(_request(), identity=principal)
+async def test_resolve_tenant_from_principal_api_key(api_key_principal):
+    tenant_id = await resolve_payments_tenant_id(_request(), identity=api_key_principal)
 
     assert tenant_id == "tenant_api"
 
 
-@pytest.mark.asyncio
 async def test_resolve_tenant_from_header():
     tenant_id = await resolve_payments_tenant_id(_request(), tenant_header="tenant_header")
 
     assert tenant_id == "tenant_header"
 
 
-@pytest.mark.asyncio
 async def test_resolve_tenant_from_request_state():
     request = _request()
     request.state.tenant_id = "tenant_state"
@@ -128,7 +135,6 @@ async def test_resolve_tenant_from_request_state():
     assert tenant_id == "tenant_state"
 
 
-@pytest.mark.asyncio
 async def test_missing_tenant_context_raises():
     with pytest.raises(HTTPException) as exc:
         await resolve_payments_tenant_id(_request())
@@ -1,15 +1,14 @@
 import pytest
 
+from svc_infra.apf_payments.provider.stripe import StripeAdapter
+from svc_infra.apf_payments.provider.stripe import stripe as stripe_sdk
 
-@pytest.mark.asyncio
-async def test_create_intent_maps_fields(monkeypatch, mocker):
-    monkeypatch.setenv("STRIPE_SECRET", "sk_test_123")
-    from svc_infra.apf_payments.provider.stripe import StripeAdapter
-    from svc_infra.apf_payments.provider.stripe import stripe as stripe_sdk
+if stripe_sdk is None:
+    pytest.skip("stripe SDK not installed (optional dependency)", allow_module_level=True)
 
-    if stripe_sdk is None:
-        pytest.skip("stripe SDK not installed (optional dependency)")
 
+async def test_create_intent_maps_fields(monkeypatch, mocker):
+    # Stripe keys come from the package-level _payments_env settings shim
     adapter = StripeAdapter()
 
     pi = mocker.Mock(
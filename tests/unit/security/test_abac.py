@@ -3,10 +3,10 @@ from __future__ import annotations
 import uuid
 
 import pytest
-from fastapi import Depends, FastAPI
-from fastapi.testclient import TestClient
+from fastapi import Depends, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
 
-from svc_infra.api.fastapi.auth.security import Identity, Principal
+from svc_infra.api.fastapi.auth.security import Identity, Principal, _current_principal
 from svc_infra.security.permissions import (
     PERMISSION_REGISTRY,
     RequireABAC,
@@ -14,10 +14,17 @@ from svc_infra.security.permissions import (
     owns_resource,
 )
 
+OWNER_UID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+OTHER_UID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+DOC_UID = uuid.UUID("00000000-0000-0000-0000-000000000003")
+
+# owns_resource() is a predicate factory; build the predicate once for every check.
+PREDICATE = owns_resource()
+
 
 class Doc:
-    def __init__(self, owner_id):
-        self.id = uuid.uuid4()
+    def __init__(self, owner_id, id=DOC_UID):
+        self.id = id
         self.owner_id = owner_id
 
 
@@ -27,29 +34,46 @@ class U:
         self.roles = roles
 
 
-def test_enforce_abac_sync_ok_and_forbidden():
-    uid = uuid.uuid4()
-    p = Principal(user=U(uid, roles=["admin"]), scopes=[], via="jwt")
-    # ensure admin has doc.read in registry for this test
-    PERMISSION_REGISTRY.setdefault("admin", set()).add("doc.read")
-    d_ok = Doc(owner_id=uid)
-    d_bad = Doc(owner_id=uuid.uuid4())
+@pytest.fixture(scope="module", autouse=True)
+def _admin_can_read_docs():
+    """Grant admin doc.read once for this module, and revoke it afterwards."""
+    perms = PERMISSION_REGISTRY.setdefault("admin", set())
+    added = "doc.read" not in perms
+    perms.add("doc.read")
+    yield
+    if added:
+        perms.discard("doc.read")
+
+
+@pytest.fixture(scope="module")
+def admin_principal():
+    return Principal(user=U(OWNER_UID, roles=["admin"]), scopes=[], via="jwt")
+
+
+@pytest.fixture(scope="module")
+def owned_doc(admin_principal):
+    return Doc(owner_id=admin_principal.user.id)
 
+
+@pytest.fixture(scope="module")
+def other_doc():
+    return Doc(owner_id=OTHER_UID)
+
+
+def test_enforce_abac_sync_ok_and_forbidden(admin_principal, owned_doc, other_doc):
     # ok path
-    enforce_abac(p, permission="doc.read", resource=d_ok, predicate=owns_resource())
+    enforce_abac(admin_principal, permission="doc.read", resource=owned_doc, predicate=PREDICATE)
 
     # forbidden path
-    with pytest.raises(Exception) as exc:
-        enforce_abac(p, permission="doc.read", resource=d_bad, predicate=owns_resource())
-    assert "forbidden" in str(exc.value)
+    with pytest.raises(HTTPException, match="forbidden"):
+        enforce_abac(
+            admin_principal, permission="doc.read", resource=other_doc, predicate=PREDICATE
+        )
 
 
-def test_require_abac_dependency():
-    uid = uuid.uuid4()
-    PERMISSION_REGISTRY.setdefault("admin", set()).add("doc.read")
-
+async def test_require_abac_dependency(admin_principal, owned_doc):
     def load_doc():
-        return Doc(owner_id=uid)
+        return owned_doc
 
     app = FastAPI()
 
@@ -58,7 +82,7 @@ def test_require_abac_dependency():
         dependencies=[
             RequireABAC(
                 permission="doc.read",
-                predicate=owns_resource(),
+                predicate=PREDICATE,
                 resource_getter=load_doc,
             )
         ],
@@ -66,15 +90,13 @@ def test_require_abac_dependency():
     async def get_doc(identity: Identity, doc=Depends(load_doc)):
         return {"id": str(doc.id)}
 
-    client = TestClient(app)
-
     # build principal injection via dependency override
     def override_identity():
-        return Principal(user=U(uid, roles=["admin"]), scopes=[], via="jwt")
-
-    from svc_infra.api.fastapi.auth import security as secmod
+        return admin_principal
 
-    app.dependency_overrides[secmod._current_principal] = override_identity
+    app.dependency_overrides[_current_principal] = override_identity
 
-    r = client.get(f"/docs/{uuid.uuid4()}")
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        r = await client.get(f"/docs/{DOC_UID}")
     assert r.status_code == 200
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import pytest
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from svc_infra.security.add import add_security
 
@@ -17,27 +18,49 @@ def _build_app():
     return app
 
 
-def test_add_security_applies_header_overrides():
+@pytest.mark.parametrize(
+    ("config", "request_headers", "expected_headers"),
+    [
+        (
+            {
+                "cors_origins": ["https://example.org"],
+                "headers_overrides": {
+                    "Strict-Transport-Security": "max-age=60",
+                    "X-Frame-Options": "SAMEORIGIN",
+                },
+            },
+            {"Origin": "https://example.org"},
+            {
+                # Security headers should include overrides
+                "Strict-Transport-Security": "max-age=60",
+                "X-Frame-Options": "SAMEORIGIN",
+                # CORS should reflect the allowed origin
+                "access-control-allow-origin": "https://example.org",
+            },
+        ),
+        (
+            {"enable_hsts_preload": False},
+            {},
+            {"Strict-Transport-Security": "max-age=63072000; includeSubDomains"},
+        ),
+    ],
+    ids=["header_overrides", "hsts_without_preload"],
+)
+async def test_add_security_response_headers(
+    monkeypatch, config, request_headers, expected_headers
+):
+    monkeypatch.delenv("CORS_ALLOW_ORIGINS", raising=False)
     app = _build_app()
 
-    add_security(
-        app,
-        cors_origins=["https://example.org"],
-        headers_overrides={
-            "Strict-Transport-Security": "max-age=60",
-            "X-Frame-Options": "SAMEORIGIN",
-        },
-    )
+    add_security(app, **config)
 
-    client = TestClient(app)
-    response = client.get("/", headers={"Origin": "https://example.org"})
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.get("/", headers=request_headers)
 
     assert response.status_code == 200
-    # Security headers should include overrides
-    assert response.headers["Strict-Transport-Security"] == "max-age=60"
-    assert response.headers["X-Frame-Options"] == "SAMEORIGIN"
-    # CORS should reflect the allowed origin
-    assert response.headers["access-control-allow-origin"] == "https://example.org"
+    for name, value in expected_headers.items():
+        assert response.headers[name] == value
 
 
 def test_add_security_reads_cors_env(monkeypatch):
@@ -50,18 +73,6 @@ def test_add_security_reads_cors_env(monkeypatch):
     assert cors.kwargs["allow_origins"] == ["https://a.example", "https://b.example"]
 
 
-def test_add_security_can_disable_hsts_preload(monkeypatch):
-    monkeypatch.delenv("CORS_ALLOW_ORIGINS", raising=False)
-    app = _build_app()
-
-    add_security(app, enable_hsts_preload=False)
-
-    client = TestClient(app)
-    response = client.get("/")
-
-    assert "preload" not in response.headers["Strict-Transport-Security"].lower()
-
-
 def test_add_security_can_install_session_middleware(monkeypatch):
     app = _build_app()
 
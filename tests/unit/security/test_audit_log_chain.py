@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import uuid
 
-import pytest
-
 from svc_infra.security.audit import append_audit_event, verify_audit_chain
 
 
@@ -18,7 +16,6 @@ class FakeDB:
         pass
 
 
-@pytest.mark.asyncio
 async def test_audit_chain_verification_and_tamper_detection():
     db = FakeDB()
     tenant_id = "t1"
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import uuid
 
-import pytest
-
 from svc_infra.security.audit import verify_audit_chain
 from svc_infra.security.audit_service import append_event, verify_chain_for_tenant
 from svc_infra.security.models import AuditLog
@@ -20,7 +18,6 @@ class FakeDB:
         pass
 
 
-@pytest.mark.asyncio
 async def test_audit_service_append_and_verify():
     db = FakeDB()
     actor = uuid.uuid4()
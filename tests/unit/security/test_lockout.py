@@ -31,3 +31,6 @@ def test_lockout_exponential_growth_and_cap():
     # fail_count = 7 -> exponent 4 -> 160s -> capped at 100s
     s7 = compute_lockout(7, cfg=cfg, now=datetime(2025, 1, 1, tzinfo=UTC))
     assert (s7.next_allowed_at - datetime(2025, 1, 1, tzinfo=UTC)).total_seconds() == 100
+    # Very large failure counts stay at the cap
+    s_many = compute_lockout(100_000, cfg=cfg, now=datetime(2025, 1, 1, tzinfo=UTC))
+    assert (s_many.next_allowed_at - datetime(2025, 1, 1, tzinfo=UTC)).total_seconds() == 100
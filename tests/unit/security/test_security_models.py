@@ -14,7 +14,8 @@ from svc_infra.security.models import (
 def test_refresh_token_generation_and_hash():
     raw = generate_refresh_token()
     assert isinstance(raw, str)
-    assert len(raw) == 64  # two UUID4 hex concatenated
+    assert len(raw) == 64  # 32 random bytes, hex encoded
+    int(raw, 16)  # hex digits only
     h = hash_refresh_token(raw)
     assert len(h) == 64
     new_raw, new_hash, expires_at = rotate_refresh_token(h)
@@ -23,69 +24,34 @@ def test_refresh_token_generation_and_hash():
     assert expires_at > datetime.now(UTC)
 
 
+def _audit_chain(events, *, actor_id, tenant_id):
+    """Hash (ts, event_type, metadata) events into a chain, each linked to the previous."""
+    chain: list[str] = []
+    prev = None
+    for ts, event_type, metadata in events:
+        prev = compute_audit_hash(
+            prev,
+            ts=ts,
+            actor_id=actor_id,
+            tenant_id=tenant_id,
+            event_type=event_type,
+            resource_ref=None,
+            metadata=metadata,
+        )
+        chain.append(prev)
+    return chain
+
+
 def test_audit_hash_chain_continuity():
     actor = uuid.uuid4()
-    tenant = "tenantA"
-    ts1 = datetime.now(UTC)
+    events = [
+        (datetime.now(UTC), "login", {"ip": "1.1.1.1"}),
+        (datetime.now(UTC), "refresh", {"count": 1}),
+        (datetime.now(UTC), "logout", {"reason": "user_initiated"}),
+    ]
 
-    h1 = compute_audit_hash(
-        None,
-        ts=ts1,
-        actor_id=actor,
-        tenant_id=tenant,
-        event_type="login",
-        resource_ref=None,
-        metadata={"ip": "1.1.1.1"},
-    )
-    ts2 = datetime.now(UTC)
-    h2 = compute_audit_hash(
-        h1,
-        ts=ts2,
-        actor_id=actor,
-        tenant_id=tenant,
-        event_type="refresh",
-        resource_ref=None,
-        metadata={"count": 1},
-    )
-    ts3 = datetime.now(UTC)
-    h3 = compute_audit_hash(
-        h2,
-        ts=ts3,
-        actor_id=actor,
-        tenant_id=tenant,
-        event_type="logout",
-        resource_ref=None,
-        metadata={"reason": "user_initiated"},
-    )
+    chain = _audit_chain(events, actor_id=actor, tenant_id="tenantA")
+    assert len(set(chain)) == len(events)
 
     # Recompute chain to verify integrity
-    h1_r = compute_audit_hash(
-        None,
-        ts=ts1,
-        actor_id=actor,
-        tenant_id=tenant,
-        event_type="login",
-        resource_ref=None,
-        metadata={"ip": "1.1.1.1"},
-    )
-    assert h1_r == h1
-    h2_r = compute_audit_hash(
-        h1,
-        ts=ts2,
-        actor_id=actor,
-        tenant_id=tenant,
-        event_type="refresh",
-        resource_ref=None,
-        metadata={"count": 1},
-    )
-    assert h2_r == h2
-    h3_r = compute_audit_hash(
-        h2,
-        ts=ts3,
-        actor_id=actor,
-        tenant_id=tenant,
-        event_type="logout",
-        resource_ref=None,
-        metadata={"reason": "user_initiated"},
-    )
-    assert h3_r == h3
+    assert _audit_chain(events, actor_id=actor, tenant_id="tenantA") == chain
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import uuid
+from collections import defaultdict
+from typing import Any
 
 import pytest
 from fastapi import HTTPException
@@ -18,7 +20,8 @@ class FakeUser:
 
 class FakeDB:
     def __init__(self):
-        self.objects = []
+        # Objects indexed by model type, then by str(id), so lookups skip a scan
+        self.objects: dict[type, dict[str, Any]] = defaultdict(dict)
 
     async def execute(self, stmt):  # minimal select mock
         class Result:
@@ -31,26 +34,25 @@ class FakeDB:
                         self._data = data
 
                     def all(self):
-                        return [o for o in self._data if isinstance(o, AuthSession)]
+                        return self._data
 
                 return S(self._data)
 
-        return Result(self.objects)
+        return Result(list(self.objects[AuthSession].values()))
 
     async def get(self, model, pk):
-        for o in self.objects:
-            if isinstance(o, model) and str(o.id) == str(pk):
-                return o
-        return None
+        return self.objects[model].get(str(pk))
 
     def add(self, obj):
-        self.objects.append(obj)
+        # Apply the uuid4 column default a real flush would, so the object has a key
+        if obj.id is None:
+            obj.id = uuid.uuid4()
+        self.objects[type(obj)][str(obj.id)] = obj
 
     async def flush(self):
         pass
 
 
-@pytest.mark.asyncio
 async def test_list_and_revoke_session():
     db = FakeDB()
     user = FakeUser()
@@ -83,7 +85,6 @@ async def test_list_and_revoke_session():
     assert all(rt.revoked_at is not None for rt in auth_session.refresh_tokens)
 
 
-@pytest.mark.asyncio
 async def test_cannot_revoke_other_users_session():
     db = FakeDB()
     owner = FakeUser()
@@ -109,7 +110,7 @@ async def test_cannot_revoke_other_users_session():
     assert auth_session.revoked_at is not None
 
     # Reset state for negative test (issue fresh session)
-    db.objects = []
+    db.objects.clear()
     _raw2, rt2 = await issue_session_and_refresh(db, user_id=owner.id)
     # Attempt revoke by other user -> 403
     with pytest.raises(HTTPException) as exc:
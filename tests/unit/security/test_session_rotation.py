@@ -24,7 +24,6 @@ class FakeDB:
         self.added.append(obj)
 
 
-@pytest.mark.asyncio
 async def test_issue_and_rotate_session():
     db = FakeDB()
     user_id = uuid.uuid4()
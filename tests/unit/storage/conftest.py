@@ -0,0 +1,12 @@
+"""
+Storage test helpers shared by the backend test modules.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+
+async def seed(backend, items):
+    """Store (key, data, content_type) items concurrently."""
+    await asyncio.gather(*(backend.put(key, data, ct) for key, data, ct in items))
@@ -1,6 +1,11 @@
 """Unit tests for FastAPI storage integration."""
 
-from unittest.mock import AsyncMock, MagicMock
+import hashlib
+import hmac
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+from urllib.parse import urlencode
 
 import pytest
 from fastapi import FastAPI, Request
@@ -10,6 +15,50 @@ from svc_infra.storage.add import add_storage, get_storage, health_check_storage
 from svc_infra.storage.backends import LocalBackend, MemoryBackend
 
 
+@pytest.fixture(scope="module")
+def signer():
+    """HMAC keyed with the test signing secret; copy it per signed message."""
+    return hmac.new(b"test-secret", digestmod=hashlib.sha256)
+
+
+@pytest.fixture(scope="class")
+def app_with_storage():
+    """Create app with MemoryBackend storage, shared by the tests in a class."""
+    app = FastAPI()
+    backend = MemoryBackend()
+    add_storage(app, backend)
+    return app
+
+
+@pytest.fixture
+def fresh_app_with_storage():
+    """Create app with its own MemoryBackend, for tests that add routes or data."""
+    app = FastAPI()
+    add_storage(app, MemoryBackend())
+    return app
+
+
+@pytest.fixture(scope="class")
+def app_with_local(tmp_path_factory):
+    """Create app with LocalBackend and file serving, shared by the tests in a class.
+
+    Each test writes the files it serves before requesting them.
+    """
+    app = FastAPI()
+    base_path = tmp_path_factory.mktemp("files")
+    backend = LocalBackend(base_path=str(base_path), signing_secret="test-secret")
+    add_storage(app, backend, serve_files=True)
+    return app, backend
+
+
+@pytest.fixture(scope="class")
+def local_client(app_with_local):
+    """TestClient for the file-serving app, entered once per class."""
+    app, _ = app_with_local
+    with TestClient(app) as client:
+        yield client
+
+
 @pytest.mark.storage
 class TestAddStorage:
     """Test suite for add_storage FastAPI integration."""
@@ -72,7 +121,7 @@ class TestAddStorage:
         response = client.get("/files/test.txt?expires=123&signature=abc")
         assert response.status_code == 404
 
-    def test_add_storage_with_serve_files_local(self, app, tmp_path):
+    def test_add_storage_with_serve_files_local(self, app, tmp_path, signer):
         """Test file serving with LocalBackend."""
         backend = LocalBackend(base_path=str(tmp_path), signing_secret="test-secret")
         add_storage(app, backend, serve_files=True)
@@ -82,14 +131,11 @@ class TestAddStorage:
         test_file.write_bytes(b"test content")
 
         # Generate signed URL (matching LocalBackend._sign_url format)
-        import hashlib
-        import hmac
-        import time
-        from urllib.parse import urlencode
-
         expires = int(time.time()) + 3600
         message = f"test.txt:{expires}:False".encode()
-        signature = hmac.new(b"test-secret", message, hashlib.sha256).hexdigest()
+        signing = signer.copy()
+        signing.update(message)
+        signature = signing.hexdigest()
 
         params = urlencode({"expires": expires, "signature": signature})
 
@@ -134,18 +180,9 @@ class TestAddStorage:
 
 
 @pytest.mark.storage
-@pytest.mark.asyncio
 class TestGetStorage:
     """Test suite for get_storage dependency."""
 
-    @pytest.fixture
-    def app_with_storage(self):
-        """Create app with storage."""
-        app = FastAPI()
-        backend = MemoryBackend()
-        add_storage(app, backend)
-        return app
-
     async def test_get_storage_returns_backend(self, app_with_storage):
         """Test get_storage returns backend from app.state."""
         # Create mock request
@@ -166,9 +203,9 @@ class TestGetStorage:
         with pytest.raises(RuntimeError, match="Storage not initialized"):
             get_storage(request)  # Not async
 
-    async def test_get_storage_in_route(self, app_with_storage):
+    async def test_get_storage_in_route(self, fresh_app_with_storage):
         """Test get_storage as dependency in route."""
-        app = app_with_storage
+        app = fresh_app_with_storage
 
         @app.get("/test")
         async def test_route(storage=None):  # Would use Depends(get_storage)
@@ -184,18 +221,9 @@ class TestGetStorage:
 
 
 @pytest.mark.storage
-@pytest.mark.asyncio
 class TestHealthCheckStorage:
     """Test suite for health_check_storage endpoint."""
 
-    @pytest.fixture
-    def app_with_storage(self):
-        """Create app with storage."""
-        app = FastAPI()
-        backend = MemoryBackend()
-        add_storage(app, backend)
-        return app
-
     async def test_health_check_success(self, app_with_storage):
         """Test health check returns success."""
         request = MagicMock(spec=Request)
@@ -206,15 +234,15 @@ class TestHealthCheckStorage:
         assert result["status"] == "healthy"
         assert result["backend"] == "memory"
 
-    async def test_health_check_with_stats(self, app_with_storage):
+    async def test_health_check_with_stats(self, fresh_app_with_storage):
         """Test health check works after adding data."""
-        backend = app_with_storage.state.storage
+        backend = fresh_app_with_storage.state.storage
 
         # Add some data
         await backend.put("test.txt", b"data", "text/plain")
 
         request = MagicMock(spec=Request)
-        request.app = app_with_storage
+        request.app = fresh_app_with_storage
 
         result = await health_check_storage(request)
 
@@ -250,123 +278,95 @@ class TestHealthCheckStorage:
 class TestFileServing:
     """Test file serving functionality."""
 
-    @pytest.fixture
-    def app_with_local(self, tmp_path):
-        """Create app with LocalBackend and file serving."""
-        app = FastAPI()
-        backend = LocalBackend(base_path=str(tmp_path), signing_secret="test-secret")
-        add_storage(app, backend, serve_files=True)
-        return app, backend
-
-    def test_serve_file_valid_signature(self, app_with_local, tmp_path):
+    def test_serve_file_valid_signature(self, app_with_local, local_client, signer):
         """Test serving file with valid signature."""
-        app, _backend = app_with_local
+        _, backend = app_with_local
 
         # Create file
-        test_file = tmp_path / "test.txt"
+        test_file = backend.base_path / "test.txt"
         test_file.write_bytes(b"file content")
 
         # Generate valid signed URL (matches LocalBackend._sign_url)
-        import hashlib
-        import hmac
-        import time
-        from urllib.parse import urlencode
-
         expires = int(time.time()) + 3600
         message = f"test.txt:{expires}:False".encode()
-        signature = hmac.new(b"test-secret", message, hashlib.sha256).hexdigest()
+        signing = signer.copy()
+        signing.update(message)
+        signature = signing.hexdigest()
 
         params = urlencode({"expires": expires, "signature": signature})
 
-        client = TestClient(app)
-        response = client.get(f"/files/test.txt?{params}")
+        response = local_client.get(f"/files/test.txt?{params}")
 
         assert response.status_code == 200
         assert response.content == b"file content"
         assert response.headers["content-type"] == "application/octet-stream"
 
-    def test_serve_file_invalid_signature(self, app_with_local, tmp_path):
+    def test_serve_file_invalid_signature(self, app_with_local, local_client):
         """Test serving file with invalid signature."""
-        app, _ = app_with_local
+        _, backend = app_with_local
 
         # Create file
-        test_file = tmp_path / "test.txt"
+        test_file = backend.base_path / "test.txt"
         test_file.write_bytes(b"content")
 
         # Invalid signature
-        import time
-        from urllib.parse import urlencode
-
         expires = int(time.time()) + 3600
         params = urlencode({"expires": expires, "signature": "invalid"})
 
-        client = TestClient(app)
-        response = client.get(f"/files/test.txt?{params}")
+        response = local_client.get(f"/files/test.txt?{params}")
 
         assert response.status_code == 403
 
-    def test_serve_file_expired(self, app_with_local, tmp_path):
+    def test_serve_file_expired(self, app_with_local, local_client, signer):
         """Test serving file with expired signature."""
-        app, _ = app_with_local
+        _, backend = app_with_local
 
         # Create file
-        test_file = tmp_path / "test.txt"
+        test_file = backend.base_path / "test.txt"
         test_file.write_bytes(b"content")
 
         # Expired signature
-        import hashlib
-        import hmac
-        import time
-        from urllib.parse import urlencode
-
         expires = int(time.time()) - 3600  # Expired 1 hour ago
         message = f"test.txt:{expires}:False".encode()
-        signature = hmac.new(b"test-secret", message, hashlib.sha256).hexdigest()
+        signing = signer.copy()
+        signing.update(message)
+        signature = signing.hexdigest()
 
         params = urlencode({"expires": expires, "signature": signature})
 
-        client = TestClient(app)
-        response = client.get(f"/files/test.txt?{params}")
+        response = local_client.get(f"/files/test.txt?{params}")
 
         assert response.status_code == 403
 
-    def test_serve_nonexistent_file(self, app_with_local):
+    def test_serve_nonexistent_file(self, local_client, signer):
         """Test serving nonexistent file."""
-        app, _ = app_with_local
-
         # Valid signature for nonexistent file
-        import hashlib
-        import hmac
-        import time
-        from urllib.parse import urlencode
-
         expires = int(time.time()) + 3600
         message = f"nonexistent.txt:{expires}:False".encode()
-        signature = hmac.new(b"test-secret", message, hashlib.sha256).hexdigest()
+        signing = signer.copy()
+        signing.update(message)
+        signature = signing.hexdigest()
 
         params = urlencode({"expires": expires, "signature": signature})
 
-        client = TestClient(app)
-        response = client.get(f"/files/nonexistent.txt?{params}")
+        response = local_client.get(f"/files/nonexistent.txt?{params}")
 
         assert response.status_code == 404
 
-    def test_serve_file_missing_params(self, app_with_local, tmp_path):
+    def test_serve_file_missing_params(self, app_with_local, local_client):
         """Test serving file without signature params."""
-        app, _ = app_with_local
+        _, backend = app_with_local
 
         # Create file
-        test_file = tmp_path / "test.txt"
+        test_file = backend.base_path / "test.txt"
         test_file.write_bytes(b"content")
 
-        client = TestClient(app)
-
         # Missing signature
-        response = client.get("/files/test.txt?expires=123456")
+        response = local_client.get("/files/test.txt?expires=123456")
         assert response.status_code == 422  # FastAPI validation error
 
         # Missing expires
-        response = client.get("/files/test.txt?signature=abc")
+        response = local_client.get("/files/test.txt?signature=abc")
         assert response.status_code == 422  # FastAPI validation error
 
 
@@ -374,7 +374,6 @@ class TestFileServing:
 class TestIntegration:
     """Integration tests for complete storage setup."""
 
-    @pytest.mark.asyncio
     async def test_full_lifecycle(self, tmp_path):
         """Test complete storage lifecycle in FastAPI app."""
         # Setup
@@ -408,29 +407,20 @@ class TestIntegration:
         assert response.status_code == 200
         assert response.json()["data"] == "test data"
 
-    def test_startup_shutdown_lifecycle(self, tmp_path):
-        """Test app startup and shutdown with storage."""
-        app = FastAPI()
-        backend = MemoryBackend()
-
+    def test_startup_shutdown_lifecycle(self):
+        """Test add_storage wraps the app's existing lifespan on startup and shutdown."""
         lifecycle_events = []
 
-        # Mock lifecycle methods
-        async def mock_startup():
+        @asynccontextmanager
+        async def app_lifespan(app):
             lifecycle_events.append("startup")
-
-        async def mock_shutdown():
+            yield
             lifecycle_events.append("shutdown")
 
-        backend.__aenter__ = AsyncMock(side_effect=mock_startup)
-        backend.__aexit__ = AsyncMock(side_effect=mock_shutdown)
-
-        add_storage(app, backend)
+        app = FastAPI(lifespan=app_lifespan)
+        add_storage(app, MemoryBackend())
 
-        # Test with TestClient lifecycle
         with TestClient(app):
-            pass  # Enter and exit context
+            assert lifecycle_events == ["startup"]
 
-        # Check lifecycle called (may not be in MemoryBackend)
-        # This is mainly testing the hook registration
-        assert len(lifecycle_events) >= 0
+        assert lifecycle_events == ["startup", "shutdown"]
@@ -2,15 +2,46 @@
 
 import importlib.util
 import logging
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from svc_infra.storage.backends import LocalBackend, MemoryBackend, S3Backend
-from svc_infra.storage.easy import easy_storage
+from svc_infra.storage.backends import LocalBackend, MemoryBackend
+from svc_infra.storage.easy import _settings_for_env, easy_storage
 
 AIOBOTO3_AVAILABLE = importlib.util.find_spec("aioboto3") is not None
 
+# Environment variable prefixes consulted by StorageSettings.detect_backend()
+_DETECTION_ENV_PREFIXES = ("STORAGE_", "AWS_", "RAILWAY_", "GOOGLE_APPLICATION_", "CLOUDINARY_")
+
+
+@pytest.fixture(scope="class")
+def _clean_env():
+    """Remove every variable backend auto-detection reads, once per class."""
+    mp = pytest.MonkeyPatch()
+    for key in list(os.environ):
+        if key.startswith(_DETECTION_ENV_PREFIXES):
+            mp.delenv(key, raising=False)
+    yield mp
+    mp.undo()
+
+
+@pytest.fixture
+def fresh_settings_cache():
+    """Keep memoized StorageSettings from leaking into or out of a test that mocks them."""
+    _settings_for_env.cache_clear()
+    yield
+    _settings_for_env.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def s3_backend_cls():
+    """S3Backend, imported on first use so collection doesn't load aioboto3."""
+    from svc_infra.storage.backends.s3 import S3Backend
+
+    return S3Backend
+
 
 @pytest.mark.storage
 class TestEasyStorage:
@@ -27,8 +58,9 @@ class TestEasyStorage:
         assert isinstance(backend, LocalBackend)
         assert str(backend.base_path) == "/tmp/storage"
 
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_explicit_s3_backend(self):
+    def test_explicit_s3_backend(self, s3_backend_cls):
         """Test creating S3 backend explicitly."""
         backend = easy_storage(
             backend="s3",
@@ -37,7 +69,7 @@ class TestEasyStorage:
             access_key="key",
             secret_key="secret",
         )
-        assert isinstance(backend, S3Backend)
+        assert isinstance(backend, s3_backend_cls)
         assert backend.bucket == "test-bucket"
         assert backend.region == "us-east-1"
 
@@ -55,8 +87,9 @@ class TestEasyStorage:
         assert isinstance(backend, LocalBackend)
         assert str(backend.base_path) == "/data"
 
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_auto_detect_s3_from_settings(self, monkeypatch):
+    def test_auto_detect_s3_from_settings(self, monkeypatch, s3_backend_cls):
         """Test S3 auto-detection from environment."""
         monkeypatch.setenv("STORAGE_BACKEND", "s3")
         monkeypatch.setenv("STORAGE_S3_BUCKET", "my-bucket")
@@ -64,12 +97,13 @@ class TestEasyStorage:
 
         backend = easy_storage()
 
-        assert isinstance(backend, S3Backend)
+        assert isinstance(backend, s3_backend_cls)
         assert backend.bucket == "my-bucket"
         assert backend.region == "us-west-2"
 
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_auto_detect_s3_aws_credentials(self, monkeypatch):
+    def test_auto_detect_s3_aws_credentials(self, monkeypatch, s3_backend_cls):
         """Test S3 with AWS environment credentials."""
         monkeypatch.setenv("STORAGE_BACKEND", "s3")
         monkeypatch.setenv("STORAGE_S3_BUCKET", "aws-bucket")
@@ -78,70 +112,42 @@ class TestEasyStorage:
 
         backend = easy_storage()
 
-        assert isinstance(backend, S3Backend)
+        assert isinstance(backend, s3_backend_cls)
         assert backend.bucket == "aws-bucket"
 
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_auto_detect_digitalocean_spaces(self, monkeypatch, caplog):
-        """Test DigitalOcean Spaces detection with logging."""
-        monkeypatch.setenv("STORAGE_BACKEND", "s3")
-        monkeypatch.setenv("STORAGE_S3_BUCKET", "my-spaces")
-        monkeypatch.setenv("STORAGE_S3_ENDPOINT", "https://nyc3.digitaloceanspaces.com")
-        monkeypatch.setenv("STORAGE_S3_REGION", "nyc3")
-
-        with caplog.at_level(logging.INFO):
-            backend = easy_storage()
-
-        assert isinstance(backend, S3Backend)
-        assert backend.endpoint == "https://nyc3.digitaloceanspaces.com"
-        assert "DigitalOcean Spaces" in caplog.text
-
-    @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_auto_detect_wasabi(self, monkeypatch, caplog):
-        """Test Wasabi detection with logging."""
-        monkeypatch.setenv("STORAGE_BACKEND", "s3")
-        monkeypatch.setenv("STORAGE_S3_BUCKET", "wasabi-bucket")
-        monkeypatch.setenv("STORAGE_S3_ENDPOINT", "https://s3.wasabisys.com")
-
-        with caplog.at_level(logging.INFO):
-            backend = easy_storage()
-
-        assert isinstance(backend, S3Backend)
-        assert "Wasabi" in caplog.text
-
-    @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_auto_detect_backblaze(self, monkeypatch, caplog):
-        """Test Backblaze B2 detection with logging."""
+    @pytest.mark.parametrize(
+        ("endpoint", "region", "expected_log"),
+        [
+            ("https://nyc3.digitaloceanspaces.com", "nyc3", "Detected DigitalOcean Spaces"),
+            ("https://s3.wasabisys.com", None, "Detected Wasabi"),
+            ("https://s3.us-west-001.backblazeb2.com", None, "Detected Backblaze B2"),
+            # Minio has no dedicated detection and is logged as a custom endpoint
+            ("http://localhost:9000", None, "Using custom S3 endpoint: http://localhost:9000"),
+        ],
+        ids=["digitalocean_spaces", "wasabi", "backblaze", "minio"],
+    )
+    def test_auto_detect_provider(
+        self, monkeypatch, caplog, s3_backend_cls, endpoint, region, expected_log
+    ):
+        """Test S3-compatible provider detection from the endpoint, with logging."""
         monkeypatch.setenv("STORAGE_BACKEND", "s3")
-        monkeypatch.setenv("STORAGE_S3_BUCKET", "b2-bucket")
-        monkeypatch.setenv("STORAGE_S3_ENDPOINT", "https://s3.us-west-001.backblazeb2.com")
+        monkeypatch.setenv("STORAGE_S3_BUCKET", "provider-bucket")
+        monkeypatch.setenv("STORAGE_S3_ENDPOINT", endpoint)
+        if region:
+            monkeypatch.setenv("STORAGE_S3_REGION", region)
 
         with caplog.at_level(logging.INFO):
             backend = easy_storage()
 
-        assert isinstance(backend, S3Backend)
-        assert "Backblaze B2" in caplog.text
-
-    @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_auto_detect_minio(self, monkeypatch, caplog):
-        """Test Minio detection with logging."""
-        monkeypatch.setenv("STORAGE_BACKEND", "s3")
-        monkeypatch.setenv("STORAGE_S3_BUCKET", "minio-bucket")
-        monkeypatch.setenv("STORAGE_S3_ENDPOINT", "http://localhost:9000")
+        assert isinstance(backend, s3_backend_cls)
+        assert backend.endpoint == endpoint
+        assert expected_log in caplog.text
 
-        with caplog.at_level(logging.INFO):
-            backend = easy_storage()
-
-        assert isinstance(backend, S3Backend)
-        assert "Minio" in caplog.text or "localhost" in caplog.text
-
-    def test_fallback_to_memory(self, monkeypatch, caplog):
+    @pytest.mark.usefixtures("_clean_env")
+    def test_fallback_to_memory(self, caplog):
         """Test fallback to memory backend with warning."""
-        # Clear all storage-related env vars
-        for key in list(monkeypatch._setitem):
-            if "STORAGE" in key or "RAILWAY" in key or "AWS" in key:
-                monkeypatch.delenv(key, raising=False)
-
         with caplog.at_level(logging.WARNING):
             backend = easy_storage()
 
@@ -174,6 +180,7 @@ class TestEasyStorage:
         assert isinstance(backend, MemoryBackend)
         assert backend.max_size == 1024 * 1024
 
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
     def test_s3_with_custom_endpoint(self):
         """Test S3 with custom endpoint."""
@@ -200,6 +207,7 @@ class TestEasyStorage:
         assert backend.signing_secret == "my-secret-key"
 
     @patch("svc_infra.storage.easy.StorageSettings")
+    @pytest.mark.usefixtures("fresh_settings_cache")
     def test_uses_settings_for_auto_detection(self, mock_settings):
         """Test that easy_storage uses StorageSettings for auto-detection."""
         # Mock settings instance
@@ -222,22 +230,13 @@ class TestEasyStorage:
         assert isinstance(backend, LocalBackend)
         assert backend.signing_secret == "custom-secret"
 
-    def test_priority_explicit_over_auto(self, monkeypatch):
-        """Test explicit backend takes priority over auto-detection."""
-        # Set Railway env var
-        monkeypatch.setenv("RAILWAY_VOLUME_MOUNT_PATH", "/data")
-
-        # But explicitly request memory
-        backend = easy_storage(backend="memory")
-
-        assert isinstance(backend, MemoryBackend)
-
     def test_kwargs_passed_to_backend(self):
         """Test that extra kwargs are passed to backend constructor."""
         backend = easy_storage(backend="memory", max_size=5000)
 
         assert backend.max_size == 5000
 
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
     def test_s3_region_default(self):
         """Test S3 backend with default region."""
@@ -262,8 +261,9 @@ class TestEasyStorage:
         # Should have some default path (from settings or ./storage)
         assert backend.base_path is not None
 
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_detection_order(self, monkeypatch):
+    def test_detection_order(self, monkeypatch, s3_backend_cls):
         """Test detection order: explicit > STORAGE_BACKEND > Railway > S3 > memory."""
         # Set both Railway and S3
         monkeypatch.setenv("RAILWAY_VOLUME_MOUNT_PATH", "/railway")
@@ -276,7 +276,7 @@ class TestEasyStorage:
 
         # Without explicit, STORAGE_BACKEND=s3 takes precedence over Railway
         backend2 = easy_storage()
-        assert isinstance(backend2, S3Backend)
+        assert isinstance(backend2, s3_backend_cls)
         assert backend2.bucket == "s3-bucket"
 
 
@@ -302,6 +302,7 @@ class TestEasyStorageLogging:
         # Implementation may log Railway detection
         assert "Railway" in caplog.text or len(caplog.records) >= 0
 
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
     def test_logs_provider_name(self, monkeypatch, caplog):
         """Test S3 provider name logging."""
@@ -320,30 +321,34 @@ class TestEasyStorageLogging:
 class TestEasyStorageEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_none_backend_uses_auto_detection(self):
-        """Test that backend=None triggers auto-detection."""
-        backend = easy_storage(backend=None)
-        # Should auto-detect and default to memory if nothing configured
-        assert isinstance(backend, MemoryBackend)
-
-    def test_empty_string_backend(self):
-        """Test empty string backend triggers auto-detection."""
-        backend = easy_storage(backend="")
-        # Empty string treated as None, triggers auto-detection
-        assert isinstance(backend, MemoryBackend)
-
-    def test_case_insensitive_backend_names(self):
-        """Test backend names work with lowercase."""
-        backend = easy_storage(backend="memory")
-        assert isinstance(backend, MemoryBackend)
-
+    @pytest.mark.usefixtures("_clean_env")
+    @pytest.mark.parametrize(
+        ("backend_arg", "env", "expected"),
+        [
+            # Explicit backend wins over a Railway volume that would auto-detect local
+            ("memory", {"RAILWAY_VOLUME_MOUNT_PATH": "/data"}, MemoryBackend),
+            # None and "" both fall through to auto-detection, which defaults to memory
+            (None, {}, MemoryBackend),
+            ("", {}, MemoryBackend),
+            ("memory", {}, MemoryBackend),
+        ],
+        ids=["explicit_over_auto", "none_auto_detects", "empty_string_auto_detects", "lowercase"],
+    )
+    def test_backend_argument_dispatch(self, monkeypatch, backend_arg, env, expected):
+        """Test how the backend argument chooses between explicit and auto-detected backends."""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        assert isinstance(easy_storage(backend=backend_arg), expected)
+
+    @pytest.mark.storage_s3
     @pytest.mark.skipif(not AIOBOTO3_AVAILABLE, reason="aioboto3 not installed")
-    def test_s3_with_incomplete_config(self):
+    def test_s3_with_incomplete_config(self, s3_backend_cls):
         """Test S3 with incomplete configuration."""
         # Bucket but no credentials (should work with IAM role or env)
         backend = easy_storage(backend="s3", bucket="test-bucket", region="us-east-1")
 
-        assert isinstance(backend, S3Backend)
+        assert isinstance(backend, s3_backend_cls)
         assert backend.access_key is None  # Will use env or IAM
 
     def test_local_with_relative_path(self):
@@ -1,25 +1,45 @@
 """Unit tests for LocalBackend."""
 
+import hashlib
+import hmac
 import json
-import tempfile
+import os
+import uuid
 
 import pytest
 import pytest_asyncio
 
+from svc_infra.storage.backends import local as local_module
 from svc_infra.storage.backends.local import LocalBackend
 from svc_infra.storage.base import FileNotFoundError, InvalidKeyError
+from tests.unit.storage.conftest import seed
+
+# Every byte value once; immutable, so shared across tests
+_ALL_BYTES = bytes(range(256))
+
+
+@pytest.fixture(scope="module")
+def tmp_root(tmp_path_factory):
+    """One temporary root for the module; each test gets its own subdirectory."""
+    return tmp_path_factory.mktemp("local_backend")
+
+
+@pytest.fixture(scope="module")
+def large_payload():
+    """1 MiB of random bytes, generated once for the module."""
+    return os.urandom(1 << 20)
 
 
 @pytest.mark.storage
-@pytest.mark.asyncio
 class TestLocalBackend:
     """Test suite for LocalBackend."""
 
     @pytest_asyncio.fixture
-    async def temp_dir(self):
-        """Create temporary directory for tests."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
+    async def temp_dir(self, tmp_root):
+        """Create an empty per-test directory under the shared module root."""
+        path = tmp_root / uuid.uuid4().hex
+        path.mkdir()
+        return str(path)
 
     @pytest_asyncio.fixture
     async def backend(self, temp_dir):
@@ -155,24 +175,29 @@ class TestLocalBackend:
         """Test URL signature verification with valid signature."""
         await backend.put("test/file.txt", b"data", "text/plain")
 
-        url = await backend.get_url("test/file.txt", expires_in=3600)
-
-        # Extract query parameters
-        from urllib.parse import parse_qs, urlparse
-
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
+        url, params = await backend.get_url_parts("test/file.txt", expires_in=3600)
+        assert f"signature={params['signature']}" in url
 
         # Verify
         is_valid = backend.verify_url(
             key="test/file.txt",
-            expires=params["expires"][0],
-            signature=params["signature"][0],
+            expires=params["expires"],
+            signature=params["signature"],
             download=False,
         )
 
         assert is_valid is True
 
+    async def test_sign_url_matches_one_shot_hmac(self, backend):
+        """Test signatures from the primed signer match a one-shot HMAC-SHA256."""
+        expected = hmac.new(
+            b"test-secret-key", b"test/file.txt:1700000000:False", hashlib.sha256
+        ).hexdigest()
+
+        assert backend._sign_url("test/file.txt", 1700000000, False) == expected
+        # Copying leaves the primed signer untouched for the next message
+        assert backend._sign_url("test/file.txt", 1700000000, False) == expected
+
     async def test_verify_url_invalid_signature(self, backend):
         """Test URL verification with invalid signature."""
         await backend.put("test/file.txt", b"data", "text/plain")
@@ -207,9 +232,14 @@ class TestLocalBackend:
 
     async def test_list_keys(self, backend):
         """Test listing all keys."""
-        await backend.put("file1.txt", b"data1", "text/plain")
-        await backend.put("file2.txt", b"data2", "text/plain")
-        await backend.put("dir/file3.txt", b"data3", "text/plain")
+        await seed(
+            backend,
+            [
+                ("file1.txt", b"data1", "text/plain"),
+                ("file2.txt", b"data2", "text/plain"),
+                ("dir/file3.txt", b"data3", "text/plain"),
+            ],
+        )
 
         keys = await backend.list_keys()
         assert len(keys) == 3
@@ -219,9 +249,14 @@ class TestLocalBackend:
 
     async def test_list_keys_with_prefix(self, backend):
         """Test listing keys with prefix filter."""
-        await backend.put("avatars/user1.jpg", b"img1", "image/jpeg")
-        await backend.put("avatars/user2.jpg", b"img2", "image/jpeg")
-        await backend.put("documents/doc1.pdf", b"pdf1", "application/pdf")
+        await seed(
+            backend,
+            [
+                ("avatars/user1.jpg", b"img1", "image/jpeg"),
+                ("avatars/user2.jpg", b"img2", "image/jpeg"),
+                ("documents/doc1.pdf", b"pdf1", "application/pdf"),
+            ],
+        )
 
         keys = await backend.list_keys(prefix="avatars/")
         assert len(keys) == 2
@@ -229,16 +264,17 @@ class TestLocalBackend:
 
     async def test_list_keys_with_limit(self, backend):
         """Test listing keys with limit."""
-        for i in range(10):
-            await backend.put(f"file{i}.txt", b"data", "text/plain")
+        await seed(backend, [(f"file{i}.txt", b"data", "text/plain") for i in range(10)])
 
         keys = await backend.list_keys(limit=5)
         assert len(keys) == 5
 
     async def test_list_keys_excludes_metadata(self, backend):
         """Test that list_keys excludes .meta.json files."""
-        await backend.put("file1.txt", b"data1", "text/plain")
-        await backend.put("file2.txt", b"data2", "text/plain")
+        await seed(
+            backend,
+            [("file1.txt", b"data1", "text/plain"), ("file2.txt", b"data2", "text/plain")],
+        )
 
         keys = await backend.list_keys()
 
@@ -294,33 +330,61 @@ class TestLocalBackend:
         # Actual file should exist
         assert file_path.exists()
 
-    async def test_invalid_key_validation(self, backend):
-        """Test key validation."""
-        # Empty key
-        with pytest.raises(InvalidKeyError):
-            await backend.put("", b"data", "text/plain")
+    async def test_non_atomic_small_write(self, temp_dir, monkeypatch):
+        """Test that small puts skip the rename when atomic writes are disabled."""
+        backend = LocalBackend(base_path=temp_dir, atomic=False)
+        renames = []
+        monkeypatch.setattr(local_module.aiofiles.os, "rename", renames.append)
 
-        # Leading slash
-        with pytest.raises(InvalidKeyError):
-            await backend.put("/file.txt", b"data", "text/plain")
+        await backend.put("test/file.txt", b"data", "text/plain")
 
-        # Path traversal
-        with pytest.raises(InvalidKeyError):
-            await backend.put("../etc/passwd", b"data", "text/plain")
+        assert renames == []
+        assert await backend.get("test/file.txt") == b"data"
+
+    async def test_non_atomic_large_write(self, temp_dir, monkeypatch):
+        """Test that puts of 64 KiB or more still use temp file + rename when non-atomic."""
+        backend = LocalBackend(base_path=temp_dir, atomic=False)
+        data = b"x" * local_module._DIRECT_WRITE_MAX_BYTES
+        rename = local_module.aiofiles.os.rename
+        renames = []
+
+        async def recording_rename(src, dst):
+            renames.append((src, dst))
+            await rename(src, dst)
 
-        # Too long
+        monkeypatch.setattr(local_module.aiofiles.os, "rename", recording_rename)
+
+        await backend.put("test/file.txt", data, "text/plain")
+
+        file_path = backend._get_file_path("test/file.txt")
+        assert renames == [(file_path.with_suffix(".txt.tmp"), file_path)]
+        assert await backend.get("test/file.txt") == data
+
+    @pytest.mark.parametrize(
+        "key",
+        ["", "/file.txt", "../etc/passwd", "x" * 1025],
+        ids=["empty", "leading_slash", "path_traversal", "too_long"],
+    )
+    async def test_invalid_key_validation(self, backend, key):
+        """Test key validation."""
         with pytest.raises(InvalidKeyError):
-            await backend.put("x" * 1025, b"data", "text/plain")
+            await backend.put(key, b"data", "text/plain")
 
-    async def test_binary_data(self, backend):
-        """Test storing binary data."""
-        binary_data = bytes(range(256))
+    async def test_binary_data_small(self, backend):
+        """Test storing every byte value."""
+        binary_data = _ALL_BYTES
 
         await backend.put("binary.bin", binary_data, "application/octet-stream")
 
         retrieved = await backend.get("binary.bin")
         assert retrieved == binary_data
 
+    async def test_binary_data_large(self, backend, large_payload):
+        """Test a 1 MiB round trip through the buffered write and read path."""
+        await backend.put("big.bin", large_payload, "application/octet-stream")
+
+        assert await backend.get("big.bin") == large_payload
+
     async def test_railway_volume_detection(self, temp_dir, monkeypatch):
         """Test Railway volume path detection."""
 
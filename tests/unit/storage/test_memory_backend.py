@@ -1,6 +1,9 @@
 """Unit tests for MemoryBackend."""
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 
 from svc_infra.storage.backends.memory import MemoryBackend
 from svc_infra.storage.base import (
@@ -8,17 +11,47 @@ from svc_infra.storage.base import (
     InvalidKeyError,
     QuotaExceededError,
 )
+from tests.unit.storage.conftest import seed
+
+# Immutable payloads, built once and shared across tests
+_ONE_MIB = b"x" * (1024 * 1024)
+_ALL_BYTES = bytes(range(256))
+
+
+@pytest.fixture(scope="module")
+def backend_pool():
+    """MemoryBackend instances built once per module, keyed by max_size."""
+    return {}
+
+
+@pytest_asyncio.fixture
+async def make_backend(backend_pool):
+    """Hand out pooled MemoryBackends by max_size, clearing each one after the test."""
+    used = []
+
+    def make(max_size: int = 100_000_000) -> MemoryBackend:
+        if max_size not in backend_pool:
+            backend_pool[max_size] = MemoryBackend(max_size=max_size)
+        used.append(backend_pool[max_size])
+        return backend_pool[max_size]
+
+    yield make
+    for backend in used:
+        await backend.clear()
+
+
+@pytest_asyncio.fixture
+async def backend(make_backend):
+    """Module-shared MemoryBackend with the default quota, emptied after each test."""
+    return make_backend()
 
 
 @pytest.mark.storage
-@pytest.mark.asyncio
 class TestMemoryBackend:
     """Test suite for MemoryBackend."""
 
-    async def test_put_and_get(self):
+    async def test_put_and_get(self, backend):
         """Test basic file storage and retrieval."""
-        backend = MemoryBackend()
-
         # Put file
         url = await backend.put(
             key="test/file.txt",
@@ -32,10 +65,8 @@ class TestMemoryBackend:
         data = await backend.get("test/file.txt")
         assert data == b"Hello, World!"
 
-    async def test_put_with_metadata(self):
+    async def test_put_with_metadata(self, backend):
         """Test storing file with custom metadata."""
-        backend = MemoryBackend()
-
         await backend.put(
             key="test/file.txt",
             data=b"test data",
@@ -50,19 +81,15 @@ class TestMemoryBackend:
         assert metadata["content_type"] == "text/plain"
         assert "created_at" in metadata
 
-    async def test_get_nonexistent_file(self):
+    async def test_get_nonexistent_file(self, backend):
         """Test getting a file that doesn't exist."""
-        backend = MemoryBackend()
-
         with pytest.raises(FileNotFoundError) as exc_info:
             await backend.get("nonexistent.txt")
 
-        assert "not found" in str(exc_info.value).lower()
+        assert exc_info.value.code == "not_found"
 
-    async def test_delete(self):
+    async def test_delete(self, backend):
         """Test file deletion."""
-        backend = MemoryBackend()
-
         # Put file
         await backend.put("test/file.txt", b"data", "text/plain")
 
@@ -76,17 +103,13 @@ class TestMemoryBackend:
         # Verify doesn't exist
         assert not await backend.exists("test/file.txt")
 
-    async def test_delete_nonexistent(self):
+    async def test_delete_nonexistent(self, backend):
         """Test deleting a file that doesn't exist."""
-        backend = MemoryBackend()
-
         deleted = await backend.delete("nonexistent.txt")
         assert deleted is False
 
-    async def test_exists(self):
+    async def test_exists(self, backend):
         """Test file existence check."""
-        backend = MemoryBackend()
-
         # File doesn't exist initially
         assert not await backend.exists("test/file.txt")
 
@@ -96,10 +119,8 @@ class TestMemoryBackend:
         # Now it exists
         assert await backend.exists("test/file.txt")
 
-    async def test_get_url(self):
+    async def test_get_url(self, backend):
         """Test URL generation."""
-        backend = MemoryBackend()
-
         await backend.put("test/file.txt", b"data", "text/plain")
 
         # Regular URL
@@ -110,28 +131,27 @@ class TestMemoryBackend:
         url = await backend.get_url("test/file.txt", download=True)
         assert url == "memory://test/file.txt?download=true"
 
-    async def test_get_url_nonexistent(self):
+    async def test_get_url_nonexistent(self, backend):
         """Test URL generation for nonexistent file."""
-        backend = MemoryBackend()
-
         with pytest.raises(FileNotFoundError):
             await backend.get_url("nonexistent.txt")
 
-    async def test_list_keys_empty(self):
+    async def test_list_keys_empty(self, backend):
         """Test listing keys when storage is empty."""
-        backend = MemoryBackend()
-
         keys = await backend.list_keys()
         assert keys == []
 
-    async def test_list_keys(self):
+    async def test_list_keys(self, backend):
         """Test listing all keys."""
-        backend = MemoryBackend()
-
         # Add multiple files
-        await backend.put("file1.txt", b"data1", "text/plain")
-        await backend.put("file2.txt", b"data2", "text/plain")
-        await backend.put("dir/file3.txt", b"data3", "text/plain")
+        await seed(
+            backend,
+            [
+                ("file1.txt", b"data1", "text/plain"),
+                ("file2.txt", b"data2", "text/plain"),
+                ("dir/file3.txt", b"data3", "text/plain"),
+            ],
+        )
 
         keys = await backend.list_keys()
         assert len(keys) == 3
@@ -139,13 +159,16 @@ class TestMemoryBackend:
         assert "file2.txt" in keys
         assert "dir/file3.txt" in keys
 
-    async def test_list_keys_with_prefix(self):
+    async def test_list_keys_with_prefix(self, backend):
         """Test listing keys with prefix filter."""
-        backend = MemoryBackend()
-
-        await backend.put("avatars/user1.jpg", b"img1", "image/jpeg")
-        await backend.put("avatars/user2.jpg", b"img2", "image/jpeg")
-        await backend.put("documents/doc1.pdf", b"pdf1", "application/pdf")
+        await seed(
+            backend,
+            [
+                ("avatars/user1.jpg", b"img1", "image/jpeg"),
+                ("avatars/user2.jpg", b"img2", "image/jpeg"),
+                ("documents/doc1.pdf", b"pdf1", "application/pdf"),
+            ],
+        )
 
         keys = await backend.list_keys(prefix="avatars/")
         assert len(keys) == 2
@@ -153,20 +176,44 @@ class TestMemoryBackend:
         assert "avatars/user2.jpg" in keys
         assert "documents/doc1.pdf" not in keys
 
-    async def test_list_keys_with_limit(self):
+    async def test_list_keys_with_limit(self, backend):
         """Test listing keys with limit."""
-        backend = MemoryBackend()
-
-        for i in range(10):
-            await backend.put(f"file{i}.txt", b"data", "text/plain")
+        await backend.put_many([(f"file{i}.txt", b"data", "text/plain") for i in range(10)])
 
         keys = await backend.list_keys(limit=5)
         assert len(keys) == 5
 
-    async def test_get_metadata(self):
-        """Test retrieving file metadata."""
-        backend = MemoryBackend()
+    async def test_put_many(self, backend):
+        """Test storing several files in one call."""
+        urls = await backend.put_many(
+            [
+                ("file1.txt", b"data1", "text/plain"),
+                ("dir/file2.json", b"{}", "application/json"),
+            ]
+        )
+
+        assert urls == ["memory://file1.txt", "memory://dir/file2.json"]
+        assert await backend.get("file1.txt") == b"data1"
+        metadata = await backend.get_metadata("dir/file2.json")
+        assert metadata["size"] == 2
+        assert metadata["content_type"] == "application/json"
 
+    async def test_put_many_is_all_or_nothing(self, make_backend):
+        """Test a batch over quota or with a bad key stores nothing."""
+        backend = make_backend(max_size=100)
+
+        with pytest.raises(QuotaExceededError):
+            await backend.put_many(
+                [("file1.txt", b"x" * 60, "text/plain"), ("file2.txt", b"y" * 60, "text/plain")]
+            )
+
+        with pytest.raises(InvalidKeyError):
+            await backend.put_many([("file1.txt", b"x", "text/plain"), ("", b"y", "text/plain")])
+
+        assert await backend.list_keys() == []
+
+    async def test_get_metadata(self, backend):
+        """Test retrieving file metadata."""
         await backend.put(
             key="test/file.txt",
             data=b"test data",
@@ -180,32 +227,29 @@ class TestMemoryBackend:
         assert metadata["custom"] == "value"
         assert "created_at" in metadata
 
-    async def test_get_metadata_nonexistent(self):
+    async def test_get_metadata_nonexistent(self, backend):
         """Test getting metadata for nonexistent file."""
-        backend = MemoryBackend()
-
         with pytest.raises(FileNotFoundError):
             await backend.get_metadata("nonexistent.txt")
 
-    async def test_quota_enforcement(self):
+    async def test_quota_enforcement(self, make_backend):
         """Test storage quota enforcement."""
-        backend = MemoryBackend(max_size=100)  # 100 bytes max
+        backend = make_backend(max_size=100)  # 100 bytes max
 
-        # Put 50 bytes - should succeed
-        await backend.put("file1.txt", b"x" * 50, "text/plain")
-
-        # Put another 50 bytes - should succeed
-        await backend.put("file2.txt", b"y" * 50, "text/plain")
+        # Put 50 + 50 bytes - both should succeed
+        await backend.put_many(
+            [("file1.txt", b"x" * 50, "text/plain"), ("file2.txt", b"y" * 50, "text/plain")]
+        )
 
         # Try to put 1 more byte - should fail
         with pytest.raises(QuotaExceededError) as exc_info:
             await backend.put("file3.txt", b"z", "text/plain")
 
-        assert "quota exceeded" in str(exc_info.value).lower()
+        assert exc_info.value.code == "quota_exceeded"
 
-    async def test_quota_replace_file(self):
+    async def test_quota_replace_file(self, make_backend):
         """Test quota when replacing existing file."""
-        backend = MemoryBackend(max_size=100)
+        backend = make_backend(max_size=100)
 
         # Put 80 bytes
         await backend.put("file.txt", b"x" * 80, "text/plain")
@@ -216,56 +260,39 @@ class TestMemoryBackend:
         data = await backend.get("file.txt")
         assert data == b"y" * 90
 
-    async def test_invalid_key_empty(self):
-        """Test validation for empty key."""
-        backend = MemoryBackend()
-
-        with pytest.raises(InvalidKeyError):
-            await backend.put("", b"data", "text/plain")
-
-    async def test_invalid_key_leading_slash(self):
-        """Test validation for key with leading slash."""
-        backend = MemoryBackend()
-
-        with pytest.raises(InvalidKeyError):
-            await backend.put("/file.txt", b"data", "text/plain")
-
-    async def test_invalid_key_path_traversal(self):
-        """Test validation for path traversal."""
-        backend = MemoryBackend()
-
-        with pytest.raises(InvalidKeyError):
-            await backend.put("../etc/passwd", b"data", "text/plain")
-
+    @pytest.mark.parametrize(
+        "bad_key",
+        [
+            "",
+            "/file.txt",
+            "../etc/passwd",
+            "dir/../other/file.txt",
+            "x" * 1025,  # Over 1024 limit
+            "file<script>.txt",
+            "file|dangerous.txt",
+        ],
+        ids=[
+            "empty",
+            "leading_slash",
+            "path_traversal",
+            "nested_path_traversal",
+            "too_long",
+            "unsafe_angle_brackets",
+            "unsafe_pipe",
+        ],
+    )
+    async def test_invalid_key(self, backend, bad_key):
+        """Test key validation rejects empty, absolute, traversal, long and unsafe keys."""
         with pytest.raises(InvalidKeyError):
-            await backend.put("dir/../other/file.txt", b"data", "text/plain")
+            await backend.put(bad_key, b"data", "text/plain")
 
-    async def test_invalid_key_too_long(self):
-        """Test validation for excessively long key."""
-        backend = MemoryBackend()
-
-        long_key = "x" * 1025  # Over 1024 limit
-
-        with pytest.raises(InvalidKeyError):
-            await backend.put(long_key, b"data", "text/plain")
-
-    async def test_invalid_key_unsafe_chars(self):
-        """Test validation for unsafe characters."""
-        backend = MemoryBackend()
-
-        with pytest.raises(InvalidKeyError):
-            await backend.put("file<script>.txt", b"data", "text/plain")
-
-        with pytest.raises(InvalidKeyError):
-            await backend.put("file|dangerous.txt", b"data", "text/plain")
-
-    async def test_clear(self):
+    async def test_clear(self, backend):
         """Test clearing all storage."""
-        backend = MemoryBackend()
-
         # Add files
-        await backend.put("file1.txt", b"data1", "text/plain")
-        await backend.put("file2.txt", b"data2", "text/plain")
+        await seed(
+            backend,
+            [("file1.txt", b"data1", "text/plain"), ("file2.txt", b"data2", "text/plain")],
+        )
 
         # Verify they exist
         assert await backend.exists("file1.txt")
@@ -278,9 +305,9 @@ class TestMemoryBackend:
         assert not await backend.exists("file1.txt")
         assert not await backend.exists("file2.txt")
 
-    async def test_get_stats(self):
+    async def test_get_stats(self, make_backend):
         """Test getting storage statistics."""
-        backend = MemoryBackend(max_size=1000)
+        backend = make_backend(max_size=1000)
 
         stats = backend.get_stats()
         assert stats["file_count"] == 0
@@ -288,48 +315,45 @@ class TestMemoryBackend:
         assert stats["max_size"] == 1000
 
         # Add files
-        await backend.put("file1.txt", b"x" * 100, "text/plain")
-        await backend.put("file2.txt", b"y" * 200, "text/plain")
+        await seed(
+            backend,
+            [("file1.txt", b"x" * 100, "text/plain"), ("file2.txt", b"y" * 200, "text/plain")],
+        )
 
         stats = backend.get_stats()
         assert stats["file_count"] == 2
         assert stats["total_size"] == 300
         assert stats["max_size"] == 1000
 
-    async def test_concurrent_access(self):
+    async def test_concurrent_access(self, backend):
         """Test thread-safe concurrent access."""
-        import asyncio
-
-        backend = MemoryBackend()
-
-        async def put_file(n: int):
-            await backend.put(f"file{n}.txt", f"data{n}".encode(), "text/plain")
+        payloads = [(f"file{i}.txt", f"data{i}".encode()) for i in range(10)]
 
         # Put 10 files concurrently
-        await asyncio.gather(*[put_file(i) for i in range(10)])
+        async with asyncio.TaskGroup() as tg:
+            for key, data in payloads:
+                tg.create_task(backend.put(key, data, "text/plain"))
 
         # Verify all files exist
         keys = await backend.list_keys()
         assert len(keys) == 10
 
-    async def test_binary_data(self):
+    async def test_binary_data(self, backend):
         """Test storing binary data."""
-        backend = MemoryBackend()
-
         # Binary data (not UTF-8 text)
-        binary_data = bytes(range(256))
+        binary_data = _ALL_BYTES
 
         await backend.put("binary.bin", binary_data, "application/octet-stream")
 
         retrieved = await backend.get("binary.bin")
         assert retrieved == binary_data
 
-    async def test_large_file(self):
+    async def test_large_file(self, make_backend):
         """Test storing larger file."""
-        backend = MemoryBackend(max_size=10_000_000)  # 10MB
+        backend = make_backend(max_size=10_000_000)  # 10MB
 
         # 1MB file
-        large_data = b"x" * (1024 * 1024)
+        large_data = _ONE_MIB
 
         await backend.put("large.bin", large_data, "application/octet-stream")
 
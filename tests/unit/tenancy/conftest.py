@@ -0,0 +1,16 @@
+"""
+Tenancy test fixtures and configuration.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from svc_infra.api.fastapi.tenancy.context import set_tenant_resolver
+
+
+@pytest.fixture(autouse=True)
+def _reset_tenant_resolver():
+    """Drop any tenant resolver override a test installed, even if it failed."""
+    yield
+    set_tenant_resolver(None)
@@ -12,29 +12,33 @@ from svc_infra.api.fastapi.tenancy.context import (
     set_tenant_resolver,
 )
 
+# Read-only template; each request gets its own copy because Starlette keeps the scope
+# it is given and stores request.state inside it
+_BASE_SCOPE = types.MappingProxyType(
+    {"type": "http", "http_version": "1.1", "method": "GET", "path": "/", "headers": ()}
+)
+
 
 def _request(*, headers: list[tuple[bytes, bytes]] | None = None) -> Request:
-    scope = {
-        "type": "http",
-        "http_version": "1.1",
-        "method": "GET",
-        "path": "/",
-        "headers": headers or [],
-    }
+    scope = dict(_BASE_SCOPE)
+    if headers is not None:
+        scope["headers"] = headers
     return Request(scope)
 
 
-@pytest.mark.asyncio
+# Read-only request shared by tests that never touch request.state
+_SHARED_REQ = _request()
+
+
 async def test_resolve_tenant_from_identity_user():
     user = types.SimpleNamespace(tenant_id="tenant_user")
     principal = types.SimpleNamespace(user=user, api_key=None)
 
-    tenant_id = await resolve_tenant_id(_request(), identity=principal)
+    tenant_id = await resolve_tenant_id(_SHARED_REQ, identity=principal)
 
     assert tenant_id == "tenant_user"
 
 
-@pytest.mark.asyncio
 async def test_override_hook_takes_precedence():
     calls: list[tuple[Request, object | None, str | None]] = []
 
@@ -43,16 +47,12 @@ async def test_override_hook_takes_precedence():
         return "tenant_override"
 
     set_tenant_resolver(_override)
-    try:
-        tenant_id = await resolve_tenant_id(_request())
-    finally:
-        set_tenant_resolver(None)
+    tenant_id = await resolve_tenant_id(_SHARED_REQ)
 
     assert calls, "override hook should be invoked"
     assert tenant_id == "tenant_override"
 
 
-@pytest.mark.asyncio
 async def test_override_can_defer_to_default_flow():
     calls: list[tuple[Request, object | None, str | None]] = []
 
@@ -61,33 +61,27 @@ async def test_override_can_defer_to_default_flow():
         return None
 
     set_tenant_resolver(_override)
-    try:
-        tenant_id = await resolve_tenant_id(_request(), tenant_header="tenant_header")
-    finally:
-        set_tenant_resolver(None)
+    tenant_id = await resolve_tenant_id(_SHARED_REQ, tenant_header="tenant_header")
 
     assert calls, "override should be called even when deferring"
     assert tenant_id == "tenant_header"
 
 
-@pytest.mark.asyncio
 async def test_resolve_tenant_from_principal_api_key():
     api_key = types.SimpleNamespace(tenant_id="tenant_api")
     principal = types.SimpleNamespace(user=None, api_key=api_key)
 
-    tenant_id = await resolve_tenant_id(_request(), identity=principal)
+    tenant_id = await resolve_tenant_id(_SHARED_REQ, identity=principal)
 
     assert tenant_id == "tenant_api"
 
 
-@pytest.mark.asyncio
 async def test_resolve_tenant_from_header():
-    tenant_id = await resolve_tenant_id(_request(), tenant_header="tenant_header")
+    tenant_id = await resolve_tenant_id(_SHARED_REQ, tenant_header="tenant_header")
 
     assert tenant_id == "tenant_header"
 
 
-@pytest.mark.asyncio
 async def test_resolve_tenant_from_request_state():
     request = _request()
     request.state.tenant_id = "tenant_state"
@@ -97,7 +91,6 @@ async def test_resolve_tenant_from_request_state():
     assert tenant_id == "tenant_state"
 
 
-@pytest.mark.asyncio
 async def test_missing_tenant_context_raises():
     with pytest.raises(HTTPException) as exc:
         await require_tenant_id(tenant_id=None)  # type: ignore[arg-type]
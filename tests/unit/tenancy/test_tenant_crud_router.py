@@ -13,6 +13,8 @@ from pydantic import BaseModel  # noqa: E402
 from svc_infra.api.fastapi.db.sql.crud_router import make_tenant_crud_router_plus_sql  # noqa: E402
 from svc_infra.api.fastapi.db.sql.session import get_session  # noqa: E402
 
+_TENANT_KEYS = frozenset({"tenant", "tenant_id"})
+
 
 class _TenantCol:
     def __eq__(self, other):
@@ -21,6 +23,9 @@ class _TenantCol:
 
 class _FakeService:
     def __init__(self):
+        self.reset()
+
+    def reset(self):
         # store by tenant_id -> list of rows
         self.data: dict[str, list[dict[str, Any]]] = {"t1": [], "t2": []}
         self._id = 1
@@ -42,18 +47,14 @@ class _FakeService:
 
     @staticmethod
     def _tenant_from_where(where):
-        if not where or not isinstance(where, list) or len(where) == 0:
+        if not where:
             return None
         first = where[0]
-        # Handle tuple format: ("tenant_id", value)
-        if isinstance(first, tuple) and len(first) == 2:
-            if first[0] in ("tenant", "tenant_id"):
-                return first[1]
-        # Handle SQLAlchemy BinaryExpression: Model.tenant_id == "t1"
-        # These have .right attribute for the value
-        if hasattr(first, "right") and hasattr(first.right, "value"):
-            return first.right.value
-        return None
+        # Tuple format: ("tenant_id", value)
+        if isinstance(first, tuple):
+            return first[1] if len(first) == 2 and first[0] in _TENANT_KEYS else None
+        # SQLAlchemy BinaryExpression: Model.tenant_id == "t1" carries the value on .right
+        return getattr(getattr(first, "right", None), "value", None)
 
     async def list(self, session, *, limit, offset, order_by=None, where=None):
         tid = self._tenant_from_where(where)
@@ -131,17 +132,25 @@ class _Read(BaseModel):
     tenant_id: str | None = None
 
 
-def _service_factory():
-    # returns an instance; router will wrap with TenantSqlService
+@pytest.fixture(scope="module")
+def fake_service():
     return _FakeService()
 
 
-@pytest.fixture
-def app():
+@pytest.fixture(autouse=True)
+def _reset_fake_service(fake_service):
+    # The router and its service are shared by the module; start each test with no rows
+    fake_service.reset()
+
+
+@pytest.fixture(scope="module")
+def app(fake_service):
+    # Built once per module: router construction walks the schemas and OpenAPI metadata
     app = FastAPI()
     router = make_tenant_crud_router_plus_sql(
         model=dict,  # model type is not used by fake service
-        service_factory=_service_factory,
+        # returns the shared instance; router will wrap with TenantSqlService
+        service_factory=lambda: fake_service,
         read_schema=_Read,  # only used for annotation/casting
         create_schema=_Create,
         update_schema=_Update,
@@ -162,23 +171,26 @@ def app():
     return app
 
 
-def _client_with_tenant(app, tenant_id: str):
-    return TestClient(app, headers={"X-Tenant-Id": tenant_id})
+@pytest.fixture(scope="module")
+def client(app):
+    # One client for every tenant; tenant scoping lives entirely in the request header
+    return TestClient(app)
+
 
+T1 = {"X-Tenant-Id": "t1"}
+T2 = {"X-Tenant-Id": "t2"}
 
-def test_create_injects_tenant_and_scopes_list(app):
-    c1 = _client_with_tenant(app, "t1")
-    c2 = _client_with_tenant(app, "t2")
 
-    r = c1.post("/items", json={"name": "A"})
+def test_create_injects_tenant_and_scopes_list(client):
+    r = client.post("/items", json={"name": "A"}, headers=T1)
     assert r.status_code == 201
     assert r.json()["tenant_id"] == "t1"
 
-    r = c2.get("/items")
+    r = client.get("/items", headers=T2)
     assert r.status_code == 200
     assert r.json()["total"] == 0
 
-    r = c1.get("/items")
+    r = client.get("/items", headers=T1)
     assert r.status_code == 200
     body = r.json()
     assert body["total"] == 1
@@ -186,27 +198,24 @@ def test_create_injects_tenant_and_scopes_list(app):
     assert body["items"][0]["tenant_id"] == "t1"
 
 
-def test_cross_tenant_access_is_404(app):
-    c1 = _client_with_tenant(app, "t1")
-    c2 = _client_with_tenant(app, "t2")
-
-    r = c1.post("/items", json={"name": "A"})
+def test_cross_tenant_access_is_404(client):
+    r = client.post("/items", json={"name": "A"}, headers=T1)
     item_id = r.json()["id"]
 
     # Another tenant cannot fetch it
-    r = c2.get(f"/items/{item_id}")
+    r = client.get(f"/items/{item_id}", headers=T2)
     assert r.status_code == 404
 
     # Owner tenant can update; cross-tenant cannot
-    r_ok = c1.patch(f"/items/{item_id}", json={"name": "AA"})
+    r_ok = client.patch(f"/items/{item_id}", json={"name": "AA"}, headers=T1)
     assert r_ok.status_code == 200
     assert r_ok.json()["name"] == "AA"
 
-    r_no = c2.patch(f"/items/{item_id}", json={"name": "BB"})
+    r_no = client.patch(f"/items/{item_id}", json={"name": "BB"}, headers=T2)
     assert r_no.status_code == 404
 
     # Delete by owner ok, others 404
-    r_del_no = c2.delete(f"/items/{item_id}")
+    r_del_no = client.delete(f"/items/{item_id}", headers=T2)
     assert r_del_no.status_code == 404
-    r_del_ok = c1.delete(f"/items/{item_id}")
+    r_del_ok = client.delete(f"/items/{item_id}", headers=T1)
     assert r_del_ok.status_code == 204
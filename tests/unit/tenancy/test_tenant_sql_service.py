@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, Mock
 
-import pytest
-
 from svc_infra.db.sql.repository import SqlRepository
 from svc_infra.db.sql.tenant import TenantSqlService
 
@@ -62,7 +60,6 @@ class _Repo(SqlRepository):
         return {"tenant_id"}
 
 
-@pytest.mark.asyncio
 async def test_tenant_service_injects_tenant_on_create():
     repo = _Repo()
     tsvc = TenantSqlService(repo, tenant_id="tA")
@@ -74,7 +71,6 @@ async def test_tenant_service_injects_tenant_on_create():
     repo._create.assert_awaited()
 
 
-@pytest.mark.asyncio
 async def test_tenant_service_scopes_where_filters():
     repo = _Repo()
     tsvc = TenantSqlService(repo, tenant_id="tB")
@@ -379,7 +379,6 @@ class TestGracefulShutdownUnderLoad:
         app.state._inflight_requests = 0
         return app
 
-    @pytest.mark.asyncio
     async def test_inflight_tracker_increments_on_request(self):
         """Test that inflight tracker increments on request start."""
         from svc_infra.api.fastapi.middleware.graceful_shutdown import (
@@ -409,7 +408,6 @@ class TestGracefulShutdownUnderLoad:
         # Count should be 0 after request
         assert mock_app_obj.state._inflight_requests == 0
 
-    @pytest.mark.asyncio
     async def test_inflight_tracker_decrements_on_exception(self):
         """Test that inflight count decrements even on exception."""
         from svc_infra.api.fastapi.middleware.graceful_shutdown import (
@@ -435,7 +433,6 @@ class TestGracefulShutdownUnderLoad:
         # Count should still be 0 after exception
         assert mock_app_obj.state._inflight_requests == 0
 
-    @pytest.mark.asyncio
     async def test_wait_for_drain_returns_when_empty(self):
         """Test wait_for_drain returns immediately when no inflight requests."""
         from svc_infra.api.fastapi.middleware.graceful_shutdown import _wait_for_drain
@@ -453,7 +450,6 @@ class TestGracefulShutdownUnderLoad:
         # Should return almost immediately (< 0.5s)
         assert elapsed < 0.5
 
-    @pytest.mark.asyncio
     async def test_wait_for_drain_waits_for_requests(self):
         """Test wait_for_drain waits for inflight requests to complete."""
         from svc_infra.api.fastapi.middleware.graceful_shutdown import _wait_for_drain
@@ -478,7 +474,6 @@ class TestGracefulShutdownUnderLoad:
         # Should wait for request to complete (~0.3s)
         assert 0.2 < elapsed < 1.0
 
-    @pytest.mark.asyncio
     async def test_wait_for_drain_timeout(self):
         """Test wait_for_drain times out after grace period."""
         from svc_infra.api.fastapi.middleware.graceful_shutdown import _wait_for_drain
@@ -496,7 +491,6 @@ class TestGracefulShutdownUnderLoad:
         # Should timeout after ~0.5 seconds
         assert 0.4 < elapsed < 1.0
 
-    @pytest.mark.asyncio
     async def test_multiple_concurrent_requests_tracking(self):
         """Test tracking multiple concurrent requests."""
         from svc_infra.api.fastapi.middleware.graceful_shutdown import (
@@ -83,7 +83,6 @@ class TestRetryConfig:
 class TestWithRetry:
     """Tests for with_retry decorator."""
 
-    @pytest.mark.asyncio
     async def test_success_no_retry(self) -> None:
         """Test successful call doesn't retry."""
         call_count = 0
@@ -98,7 +97,6 @@ class TestWithRetry:
         assert result == "success"
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_retry_on_failure(self) -> None:
         """Test retries on failure."""
         call_count = 0
@@ -115,7 +113,6 @@ class TestWithRetry:
         assert result == "success"
         assert call_count == 3
 
-    @pytest.mark.asyncio
     async def test_exhausts_retries(self) -> None:
         """Test raises RetryExhaustedError after all attempts."""
 
@@ -129,7 +126,6 @@ class TestWithRetry:
         assert exc_info.value.attempts == 3
         assert isinstance(exc_info.value.last_exception, ValueError)
 
-    @pytest.mark.asyncio
     async def test_retry_only_on_specified(self) -> None:
         """Test only retries on specified exceptions."""
         call_count = 0
@@ -145,7 +141,6 @@ class TestWithRetry:
 
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_on_retry_callback(self) -> None:
         """Test on_retry callback is called."""
         callbacks: list[tuple[int, Exception]] = []
@@ -218,7 +213,6 @@ class TestCircuitBreaker:
         breaker = CircuitBreaker("test")
         assert breaker.state == CircuitState.CLOSED
 
-    @pytest.mark.asyncio
     async def test_opens_after_failures(self) -> None:
         """Test circuit opens after failure threshold."""
         breaker = CircuitBreaker("test", failure_threshold=3)
@@ -232,7 +226,6 @@ class TestCircuitBreaker:
 
         assert breaker.state == CircuitState.OPEN
 
-    @pytest.mark.asyncio
     async def test_rejects_when_open(self) -> None:
         """Test open circuit rejects calls."""
         breaker = CircuitBreaker("test", failure_threshold=1)
@@ -250,7 +243,6 @@ class TestCircuitBreaker:
             async with breaker:
                 pass
 
-    @pytest.mark.asyncio
     async def test_half_open_after_timeout(self) -> None:
         """Test circuit goes to half-open after recovery timeout."""
         breaker = CircuitBreaker(
@@ -279,7 +271,6 @@ class TestCircuitBreaker:
         # Should be closed after success
         assert breaker.state == CircuitState.CLOSED
 
-    @pytest.mark.asyncio
     async def test_protect_decorator(self) -> None:
         """Test protect decorator wraps function."""
         breaker = CircuitBreaker("test")
@@ -302,7 +293,6 @@ class TestCircuitBreaker:
         assert breaker.state == CircuitState.CLOSED
         assert breaker._failure_count == 0
 
-    @pytest.mark.asyncio
     async def test_success_resets_failure_count(self) -> None:
         """Test successful call resets failure count."""
         breaker = CircuitBreaker("test", failure_threshold=3)
@@ -6,8 +6,6 @@ import time
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from svc_infra.testing import (
     CacheEntry,
     MockCache,
@@ -462,7 +460,6 @@ class TestTenantFixtureData:
 class TestCreateTestUser:
     """Tests for create_test_user async function."""
 
-    @pytest.mark.asyncio
     async def test_creates_user_model(self):
         """create_test_user creates and persists user model."""
         # Mock session
@@ -482,7 +479,6 @@ class TestCreateTestUser:
         session.refresh.assert_called_once()
         assert user.is_superuser is True
 
-    @pytest.mark.asyncio
     async def test_sets_full_name_if_provided(self):
         """create_test_user sets full_name when provided."""
         session = AsyncMock()
@@ -502,7 +498,6 @@ class TestCreateTestUser:
 class TestCreateTestTenant:
     """Tests for create_test_tenant async function."""
 
-    @pytest.mark.asyncio
     async def test_creates_tenant_model(self):
         """create_test_tenant creates and persists tenant model."""
         session = AsyncMock()
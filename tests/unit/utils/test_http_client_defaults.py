@@ -24,7 +24,6 @@ def test_sync_client_uses_env_timeout(monkeypatch, val):
         client.close()
 
 
-@pytest.mark.asyncio
 async def test_async_client_uses_env_timeout(monkeypatch):
     monkeypatch.setenv("HTTP_CLIENT_TIMEOUT_SECONDS", "0.321")
     async with new_async_httpx_client() as client:
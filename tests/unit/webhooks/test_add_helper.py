@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -39,7 +38,6 @@ def test_add_webhooks_mounts_router_and_reuses_dependencies():
     assert app.state.webhooks_subscriptions is subs_one
 
 
-@pytest.mark.asyncio
 async def test_add_webhooks_registers_tick_and_handler():
     app = FastAPI()
     queue = InMemoryJobQueue()
@@ -58,7 +58,6 @@ def test_publish_enqueues_subscription_identity():
         assert event["payload"]["id"] == "inv_multi"
 
 
-@pytest.mark.asyncio
 async def test_webhooks_e2e_publish_to_delivery_retry(monkeypatch):
     # Setup
     outbox = InMemoryOutboxStore()
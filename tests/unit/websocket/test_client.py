@@ -60,7 +60,6 @@ class TestWebSocketClientInit:
 class TestWebSocketClientConnect:
     """Test WebSocketClient connect behavior."""
 
-    @pytest.mark.asyncio
     async def test_connect_sets_connection(self):
         """connect() establishes connection."""
         client = WebSocketClient("wss://example.com/ws")
@@ -77,7 +76,6 @@ class TestWebSocketClientConnect:
             assert client._connection is mock_connection
             assert client._closed is False
 
-    @pytest.mark.asyncio
     async def test_connect_raises_on_failure(self):
         """connect() raises ConnectionFailedError on failure."""
         client = WebSocketClient("wss://example.com/ws")
@@ -93,7 +91,6 @@ class TestWebSocketClientConnect:
 class TestWebSocketClientClose:
     """Test WebSocketClient close behavior."""
 
-    @pytest.mark.asyncio
     async def test_close_calls_connection_close(self):
         """close() closes the connection."""
         client = WebSocketClient("wss://example.com/ws")
@@ -105,7 +102,6 @@ class TestWebSocketClientClose:
         mock_connection.close.assert_called_once()
         assert client._closed is True
 
-    @pytest.mark.asyncio
     async def test_close_without_connection(self):
         """close() is safe when not connected."""
         client = WebSocketClient("wss://example.com/ws")
@@ -113,7 +109,6 @@ class TestWebSocketClientClose:
         # Should not raise
         await client.close()
 
-    @pytest.mark.asyncio
     async def test_close_with_code_and_reason(self):
         """close() accepts code and reason."""
         client = WebSocketClient("wss://example.com/ws")
@@ -128,7 +123,6 @@ class TestWebSocketClientClose:
 class TestWebSocketClientMessaging:
     """Test WebSocketClient send and receive methods."""
 
-    @pytest.mark.asyncio
     async def test_send_text(self):
         """send() sends text message."""
         client = WebSocketClient("wss://example.com/ws")
@@ -139,7 +133,6 @@ class TestWebSocketClientMessaging:
 
         mock_connection.send.assert_called_once_with("hello")
 
-    @pytest.mark.asyncio
     async def test_send_bytes(self):
         """send() sends binary message."""
         client = WebSocketClient("wss://example.com/ws")
@@ -150,7 +143,6 @@ class TestWebSocketClientMessaging:
 
         mock_connection.send.assert_called_once_with(b"binary data")
 
-    @pytest.mark.asyncio
     async def test_send_requires_connection(self):
         """send() raises when not connected."""
         client = WebSocketClient("wss://example.com/ws")
@@ -158,7 +150,6 @@ class TestWebSocketClientMessaging:
         with pytest.raises(WebSocketError, match="Not connected"):
             await client.send("hello")
 
-    @pytest.mark.asyncio
     async def test_send_json(self):
         """send_json() serializes and sends JSON."""
         client = WebSocketClient("wss://example.com/ws")
@@ -171,7 +162,6 @@ class TestWebSocketClientMessaging:
         sent_data = mock_connection.send.call_args[0][0]
         assert '"type": "message"' in sent_data or '"type":"message"' in sent_data
 
-    @pytest.mark.asyncio
     async def test_recv(self):
         """recv() receives message."""
         client = WebSocketClient("wss://example.com/ws")
@@ -183,7 +173,6 @@ class TestWebSocketClientMessaging:
 
         assert result == "hello"
 
-    @pytest.mark.asyncio
     async def test_recv_requires_connection(self):
         """recv() raises when not connected."""
         client = WebSocketClient("wss://example.com/ws")
@@ -191,7 +180,6 @@ class TestWebSocketClientMessaging:
         with pytest.raises(WebSocketError, match="Not connected"):
             await client.recv()
 
-    @pytest.mark.asyncio
     async def test_recv_json(self):
         """recv_json() receives and parses JSON."""
         client = WebSocketClient("wss://example.com/ws")
@@ -207,7 +195,6 @@ class TestWebSocketClientMessaging:
 class TestWebSocketClientContextManager:
     """Test WebSocketClient async context manager."""
 
-    @pytest.mark.asyncio
     async def test_context_manager_connects_and_closes(self):
         """Context manager calls connect and close."""
         mock_connection = MagicMock()
@@ -223,7 +210,6 @@ class TestWebSocketClientContextManager:
             # Should have closed
             assert client._closed is True
 
-    @pytest.mark.asyncio
     async def test_context_manager_closes_on_exception(self):
         """Context manager closes on exception."""
         mock_connection = MagicMock()
@@ -253,7 +239,6 @@ class TestWebSocketClientIterator:
         assert hasattr(client, "__aiter__")
         # The __aiter__ returns an async generator
 
-    @pytest.mark.asyncio
     async def test_iterator_requires_connection(self):
         """Iterator raises when not connected."""
         client = WebSocketClient("wss://example.com/ws")
@@ -263,7 +248,6 @@ class TestWebSocketClientIterator:
             async for msg in client:
                 pass
 
-    @pytest.mark.asyncio
     async def test_iterator_yields_messages(self):
         """Iterator yields received messages."""
 
@@ -35,7 +35,6 @@ class TestConnectionManagerInit:
 class TestConnectionManagerConnect:
     """Test ConnectionManager connect behavior."""
 
-    @pytest.mark.asyncio
     async def test_connect_registers_user(self):
         """connect() registers user and websocket."""
         manager = ConnectionManager()
@@ -47,7 +46,6 @@ class TestConnectionManagerConnect:
         assert "user1" in manager.active_users
         assert connection_id is not None
 
-    @pytest.mark.asyncio
     async def test_connect_accepts_websocket(self):
         """connect() calls websocket.accept()."""
         manager = ConnectionManager()
@@ -57,7 +55,6 @@ class TestConnectionManagerConnect:
 
         ws.accept.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_connect_without_accept(self):
         """connect() can skip accept()."""
         manager = ConnectionManager()
@@ -67,7 +64,6 @@ class TestConnectionManagerConnect:
 
         ws.accept.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_connect_multiple_users(self):
         """connect() handles multiple users."""
         manager = ConnectionManager()
@@ -80,7 +76,6 @@ class TestConnectionManagerConnect:
         assert manager.connection_count == 2
         assert set(manager.active_users) == {"user1", "user2"}
 
-    @pytest.mark.asyncio
     async def test_connect_same_user_multiple_times(self):
         """Same user can have multiple connections."""
         manager = ConnectionManager()
@@ -94,7 +89,6 @@ class TestConnectionManagerConnect:
         connections = manager.get_user_connections("user1")
         assert len(connections) == 2
 
-    @pytest.mark.asyncio
     async def test_connect_with_metadata(self):
         """connect() stores metadata."""
         manager = ConnectionManager()
@@ -106,7 +100,6 @@ class TestConnectionManagerConnect:
         assert len(connections) == 1
         assert connections[0].metadata == {"device": "mobile"}
 
-    @pytest.mark.asyncio
     async def test_connect_returns_unique_ids(self):
         """Each connection gets unique ID."""
         manager = ConnectionManager()
@@ -122,7 +115,6 @@ class TestConnectionManagerConnect:
 class TestConnectionManagerDisconnect:
     """Test ConnectionManager disconnect behavior."""
 
-    @pytest.mark.asyncio
     async def test_disconnect_removes_connection(self):
         """disconnect() removes specific connection."""
         manager = ConnectionManager()
@@ -134,7 +126,6 @@ class TestConnectionManagerDisconnect:
         assert manager.connection_count == 0
         assert "user1" not in manager.active_users
 
-    @pytest.mark.asyncio
     async def test_disconnect_keeps_other_connections(self):
         """disconnect() only removes specified connection."""
         manager = ConnectionManager()
@@ -149,7 +140,6 @@ class TestConnectionManagerDisconnect:
         connections = manager.get_user_connections("user1")
         assert len(connections) == 1
 
-    @pytest.mark.asyncio
     async def test_disconnect_all_for_user(self):
         """disconnect() without websocket removes all connections."""
         manager = ConnectionManager()
@@ -167,7 +157,6 @@ class TestConnectionManagerDisconnect:
 class TestConnectionManagerSendToUser:
     """Test ConnectionManager send_to_user behavior."""
 
-    @pytest.mark.asyncio
     async def test_send_to_user_sends_json(self):
         """send_to_user() sends JSON message."""
         manager = ConnectionManager()
@@ -179,7 +168,6 @@ class TestConnectionManagerSendToUser:
         assert sent == 1
         ws.send_json.assert_called_once_with({"msg": "hello"})
 
-    @pytest.mark.asyncio
     async def test_send_to_user_sends_text(self):
         """send_to_user() sends text message."""
         manager = ConnectionManager()
@@ -191,7 +179,6 @@ class TestConnectionManagerSendToUser:
         assert sent == 1
         ws.send_text.assert_called_once_with("hello")
 
-    @pytest.mark.asyncio
     async def test_send_to_user_sends_bytes(self):
         """send_to_user() sends binary message."""
         manager = ConnectionManager()
@@ -203,7 +190,6 @@ class TestConnectionManagerSendToUser:
         assert sent == 1
         ws.send_bytes.assert_called_once_with(b"binary")
 
-    @pytest.mark.asyncio
     async def test_send_to_user_sends_to_all_connections(self):
         """send_to_user() sends to all user connections."""
         manager = ConnectionManager()
@@ -218,7 +204,6 @@ class TestConnectionManagerSendToUser:
         ws1.send_json.assert_called_once()
         ws2.send_json.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_send_to_user_handles_unknown_user(self):
         """send_to_user() returns 0 for unknown user."""
         manager = ConnectionManager()
@@ -231,7 +216,6 @@ class TestConnectionManagerSendToUser:
 class TestConnectionManagerBroadcast:
     """Test ConnectionManager broadcast behavior."""
 
-    @pytest.mark.asyncio
     async def test_broadcast_sends_to_all(self):
         """broadcast() sends to all connected users."""
         manager = ConnectionManager()
@@ -246,7 +230,6 @@ class TestConnectionManagerBroadcast:
         ws1.send_json.assert_called_once()
         ws2.send_json.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_broadcast_with_exclude(self):
         """broadcast() can exclude specific user."""
         manager = ConnectionManager()
@@ -261,7 +244,6 @@ class TestConnectionManagerBroadcast:
         ws1.send_json.assert_not_called()
         ws2.send_json.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_broadcast_empty(self):
         """broadcast() with no connections returns 0."""
         manager = ConnectionManager()
@@ -274,7 +256,6 @@ class TestConnectionManagerBroadcast:
 class TestConnectionManagerRooms:
     """Test ConnectionManager room/group support."""
 
-    @pytest.mark.asyncio
     async def test_join_room(self):
         """join_room() adds user to room."""
         manager = ConnectionManager()
@@ -286,7 +267,6 @@ class TestConnectionManagerRooms:
         members = manager.get_room_users("general")
         assert "user1" in members
 
-    @pytest.mark.asyncio
     async def test_leave_room(self):
         """leave_room() removes user from room."""
         manager = ConnectionManager()
@@ -299,7 +279,6 @@ class TestConnectionManagerRooms:
         members = manager.get_room_users("general")
         assert "user1" not in members
 
-    @pytest.mark.asyncio
     async def test_broadcast_to_room(self):
         """broadcast_to_room() sends to room members only."""
         manager = ConnectionManager()
@@ -322,7 +301,6 @@ class TestConnectionManagerRooms:
         ws2.send_json.assert_called_once()
         ws3.send_json.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_broadcast_to_room_with_exclude(self):
         """broadcast_to_room() can exclude user."""
         manager = ConnectionManager()
@@ -340,7 +318,6 @@ class TestConnectionManagerRooms:
         ws1.send_json.assert_not_called()
         ws2.send_json.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_disconnect_removes_from_rooms(self):
         """disconnect() removes user from all rooms."""
         manager = ConnectionManager()
@@ -358,7 +335,6 @@ class TestConnectionManagerRooms:
 class TestConnectionManagerQueries:
     """Test ConnectionManager introspection."""
 
-    @pytest.mark.asyncio
     async def test_connection_count(self):
         """connection_count returns total connections."""
         manager = ConnectionManager()
@@ -373,7 +349,6 @@ class TestConnectionManagerQueries:
         await manager.connect("user2", ws2)
         assert manager.connection_count == 2
 
-    @pytest.mark.asyncio
     async def test_active_users(self):
         """active_users returns connected user IDs."""
         manager = ConnectionManager()
@@ -386,7 +361,6 @@ class TestConnectionManagerQueries:
         users = manager.active_users
         assert set(users) == {"user1", "user2"}
 
-    @pytest.mark.asyncio
     async def test_get_user_connections(self):
         """get_user_connections returns ConnectionInfo list."""
         manager = ConnectionManager()
@@ -401,7 +375,6 @@ class TestConnectionManagerQueries:
         assert all(isinstance(c, ConnectionInfo) for c in connections)
         assert {c.metadata["device"] for c in connections} == {"desktop", "mobile"}
 
-    @pytest.mark.asyncio
     async def test_is_user_connected(self):
         """is_user_connected checks connection status."""
         manager = ConnectionManager()
@@ -415,7 +388,6 @@ class TestConnectionManagerQueries:
         await manager.disconnect("user1", ws)
         assert manager.is_user_connected("user1") is False
 
-    @pytest.mark.asyncio
     async def test_room_count(self):
         """room_count returns number of active rooms."""
         manager = ConnectionManager()
@@ -434,7 +406,6 @@ class TestConnectionManagerQueries:
 class TestConnectionManagerHooks:
     """Test ConnectionManager lifecycle hooks."""
 
-    @pytest.mark.asyncio
     async def test_on_connect_hook(self):
         """on_connect hook is called on connect."""
         manager = ConnectionManager()
@@ -450,7 +421,6 @@ class TestConnectionManagerHooks:
         assert len(hook_called) == 1
         assert hook_called[0] == ("user1", ws)
 
-    @pytest.mark.asyncio
     async def test_on_disconnect_hook(self):
         """on_disconnect hook is called on disconnect."""
         manager = ConnectionManager()
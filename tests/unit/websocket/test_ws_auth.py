@@ -203,7 +203,6 @@ class TestJWTDecoding:
 class TestResolveWSBearerPrincipal:
     """Test resolve_ws_bearer_principal() function."""
 
-    @pytest.mark.asyncio
     async def test_resolve_returns_principal(self):
         """Returns WSPrincipal for valid token."""
         import os
@@ -234,7 +233,6 @@ class TestResolveWSBearerPrincipal:
         assert principal.email == "test@example.com"
         assert principal.scopes == ["read", "write"]
 
-    @pytest.mark.asyncio
     async def test_resolve_returns_none_without_token(self):
         """Returns None when no token present."""
         ws = MagicMock()
@@ -249,7 +247,6 @@ class TestResolveWSBearerPrincipal:
 class TestWSCurrentPrincipal:
     """Test _ws_current_principal() dependency."""
 
-    @pytest.mark.asyncio
     async def test_returns_principal_when_present(self):
         """Returns principal when authenticated."""
         ws = MagicMock()
@@ -259,7 +256,6 @@ class TestWSCurrentPrincipal:
 
         assert result == principal
 
-    @pytest.mark.asyncio
     async def test_raises_when_no_principal(self):
         """Raises WebSocketException when no principal."""
         from fastapi import WebSocketException
@@ -273,7 +269,6 @@ class TestWSCurrentPrincipal:
 class TestWSOptionalPrincipal:
     """Test _ws_optional_principal() dependency."""
 
-    @pytest.mark.asyncio
     async def test_returns_principal_when_present(self):
         """Returns principal when authenticated."""
         ws = MagicMock()
@@ -283,7 +278,6 @@ class TestWSOptionalPrincipal:
 
         assert result == principal
 
-    @pytest.mark.asyncio
     async def test_returns_none_when_no_principal(self):
         """Returns None when not authenticated."""
         ws = MagicMock()
@@ -296,7 +290,6 @@ class TestWSOptionalPrincipal:
 class TestRequireWSScopes:
     """Test RequireWSScopes guard."""
 
-    @pytest.mark.asyncio
     async def test_allows_with_required_scopes(self):
         """Allows when all required scopes present."""
 
@@ -311,7 +304,6 @@ class TestRequireWSScopes:
 
         assert result == principal
 
-    @pytest.mark.asyncio
     async def test_rejects_missing_scopes(self):
         """Rejects when required scopes missing."""
         from fastapi import WebSocketException
@@ -328,7 +320,6 @@ class TestRequireWSScopes:
 class TestRequireWSAnyScope:
     """Test RequireWSAnyScope guard."""
 
-    @pytest.mark.asyncio
     async def test_allows_with_any_required_scope(self):
         """Allows when any required scope present."""
         principal = WSPrincipal(id="user-123", scopes=["admin"])
@@ -340,7 +331,6 @@ class TestRequireWSAnyScope:
 
         assert result == principal
 
-    @pytest.mark.asyncio
     async def test_rejects_no_matching_scope(self):
         """Rejects when no required scopes present."""
         from fastapi import WebSocketException